@@ -18,6 +18,8 @@ from .live_request_queue import LiveRequestQueue
 from .llm_agent import Agent
 from .llm_agent import LlmAgent
 from .loop_agent import LoopAgent
+from .map_agent import MapAgent
+from .map_agent import MapReduceAgent
 from .parallel_agent import ParallelAgent
 from .run_config import RunConfig
 from .sequential_agent import SequentialAgent
@@ -27,6 +29,8 @@ __all__ = [
     'BaseAgent',
     'LlmAgent',
     'LoopAgent',
+    'MapAgent',
+    'MapReduceAgent',
     'ParallelAgent',
     'SequentialAgent',
 ]
@@ -0,0 +1,135 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Iterable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .base_agent import BaseAgent
+
+
+class SubAgentList(list):
+  """The sub-agents of an agent, which drop the tree index on any change.
+
+  Agents keep their sub-agents in this list, so that sub-agents added, removed
+  or replaced in place are indexed as well as a newly assigned list is.
+  """
+
+  def __init__(self, owner: BaseAgent, sub_agents: Iterable[BaseAgent] = ()):
+    super().__init__(sub_agents)
+    self._owner = owner
+
+  def __reduce__(self):
+    # Copies are plain lists, as the copy of the owner may not be complete
+    # yet. The index wraps them again once it is built for the copied tree.
+    return (list, (list(self),))
+
+  def _changed(self) -> None:
+    self._owner._drop_tree_index()
+
+
+def _notify_change(method_name: str):
+  method = getattr(list, method_name)
+
+  def wrapper(self, *args, **kwargs):
+    result = method(self, *args, **kwargs)
+    self._changed()
+    return result
+
+  wrapper.__name__ = method_name
+  return wrapper
+
+
+for _method_name in (
+    'append',
+    'extend',
+    'insert',
+    'remove',
+    'pop',
+    'clear',
+    'sort',
+    'reverse',
+    '__setitem__',
+    '__delitem__',
+    '__iadd__',
+    '__imul__',
+):
+  setattr(SubAgentList, _method_name, _notify_change(_method_name))
+
+
+class AgentTreeIndex:
+  """An index of the agents of an agent tree, cached on its root agent.
+
+  The root agent drops its index whenever an agent of the tree is assigned a
+  new name, description or parent, or its sub-agents change, and builds a new
+  one on the next lookup.
+  """
+
+  def __init__(self, root_agent: BaseAgent):
+    self.root_agent = root_agent
+    self.agents_by_name: dict[str, BaseAgent] = {}
+    """The agents of the tree by name, the first in depth-first order for
+    duplicate names."""
+    self.transfers: dict[
+        str, tuple[BaseAgent, list[BaseAgent], Optional[str]]
+    ] = {}
+    """The transfer targets and instruction of LLM agents by name, filled in
+    by the agent transfer flow as it needs them."""
+    self._duplicate_names: set[str] = set()
+    # The descendants of an agent are the agents right after it in
+    # depth-first order, as many as the size of its subtree.
+    self._positions: dict[int, int] = {}
+    self._subtree_sizes: dict[int, int] = {}
+
+    agents = []
+    stack = [root_agent]
+    while stack:
+      agent = stack.pop()
+      if (
+          not isinstance(agent.sub_agents, SubAgentList)
+          or agent.sub_agents._owner is not agent
+      ):
+        agent.sub_agents = agent.sub_agents
+      self._positions[id(agent)] = len(agents)
+      agents.append(agent)
+      if agent.name in self.agents_by_name:
+        self._duplicate_names.add(agent.name)
+      else:
+        self.agents_by_name[agent.name] = agent
+      stack.extend(reversed(agent.sub_agents))
+    for agent in reversed(agents):
+      self._subtree_sizes[id(agent)] = 1 + sum(
+          self._subtree_sizes[id(sub_agent)] for sub_agent in agent.sub_agents
+      )
+
+  def find_sub_agent(
+      self, ancestor: BaseAgent, name: str
+  ) -> Optional[BaseAgent]:
+    """Finds a descendant of the given agent by name."""
+    if name in self._duplicate_names:
+      return ancestor._search_sub_agents(name)
+    agent = self.agents_by_name.get(name)
+    if agent is None or id(ancestor) not in self._positions:
+      return None
+    start = self._positions[id(ancestor)]
+    if (
+        start
+        < self._positions[id(agent)]
+        < (start + self._subtree_sizes[id(ancestor)])
+    ):
+      return agent
+    return None
@@ -19,6 +19,7 @@ from typing import Any
 from typing import AsyncGenerator
 from typing import Awaitable
 from typing import Callable
+from typing import ClassVar
 from typing import final
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -30,10 +31,14 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
+from pydantic import PrivateAttr
 from typing_extensions import override
 from typing_extensions import TypeAlias
 
+from .. import metrics
 from ..events.event import Event
+from ._agent_tree_index import AgentTreeIndex
+from ._agent_tree_index import SubAgentList
 from .callback_context import CallbackContext
 
 if TYPE_CHECKING:
@@ -121,6 +126,40 @@ class BaseAgent(BaseModel):
       response and appended to event history as agent response.
   """
 
+  _tree_fields: ClassVar[frozenset[str]] = frozenset(
+      {'name', 'description', 'parent_agent', 'sub_agents'}
+  )
+  """The fields the agent tree index depends on."""
+
+  _tree_index: Optional[AgentTreeIndex] = PrivateAttr(default=None)
+  """The index of the agent tree, if this is its root agent."""
+
+  @override
+  def __setattr__(self, name: str, value: Any) -> None:
+    if name not in self._tree_fields:
+      super().__setattr__(name, value)
+      return
+    if name == 'sub_agents':
+      value = SubAgentList(self, value)
+    # Changing the parent also changes the root, so both trees are reindexed.
+    self._drop_tree_index()
+    super().__setattr__(name, value)
+    self._drop_tree_index()
+
+  def _drop_tree_index(self) -> None:
+    """Drops the index of the agent tree, which is rebuilt on next use."""
+    self.root_agent._tree_index = None
+
+  def _get_tree_index(self) -> AgentTreeIndex:
+    """Returns the index of the agent tree, building it if needed."""
+    root_agent = self.root_agent
+    # The index is copied along with copies of the root agent.
+    if root_agent._tree_index is None or (
+        root_agent._tree_index.root_agent is not root_agent
+    ):
+      root_agent._tree_index = AgentTreeIndex(root_agent)
+    return root_agent._tree_index
+
   @final
   async def run_async(
       self,
@@ -138,6 +177,10 @@ class BaseAgent(BaseModel):
 
     with tracer.start_as_current_span(f'agent_run [{self.name}]'):
       ctx = self._create_invocation_context(parent_context)
+      # A token limit ends the whole invocation, not only the agent that hit
+      # it.
+      if ctx.token_limit_exceeded:
+        return
 
       if event := await self.__handle_before_agent_callback(ctx):
         yield event
@@ -236,8 +279,14 @@ class BaseAgent(BaseModel):
     Returns:
       The agent with the matching name, or None if no such agent is found.
     """
+    return self._get_tree_index().find_sub_agent(self, name)
+
+  def _search_sub_agents(self, name: str) -> Optional[BaseAgent]:
+    """Searches this agent's descendants depth-first, bypassing the index."""
     for sub_agent in self.sub_agents:
-      if result := sub_agent.find_agent(name):
+      if sub_agent.name == name:
+        return sub_agent
+      if result := sub_agent._search_sub_agents(name):
         return result
     return None
 
@@ -245,7 +294,7 @@ class BaseAgent(BaseModel):
       self, parent_context: InvocationContext
   ) -> InvocationContext:
     """Creates a new invocation context for this agent."""
-    invocation_context = parent_context.model_copy(update={'agent': self})
+    invocation_context = parent_context.fork(agent=self)
     return invocation_context
 
   @property
@@ -287,22 +336,23 @@ class BaseAgent(BaseModel):
 
     callback_context = CallbackContext(ctx)
 
-    for callback in self.canonical_before_agent_callbacks:
-      before_agent_callback_content = callback(
-          callback_context=callback_context
-      )
-      if inspect.isawaitable(before_agent_callback_content):
-        before_agent_callback_content = await before_agent_callback_content
-      if before_agent_callback_content:
-        ret_event = Event(
-            invocation_id=ctx.invocation_id,
-            author=self.name,
-            branch=ctx.branch,
-            content=before_agent_callback_content,
-            actions=callback_context._event_actions,
+    with metrics.record_phase(metrics.PHASE_CALLBACK, 'before_agent'):
+      for callback in self.canonical_before_agent_callbacks:
+        before_agent_callback_content = callback(
+            callback_context=callback_context
         )
-        ctx.end_invocation = True
-        return ret_event
+        if inspect.isawaitable(before_agent_callback_content):
+          before_agent_callback_content = await before_agent_callback_content
+        if before_agent_callback_content:
+          ret_event = Event(
+              invocation_id=ctx.invocation_id,
+              author=self.name,
+              branch=ctx.branch,
+              content=before_agent_callback_content,
+              actions=callback_context._event_actions,
+          )
+          ctx.end_invocation = True
+          return ret_event
 
     if callback_context.state.has_delta():
       ret_event = Event(
@@ -329,19 +379,22 @@ class BaseAgent(BaseModel):
 
     callback_context = CallbackContext(invocation_context)
 
-    for callback in self.canonical_after_agent_callbacks:
-      after_agent_callback_content = callback(callback_context=callback_context)
-      if inspect.isawaitable(after_agent_callback_content):
-        after_agent_callback_content = await after_agent_callback_content
-      if after_agent_callback_content:
-        ret_event = Event(
-            invocation_id=invocation_context.invocation_id,
-            author=self.name,
-            branch=invocation_context.branch,
-            content=after_agent_callback_content,
-            actions=callback_context._event_actions,
+    with metrics.record_phase(metrics.PHASE_CALLBACK, 'after_agent'):
+      for callback in self.canonical_after_agent_callbacks:
+        after_agent_callback_content = callback(
+            callback_context=callback_context
         )
-        return ret_event
+        if inspect.isawaitable(after_agent_callback_content):
+          after_agent_callback_content = await after_agent_callback_content
+        if after_agent_callback_content:
+          ret_event = Event(
+              invocation_id=invocation_context.invocation_id,
+              author=self.name,
+              branch=invocation_context.branch,
+              content=after_agent_callback_content,
+              actions=callback_context._event_actions,
+          )
+          return ret_event
 
     if callback_context.state.has_delta():
       ret_event = Event(
@@ -356,6 +409,8 @@ class BaseAgent(BaseModel):
 
   @override
   def model_post_init(self, __context: Any) -> None:
+    # Keeps the sub-agents in a list that reports changes made in place.
+    self.sub_agents = self.sub_agents
     self.__set_parent_agent_for_sub_agents()
 
   @field_validator('name', mode='after')
@@ -61,6 +61,33 @@ class CallbackContext(ReadonlyContext):
     """
     return self._state
 
+  @property
+  def llm_call_count(self) -> int:
+    """The number of llm calls made so far in the current invocation."""
+    return self._invocation_context.llm_call_count
+
+  @property
+  def token_count(self) -> int:
+    """The number of prompt and candidate tokens used so far in the current
+    invocation."""
+    return self._invocation_context.token_count
+
+  @property
+  def session_token_count(self) -> int:
+    """The number of prompt and candidate tokens used so far in the current
+    session, including the current invocation."""
+    return self._invocation_context.session_token_count
+
+  @property
+  def remaining_tokens(self) -> Optional[int]:
+    """The number of tokens left before a token limit of the run config is
+    reached, or None if there is no limit.
+
+    Callbacks can use it to e.g. switch to a cheaper model or truncate the
+    history before the limit ends the invocation.
+    """
+    return self._invocation_context.remaining_tokens
+
   async def load_artifact(
       self, filename: str, version: Optional[int] = None
   ) -> Optional[types.Part]:
@@ -104,4 +131,5 @@ class CallbackContext(ReadonlyContext):
         artifact=artifact,
     )
     self._event_actions.artifact_delta[filename] = version
+    self._invocation_context.artifact_manifest.record_save(filename, version)
     return version
@@ -14,13 +14,16 @@
 
 from __future__ import annotations
 
+from typing import Any
 from typing import Optional
 import uuid
 
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import ConfigDict
+from pydantic import PrivateAttr
 
+from ..artifacts.artifact_manifest import ArtifactManifest
 from ..artifacts.base_artifact_service import BaseArtifactService
 from ..auth.credential_service.base_credential_service import BaseCredentialService
 from ..memory.base_memory_service import BaseMemoryService
@@ -37,6 +40,10 @@ class LlmCallsLimitExceededError(Exception):
   """Error thrown when the number of LLM calls exceed the limit."""
 
 
+TOKEN_LIMIT_EXCEEDED_ERROR_CODE = "TOKEN_LIMIT_EXCEEDED"
+"""The error code of the event that ends a run once a token limit is reached."""
+
+
 class _InvocationCostManager(BaseModel):
   """A container to keep track of the cost of invocation.
 
@@ -48,6 +55,36 @@ class _InvocationCostManager(BaseModel):
   _number_of_llm_calls: int = 0
   """A counter that keeps track of number of llm calls made."""
 
+  _number_of_prompt_tokens: int = 0
+  """The number of prompt tokens used by the llm calls made."""
+
+  _number_of_candidate_tokens: int = 0
+  """The number of candidate tokens used by the llm calls made."""
+
+  _number_of_session_tokens: Optional[int] = None
+  """The number of tokens used by the previous invocations of the session,
+  counted on first use."""
+
+  _token_limit_exceeded: bool = False
+  """Whether a token limit has stopped the invocation."""
+
+  @property
+  def number_of_llm_calls(self) -> int:
+    return self._number_of_llm_calls
+
+  @property
+  def number_of_tokens(self) -> int:
+    return self._number_of_prompt_tokens + self._number_of_candidate_tokens
+
+  def record_token_usage(
+      self, usage_metadata: types.GenerateContentResponseUsageMetadata
+  ):
+    """Adds the tokens used by an llm call."""
+    self._number_of_prompt_tokens += usage_metadata.prompt_token_count or 0
+    self._number_of_candidate_tokens += (
+        usage_metadata.candidates_token_count or 0
+    )
+
   def increment_and_enforce_llm_calls_limit(
       self, run_config: Optional[RunConfig]
   ):
@@ -158,6 +195,44 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _artifact_manifest: ArtifactManifest = PrivateAttr(
+      default_factory=ArtifactManifest
+  )
+  """Caches the artifacts of the session for the rest of this invocation."""
+
+  def fork(self, **overrides: Any) -> InvocationContext:
+    """Returns a shallow copy of this context with some fields replaced.
+
+    This is what `model_copy(update=overrides)` does, minus pydantic's copy
+    machinery, as agents fork the context for every agent run and branch.
+    Like with `model_copy`, the overrides are not validated, and the copy
+    shares the services, the session, the LLM call count and the artifact
+    cache of this context.
+
+    Args:
+      **overrides: The fields to replace, e.g. `agent` or `branch`.
+
+    Returns:
+      The forked context.
+    """
+    forked = type(self).__new__(type(self))
+    fields = self.__dict__.copy()
+    fields.update(overrides)
+    object.__setattr__(forked, "__dict__", fields)
+    object.__setattr__(
+        forked,
+        "__pydantic_fields_set__",
+        self.__pydantic_fields_set__.union(overrides),
+    )
+    object.__setattr__(forked, "__pydantic_extra__", None)
+    private = self.__pydantic_private__
+    object.__setattr__(
+        forked,
+        "__pydantic_private__",
+        None if private is None else private.copy(),
+    )
+    return forked
+
   def increment_llm_call_count(
       self,
   ):
@@ -171,6 +246,105 @@ class InvocationContext(BaseModel):
         self.run_config
     )
 
+  def record_token_usage(
+      self, usage_metadata: types.GenerateContentResponseUsageMetadata
+  ):
+    """Tracks the tokens used by an llm call.
+
+    Args:
+      usage_metadata: The usage metadata of the llm call's last response,
+        which covers the whole call.
+    """
+    self._invocation_cost_manager.record_token_usage(usage_metadata)
+
+  @property
+  def llm_call_count(self) -> int:
+    """The number of llm calls made so far in this invocation."""
+    return self._invocation_cost_manager.number_of_llm_calls
+
+  @property
+  def token_count(self) -> int:
+    """The number of prompt and candidate tokens used so far in this
+    invocation."""
+    return self._invocation_cost_manager.number_of_tokens
+
+  @property
+  def session_token_count(self) -> int:
+    """The number of prompt and candidate tokens used so far in this session,
+    including this invocation."""
+    cost_manager = self._invocation_cost_manager
+    if cost_manager._number_of_session_tokens is None:
+      # A streamed llm call may store several events, e.g. the aggregated text
+      # and a function call, that all report the usage of the call so far.
+      # They are built from the same model response event and so share its
+      # timestamp, and only the last one of each call counts.
+      tokens_per_llm_call = {}
+      for event in self.session.events:
+        if not event.usage_metadata or event.partial:
+          continue
+        if event.invocation_id == self.invocation_id:
+          continue
+        llm_call = (
+            event.invocation_id,
+            event.branch,
+            event.author,
+            event.timestamp,
+        )
+        tokens_per_llm_call[llm_call] = (
+            event.usage_metadata.prompt_token_count or 0
+        ) + (event.usage_metadata.candidates_token_count or 0)
+      cost_manager._number_of_session_tokens = sum(tokens_per_llm_call.values())
+    return cost_manager._number_of_session_tokens + self.token_count
+
+  @property
+  def remaining_tokens(self) -> Optional[int]:
+    """The number of tokens left before a token limit of the run config is
+    reached, or None if there is no limit."""
+    remaining = []
+    if self.run_config and self.run_config.max_tokens > 0:
+      remaining.append(self.run_config.max_tokens - self.token_count)
+    if self.run_config and self.run_config.max_session_tokens > 0:
+      remaining.append(
+          self.run_config.max_session_tokens - self.session_token_count
+      )
+    return max(min(remaining), 0) if remaining else None
+
+  @property
+  def token_limit_exceeded(self) -> bool:
+    """Whether a token limit has stopped the invocation.
+
+    Once set, no agent of the invocation runs any more.
+    """
+    return self._invocation_cost_manager._token_limit_exceeded
+
+  def enforce_token_limits(self) -> Optional[str]:
+    """Checks the token limits of the run config before an llm call.
+
+    Returns:
+      None if the llm call may be made, otherwise the reason why not, in
+      which case the invocation is stopped.
+    """
+    if self.remaining_tokens != 0:
+      return None
+    self._invocation_cost_manager._token_limit_exceeded = True
+    self.end_invocation = True
+    if self.run_config.max_tokens > 0 and (
+        self.token_count >= self.run_config.max_tokens
+    ):
+      return (
+          f"Max number of tokens limit of `{self.run_config.max_tokens}`"
+          " reached"
+      )
+    return (
+        "Max number of session tokens limit of"
+        f" `{self.run_config.max_session_tokens}` reached"
+    )
+
+  @property
+  def artifact_manifest(self) -> ArtifactManifest:
+    """The cache of the session's artifacts, shared by this invocation."""
+    return self._artifact_manifest
+
   @property
   def app_name(self) -> str:
     return self.session.app_name
@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from enum import Enum
+from typing import Any
 from typing import AsyncGenerator
+from typing import Optional
 from typing import Union
 
 from google.genai import types
 from langchain_core.messages import AIMessage
+from langchain_core.messages import BaseMessage
 from langchain_core.messages import HumanMessage
 from langchain_core.messages import SystemMessage
 from langchain_core.runnables.config import RunnableConfig
@@ -29,6 +34,41 @@ from .base_agent import BaseAgent
 from .invocation_context import InvocationContext
 
 
+class LangGraphExecutionMode(Enum):
+  """How a LangGraphAgent runs its graph."""
+
+  SYNC = 'sync'
+  """Runs the graph with `invoke`, blocking the event loop until it is done."""
+
+  THREAD = 'thread'
+  """Runs the graph with `invoke` in a thread pool.
+
+  For graphs that only support sync execution, e.g. because of a sync-only
+  checkpointer.
+  """
+
+  ASYNC = 'async'
+  """Runs the graph with `ainvoke`."""
+
+  STREAM = 'stream'
+  """Runs the graph with `astream`, yielding the messages added by each node
+  as partial events before the final response.
+
+  The messages of a node are yielded once the next node has run, so that the
+  final message is only yielded once, as the final response.
+  """
+
+
+def _get_text(message: BaseMessage) -> str:
+  """Returns the text content of a LangChain message."""
+  if isinstance(message.content, str):
+    return message.content
+  return ''.join(
+      block if isinstance(block, str) else block.get('text', '')
+      for block in message.content
+  )
+
+
 def _get_last_human_messages(events: list[Event]) -> list[HumanMessage]:
   """Extracts last human messages from given list of events.
 
@@ -59,6 +99,13 @@ class LangGraphAgent(BaseAgent):
 
   instruction: str = ''
 
+  execution_mode: LangGraphExecutionMode = LangGraphExecutionMode.SYNC
+  """How the graph is run.
+
+  The default blocks the event loop for the whole graph run; the other modes
+  keep it free, and STREAM also yields the outputs of intermediate nodes.
+  """
+
   @override
   async def _run_async_impl(
       self,
@@ -69,10 +116,10 @@ class LangGraphAgent(BaseAgent):
     config: RunnableConfig = {'configurable': {'thread_id': ctx.session.id}}
 
     # Add instruction as SystemMessage if graph state is empty
-    current_graph_state = self.graph.get_state(config)
+    current_graph_state = await self._get_graph_state(config)
     graph_messages = (
         current_graph_state.values.get('messages', [])
-        if current_graph_state.values
+        if current_graph_state and current_graph_state.values
         else []
     )
     messages = (
@@ -84,7 +131,37 @@ class LangGraphAgent(BaseAgent):
     messages += self._get_messages(ctx.session.events)
 
     # Use the Runnable
-    final_state = self.graph.invoke({'messages': messages}, config)
+    graph_input = {'messages': messages}
+    if self.execution_mode == LangGraphExecutionMode.STREAM:
+      final_state = None
+      node_events = []
+      async for stream_mode, chunk in self.graph.astream(
+          graph_input, config, stream_mode=['updates', 'values']
+      ):
+        if stream_mode == 'values':
+          final_state = chunk
+          continue
+        for event in node_events:
+          yield event
+        node_events = [
+            event
+            for node, update in chunk.items()
+            for event in self._create_node_events(ctx, node, update)
+        ]
+      # The last node added the final message, which is yielded below.
+      final_text = _get_text(final_state['messages'][-1])
+      if node_events and node_events[-1].content.parts[0].text == final_text:
+        node_events.pop()
+      for event in node_events:
+        yield event
+    elif self.execution_mode == LangGraphExecutionMode.ASYNC:
+      final_state = await self.graph.ainvoke(graph_input, config)
+    elif self.execution_mode == LangGraphExecutionMode.THREAD:
+      final_state = await asyncio.to_thread(
+          self.graph.invoke, graph_input, config
+      )
+    else:
+      final_state = self.graph.invoke(graph_input, config)
     result = final_state['messages'][-1].content
 
     result_event = Event(
@@ -98,6 +175,46 @@ class LangGraphAgent(BaseAgent):
     )
     yield result_event
 
+  async def _get_graph_state(self, config: RunnableConfig) -> Optional[Any]:
+    """Gets the state of the graph's thread, if the graph has a checkpointer."""
+    if not self.graph.checkpointer:
+      return None
+    if self.execution_mode == LangGraphExecutionMode.SYNC:
+      return self.graph.get_state(config)
+    if self.execution_mode == LangGraphExecutionMode.THREAD:
+      return await asyncio.to_thread(self.graph.get_state, config)
+    return await self.graph.aget_state(config)
+
+  def _create_node_events(
+      self, ctx: InvocationContext, node: str, update: Any
+  ) -> list[Event]:
+    """Creates partial events for the messages a node added to the state."""
+    if not isinstance(update, dict):
+      return []
+    messages = update.get('messages', [])
+    if not isinstance(messages, list):
+      messages = [messages]
+    events = []
+    for message in messages:
+      if not isinstance(message, BaseMessage) or not (
+          text := _get_text(message)
+      ):
+        continue
+      events.append(
+          Event(
+              invocation_id=ctx.invocation_id,
+              author=self.name,
+              branch=ctx.branch,
+              partial=True,
+              content=types.Content(
+                  role='model',
+                  parts=[types.Part.from_text(text=text)],
+              ),
+              custom_metadata={'langgraph_node': node},
+          )
+      )
+    return events
+
   def _get_messages(
       self, events: list[Event]
   ) -> list[Union[HumanMessage, AIMessage]]:
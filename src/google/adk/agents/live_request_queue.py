@@ -37,7 +37,17 @@ class LiveRequest(BaseModel):
 class LiveRequestQueue:
   """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
 
-  def __init__(self):
+  def __init__(self, maxsize: int = 0):
+    """Initializes the queue.
+
+    Args:
+      maxsize: The number of pending requests past which `full` reports the
+        queue as full. It is a hint for writers that may drop requests, such
+        as the ParallelAgent, which drops realtime blobs for a lagging branch.
+        The `send*` methods and `close` always enqueue, so that writers such
+        as the LLM flow never fail or wait. Zero means the queue is never
+        full.
+    """
     # Ensure there's an event loop available in this thread
     try:
       asyncio.get_running_loop()
@@ -48,8 +58,16 @@ class LiveRequestQueue:
 
     # Now create the queue (it will use the event loop we just ensured exists)
     self._queue = asyncio.Queue()
+    self._maxsize = maxsize
+    self._closed = False
+
+  @property
+  def closed(self) -> bool:
+    """Whether a close request has been sent."""
+    return self._closed
 
   def close(self):
+    self._closed = True
     self._queue.put_nowait(LiveRequest(close=True))
 
   def send_content(self, content: types.Content):
@@ -59,7 +77,17 @@ class LiveRequestQueue:
     self._queue.put_nowait(LiveRequest(blob=blob))
 
   def send(self, req: LiveRequest):
+    if req.close:
+      self._closed = True
     self._queue.put_nowait(req)
 
+  def full(self) -> bool:
+    """Whether the queue has reached its maximum size."""
+    return 0 < self._maxsize <= self._queue.qsize()
+
+  def empty(self) -> bool:
+    """Whether there are no pending requests."""
+    return self._queue.empty()
+
   async def get(self) -> LiveRequest:
     return await self._queue.get()
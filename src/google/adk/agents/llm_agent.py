@@ -20,6 +20,7 @@ from typing import Any
 from typing import AsyncGenerator
 from typing import Awaitable
 from typing import Callable
+from typing import ClassVar
 from typing import Literal
 from typing import Optional
 from typing import Union
@@ -160,6 +161,11 @@ class LlmAgent(BaseAgent):
   """Disallows LLM-controlled transferring to the peer agents."""
   # LLM-based agent transfer configs - End
 
+  _tree_fields: ClassVar[frozenset[str]] = BaseAgent._tree_fields | {
+      'disallow_transfer_to_parent',
+      'disallow_transfer_to_peers',
+  }
+
   include_contents: Literal['default', 'none'] = 'default'
   """Controls content inclusion in model requests.
 
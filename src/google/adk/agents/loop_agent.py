@@ -16,21 +16,33 @@
 
 from __future__ import annotations
 
+import copy
+import logging
+import time
+from typing import Any
 from typing import AsyncGenerator
 from typing import Optional
 
 from typing_extensions import override
 
+from .. import metrics
 from ..agents.invocation_context import InvocationContext
 from ..events.event import Event
 from .base_agent import BaseAgent
+from .sequential_agent import _add_task_completed_tool
+
+logger = logging.getLogger('google_adk.' + __name__)
 
 
 class LoopAgent(BaseAgent):
   """A shell agent that run its sub-agents in a loop.
 
   When sub-agent generates an event with escalate or max_iterations are
-  reached, the loop agent will stop.
+  reached, the loop agent will stop. The loop agent also stops between
+  iterations once any of its termination policies is met: the convergence of
+  convergence_keys, the max_llm_calls or max_tokens budget, or the
+  max_duration deadline. The duration of each iteration is recorded as a
+  `loop_iteration` phase metric.
   """
 
   max_iterations: Optional[int] = None
@@ -40,23 +52,193 @@ class LoopAgent(BaseAgent):
   escalates.
   """
 
+  convergence_keys: Optional[list[str]] = None
+  """The session state keys whose values decide convergence.
+
+  If set, the loop agent stops after an iteration that leaves the values of
+  all these keys unchanged, e.g. a draft that a critic no longer revises.
+  """
+
+  max_llm_calls: Optional[int] = None
+  """The maximum number of LLM calls the loop agent may make.
+
+  Once the iterations so far have made this many LLM calls, no new iteration
+  starts. The running iteration is not interrupted.
+  """
+
+  max_tokens: Optional[int] = None
+  """The maximum number of prompt and candidate tokens the loop agent may use.
+
+  Once the iterations so far have used this many tokens, no new iteration
+  starts. The running iteration is not interrupted.
+  """
+
+  max_duration: Optional[float] = None
+  """The maximum time, in seconds, to run the loop agent for.
+
+  Once this much time has passed since the loop agent started, no new
+  iteration starts. The running iteration is not interrupted.
+  """
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
+    termination = _LoopTermination(self, ctx)
     times_looped = 0
     while not self.max_iterations or times_looped < self.max_iterations:
-      for sub_agent in self.sub_agents:
-        async for event in sub_agent.run_async(ctx):
+      escalated = False
+      # Only the time spent running the sub-agents counts towards the
+      # iteration, not the time the caller holds on to their events.
+      iteration = metrics.record_phase_async_gen(
+          self._run_iteration_async(ctx),
+          metrics.PHASE_LOOP_ITERATION,
+          self.name,
+      )
+      try:
+        async for event in iteration:
           yield event
-          if event.actions.escalate:
-            return
+          escalated = escalated or bool(event.actions.escalate)
+      finally:
+        await iteration.aclose()
+      if escalated:
+        return
       times_looped += 1
+      if termination.should_stop(times_looped):
+        return
     return
 
+  async def _run_iteration_async(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    """Runs the sub-agents once, stopping after an escalating event."""
+    for sub_agent in self.sub_agents:
+      async for event in sub_agent.run_async(ctx):
+        yield event
+        if event.actions.escalate:
+          return
+
   @override
   async def _run_live_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
-    raise NotImplementedError('This is not supported yet for LoopAgent.')
-    yield  # AsyncGenerator requires having at least one yield statement
+    """Implementation for live LoopAgent.
+
+    As for the live SequentialAgent, an LlmAgent sub-agent signals that it is
+    done by calling the task_completed() function. The loop also stops once
+    the live request queue is closed and all its requests have been handled.
+
+    Args:
+      ctx: The invocation context of the agent.
+    """
+    for sub_agent in self.sub_agents:
+      _add_task_completed_tool(sub_agent)
+
+    termination = _LoopTermination(self, ctx)
+    times_looped = 0
+    while not self.max_iterations or times_looped < self.max_iterations:
+      escalated = False
+      iteration = metrics.record_phase_async_gen(
+          self._run_live_iteration(ctx),
+          metrics.PHASE_LOOP_ITERATION,
+          self.name,
+      )
+      try:
+        async for event in iteration:
+          yield event
+          escalated = escalated or bool(event.actions.escalate)
+      finally:
+        await iteration.aclose()
+      if escalated or _live_requests_handled(ctx):
+        return
+      times_looped += 1
+      if termination.should_stop(times_looped):
+        return
+    return
+
+  async def _run_live_iteration(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    """Runs the sub-agents once in live mode.
+
+    Stops after an escalating event, or once all live requests are handled.
+    """
+    for sub_agent in self.sub_agents:
+      async for event in sub_agent.run_live(ctx):
+        yield event
+        if event.actions.escalate:
+          return
+      if _live_requests_handled(ctx):
+        return
+
+
+def _live_requests_handled(ctx: InvocationContext) -> bool:
+  """Whether the live request queue is closed and all its requests handled."""
+  return bool(
+      ctx.live_request_queue
+      and ctx.live_request_queue.closed
+      and ctx.live_request_queue.empty()
+  )
+
+
+class _LoopTermination:
+  """Evaluates the termination policies of a loop agent between iterations.
+
+  The policies only read what the invocation already tracks, so checking
+  them costs no extra LLM call.
+  """
+
+  def __init__(self, agent: LoopAgent, ctx: InvocationContext):
+    self._agent = agent
+    self._ctx = ctx
+    self._start_time = time.monotonic()
+    self._start_llm_calls = ctx.llm_call_count
+    self._start_tokens = ctx.token_count
+    self._converged_values = self._get_converged_values()
+
+  def _get_converged_values(self) -> Optional[list[Any]]:
+    if not self._agent.convergence_keys:
+      return None
+    # Copies the values, as sub-agents may update them in place.
+    return copy.deepcopy(
+        [self._ctx.session.state.get(k) for k in self._agent.convergence_keys]
+    )
+
+  def _get_stop_reason(self) -> Optional[str]:
+    agent = self._agent
+    if self._ctx.token_limit_exceeded:
+      return 'reached a token limit of the run config'
+    if agent.convergence_keys:
+      values = self._get_converged_values()
+      if values == self._converged_values:
+        return 'converged'
+      self._converged_values = values
+    if (
+        agent.max_llm_calls is not None
+        and self._ctx.llm_call_count - self._start_llm_calls
+        >= agent.max_llm_calls
+    ):
+      return 'reached max_llm_calls'
+    if (
+        agent.max_tokens is not None
+        and self._ctx.token_count - self._start_tokens >= agent.max_tokens
+    ):
+      return 'reached max_tokens'
+    if (
+        agent.max_duration is not None
+        and time.monotonic() - self._start_time >= agent.max_duration
+    ):
+      return 'reached max_duration'
+    return None
+
+  def should_stop(self, times_looped: int) -> bool:
+    """Returns whether the loop should stop after the finished iterations."""
+    reason = self._get_stop_reason()
+    if reason:
+      logger.info(
+          'Loop agent %s stopped after %d iterations: %s.',
+          self._agent.name,
+          times_looped,
+          reason,
+      )
+    return reason is not None
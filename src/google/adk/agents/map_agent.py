@@ -0,0 +1,215 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Map and map-reduce agent implementations."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import inspect
+from typing import Any
+from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from pydantic import Field
+from pydantic import model_validator
+from typing_extensions import override
+
+from ..agents.invocation_context import InvocationContext
+from ..events.event import Event
+from ..events.event_actions import EventActions
+from .base_agent import BaseAgent
+from .parallel_agent import _get_branch_for_sub_agent
+from .parallel_agent import _merge_agent_run
+
+_OnOutput = Callable[[int, Optional[str]], Awaitable[None]]
+
+Reducer = Callable[[Any, Optional[str]], Union[Any, Awaitable[Any]]]
+
+
+class MapAgent(BaseAgent):
+  """A shell agent that runs its sub-agent once for every item of a list.
+
+  The list is read from the session state under `items_key`. Each run is on
+  an isolated branch, like the sub-agents of a ParallelAgent, and sees its
+  item in the state under `item_key`. The item is only visible to its own
+  run and is not written to the session.
+
+  The agent must have exactly one sub-agent.
+
+  Live mode is not supported: a live conversation is a single stream of
+  audio or video, which cannot be split into independent runs per item.
+  """
+
+  items_key: str
+  """The key in session state of the list of items to run the sub-agent on."""
+
+  item_key: str = 'item'
+  """The key in session state under which each run sees its item."""
+
+  output_key: Optional[str] = None
+  """If set, the final response of the run on the i-th item (or batch) is
+  stored in session state under `{output_key}_{i}`."""
+
+  max_concurrency: Optional[int] = Field(default=None, ge=1)
+  """The maximum number of items processed at once.
+
+  Runs are only created once there is room for them. If not set, all items
+  are processed at once.
+  """
+
+  batch_size: int = Field(default=1, ge=1)
+  """The number of items per run.
+
+  When greater than 1, each run sees a list of up to `batch_size` consecutive
+  items under `item_key`, and outputs are indexed by batch.
+  """
+
+  @model_validator(mode='after')
+  def __validate_sub_agents(self) -> MapAgent:
+    if len(self.sub_agents) != 1:
+      raise ValueError(
+          f'{type(self).__name__} `{self.name}` must have exactly one'
+          f' sub-agent, got {len(self.sub_agents)}.'
+      )
+    return self
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    async def ignore_output(index: int, output: Optional[str]) -> None:
+      pass
+
+    async for event in self._map(ctx, ignore_output):
+      yield event
+
+  def _get_batches(self, ctx: InvocationContext) -> list[Any]:
+    items = ctx.session.state.get(self.items_key, [])
+    if not isinstance(items, list):
+      raise ValueError(
+          f'State key `{self.items_key}` of {type(self).__name__}'
+          f' `{self.name}` must hold a list, got {type(items).__name__}.'
+      )
+    if self.batch_size == 1:
+      return items
+    return [
+        items[i : i + self.batch_size]
+        for i in range(0, len(items), self.batch_size)
+    ]
+
+  async def _map(
+      self, ctx: InvocationContext, on_output: _OnOutput
+  ) -> AsyncGenerator[Event, None]:
+    """Runs the sub-agent on every batch, calling on_output as each is done."""
+    batches = self._get_batches(ctx)
+    if not batches:
+      return
+    num_workers = min(self.max_concurrency or len(batches), len(batches))
+    # The workers share the iterator, each starting the next pending batch as
+    # soon as it is done with its previous one.
+    pending = iter(enumerate(batches))
+    merged_run = _merge_agent_run(
+        [self._run_batches(ctx, pending, on_output) for _ in range(num_workers)]
+    )
+    try:
+      async for event in merged_run:
+        yield event
+    finally:
+      # Cancels the runs right away if the map is closed early.
+      await merged_run.aclose()
+
+  async def _run_batches(
+      self,
+      ctx: InvocationContext,
+      pending: Iterator[tuple[int, Any]],
+      on_output: _OnOutput,
+  ) -> AsyncGenerator[Event, None]:
+    sub_agent = self.sub_agents[0]
+    for index, batch in pending:
+      output = None
+      batch_ctx = self._create_batch_ctx(ctx, index, batch)
+      async for event in sub_agent.run_async(batch_ctx):
+        if event.is_final_response() and event.content and event.content.parts:
+          output = ''.join(part.text or '' for part in event.content.parts)
+          if self.output_key:
+            event.actions.state_delta[f'{self.output_key}_{index}'] = output
+        if not event.partial:
+          # The runner only updates the state of the parent session, so the
+          # run's own writes are applied to its copy as well.
+          batch_ctx.session.state.update(event.actions.state_delta)
+        yield event
+      await on_output(index, output)
+
+  def _create_batch_ctx(
+      self, ctx: InvocationContext, index: int, batch: Any
+  ) -> InvocationContext:
+    branch = _get_branch_for_sub_agent(self, self.sub_agents[0], ctx)
+    # Each run gets its own copy of the state, so that its item and its writes
+    # are not seen by the other runs.
+    state = dict(ctx.session.state)
+    state[self.item_key] = batch
+    session = ctx.session.model_copy(update={'state': state})
+    return ctx.fork(branch=f'{branch}[{index}]', session=session)
+
+
+class MapReduceAgent(MapAgent):
+  """A MapAgent that also folds the outputs of its runs into a single value.
+
+  The reducer is called with the value so far, starting at `initial_value`,
+  and the final response of a run, as soon as that run is done, so outputs
+  need not be kept around until all runs are. It may be async. The result is
+  stored in session state under `reduce_output_key` once all runs are done.
+  """
+
+  reducer: Reducer
+  """Folds the output of a run into the value so far, returning the new one."""
+
+  initial_value: Any = None
+  """The value the reduction starts from."""
+
+  reduce_output_key: str
+  """The key in session state to store the reduced value."""
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    # The reducer may mutate the value, so every run starts from a fresh copy.
+    reduced = copy.deepcopy(self.initial_value)
+    # Async reducers must not interleave, or outputs would be lost.
+    lock = asyncio.Lock()
+
+    async def reduce_output(index: int, output: Optional[str]) -> None:
+      nonlocal reduced
+      async with lock:
+        result = self.reducer(reduced, output)
+        if inspect.isawaitable(result):
+          result = await result
+        reduced = result
+
+    async for event in self._map(ctx, reduce_output):
+      yield event
+
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=self.name,
+        branch=ctx.branch,
+        actions=EventActions(state_delta={self.reduce_output_key: reduced}),
+    )
@@ -17,13 +17,31 @@
 from __future__ import annotations
 
 import asyncio
+from enum import Enum
+import logging
 from typing import AsyncGenerator
+from typing import Optional
 
+from pydantic import Field
 from typing_extensions import override
 
 from ..agents.invocation_context import InvocationContext
 from ..events.event import Event
 from .base_agent import BaseAgent
+from .live_request_queue import LiveRequest
+from .live_request_queue import LiveRequestQueue
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+class ParallelMode(Enum):
+  """When a ParallelAgent finishes."""
+
+  ALL = "all"
+  """Once all sub-agents have finished."""
+
+  RACE = "race"
+  """Once the first sub-agent succeeds; the others are cancelled."""
 
 
 def _create_branch_ctx_for_sub_agent(
@@ -32,54 +50,195 @@ def _create_branch_ctx_for_sub_agent(
     invocation_context: InvocationContext,
 ) -> InvocationContext:
   """Create isolated branch for every sub-agent."""
-  invocation_context = invocation_context.model_copy()
+  return invocation_context.fork(
+      branch=_get_branch_for_sub_agent(agent, sub_agent, invocation_context)
+  )
+
+
+def _get_branch_for_sub_agent(
+    agent: BaseAgent,
+    sub_agent: BaseAgent,
+    invocation_context: InvocationContext,
+) -> str:
   branch_suffix = f"{agent.name}.{sub_agent.name}"
-  invocation_context.branch = (
+  return (
       f"{invocation_context.branch}.{branch_suffix}"
       if invocation_context.branch
       else branch_suffix
   )
-  return invocation_context
+
+
+async def _run_with_semaphore(
+    agent_run: AsyncGenerator[Event, None], semaphore: asyncio.Semaphore
+) -> AsyncGenerator[Event, None]:
+  """Runs an agent once the semaphore is acquired, holding it until done."""
+  async with semaphore:
+    try:
+      async for event in agent_run:
+        yield event
+    finally:
+      await agent_run.aclose()
 
 
 async def _merge_agent_run(
     agent_runs: list[AsyncGenerator[Event, None]],
+    *,
+    max_concurrency: Optional[int] = None,
+    race: bool = False,
+    fail_fast: bool = True,
 ) -> AsyncGenerator[Event, None]:
   """Merges the agent run event generator.
 
   This implementation guarantees for each agent, it won't move on until the
   generated event is processed by upstream runner.
 
+  Branches that are still running when the merge ends, e.g. because another
+  branch won the race or failed, are cancelled and closed.
+
   Args:
       agent_runs: A list of async generators that yield events from each agent.
+      max_concurrency: The maximum number of agents running at once. None
+        means no limit.
+      race: Whether to stop once the first agent finishes successfully.
+      fail_fast: Whether to stop once an agent raises. Otherwise, the other
+        agents keep running and the first error is raised once they are done,
+        or, when racing, only if none of them succeeds.
 
   Yields:
       Event: The next event from the merged generator.
   """
-  tasks = [
-      asyncio.create_task(events_for_one_agent.__anext__())
-      for events_for_one_agent in agent_runs
-  ]
-  pending_tasks = set(tasks)
-
-  while pending_tasks:
-    done, pending_tasks = await asyncio.wait(
-        pending_tasks, return_when=asyncio.FIRST_COMPLETED
-    )
-    for task in done:
-      try:
-        yield task.result()
+  if max_concurrency is not None:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    agent_runs = [
+        _run_with_semaphore(agent_run, semaphore) for agent_run in agent_runs
+    ]
+  task_to_index: dict[asyncio.Task[Event], int] = {
+      asyncio.create_task(agent_run.__anext__()): i
+      for i, agent_run in enumerate(agent_runs)
+  }
+  errors: list[BaseException] = []
+  last_index = -1
+
+  try:
+    while task_to_index:
+      done, _ = await asyncio.wait(
+          task_to_index, return_when=asyncio.FIRST_COMPLETED
+      )
+      # Serves the agents whose events are ready round-robin, so that no agent
+      # is starved by others that are always ready first.
+      for task in sorted(
+          done,
+          key=lambda t: (task_to_index[t] - last_index - 1) % len(agent_runs),
+      ):
+        i = last_index = task_to_index.pop(task)
+        try:
+          event = task.result()
+        except StopAsyncIteration:
+          if race:
+            for error in errors:
+              logger.warning(
+                  "A parallel agent run failed before another succeeded.",
+                  exc_info=error,
+              )
+            return
+          continue
+        except Exception as e:  # pylint: disable=broad-exception-caught
+          if fail_fast:
+            raise
+          errors.append(e)
+          continue
+        yield event
+        # Move the generator that produced this event on.
+        task_to_index[asyncio.create_task(agent_runs[i].__anext__())] = i
+    if errors:
+      raise errors[0]
+  finally:
+    await _cancel_agent_runs(task_to_index, agent_runs)
+
+
+async def _cancel_agent_runs(
+    task_to_index: dict[asyncio.Task[Event], int],
+    agent_runs: list[AsyncGenerator[Event, None]],
+) -> None:
+  """Cancels the pending steps of the agent runs and closes the runs."""
+  for task in task_to_index:
+    task.cancel()
+  if task_to_index:
+    await asyncio.wait(task_to_index)
+  for task in task_to_index:
+    # Marks the errors of abandoned steps as retrieved.
+    if not task.cancelled():
+      task.exception()
+  for agent_run in agent_runs:
+    try:
+      await agent_run.aclose()
+    except Exception:  # pylint: disable=broad-exception-caught
+      logger.exception("Error while closing a parallel agent run.")
+
+
+class _LiveRequestBroadcaster:
+  """Forwards the requests of a live request queue to one queue per branch.
+
+  Forwarding never waits on a branch, so a slow or finished branch does not
+  hold up the others. Realtime blobs are dropped for a branch whose queue
+  holds `max_pending` requests already, as a stale chunk of audio or video is
+  of no use to a live model, while content and close requests are always
+  forwarded. Branches that have finished are no longer forwarded to.
+  """
 
-        # Find the generator that produced this event and move it on.
-        for i, original_task in enumerate(tasks):
-          if task == original_task:
-            new_task = asyncio.create_task(agent_runs[i].__anext__())
-            tasks[i] = new_task
-            pending_tasks.add(new_task)
-            break  # stop iterating once found
+  def __init__(
+      self, source: LiveRequestQueue, num_branches: int, max_pending: int
+  ):
+    self._source = source
+    self._max_pending = max_pending
+    self.queues = [
+        LiveRequestQueue(maxsize=max_pending) for _ in range(num_branches)
+    ]
+    self._active_queues = list(self.queues)
+    self.dropped_blob_counts = [0] * num_branches
+    """The number of realtime blobs dropped for each branch."""
+
+  def remove(self, queue: LiveRequestQueue) -> None:
+    """Stops forwarding to the queue of a finished branch."""
+    if queue in self._active_queues:
+      self._active_queues.remove(queue)
 
-      except StopAsyncIteration:
-        continue
+  async def run(self) -> None:
+    while True:
+      live_request = await self._source.get()
+      for queue in self._active_queues:
+        self._forward(queue, live_request)
+      if live_request.close:
+        return
+
+  def _forward(self, queue: LiveRequestQueue, live_request: LiveRequest):
+    if live_request.blob and not live_request.content and queue.full():
+      branch = self.queues.index(queue)
+      self.dropped_blob_counts[branch] += 1
+      if self.dropped_blob_counts[branch] == 1:
+        logger.warning(
+            "Parallel branch %d lags behind the live stream; dropping its"
+            " realtime blobs while %d requests are pending.",
+            branch,
+            self._max_pending,
+        )
+      return
+    queue.send(live_request)
+
+
+async def _run_live_branch(
+    sub_agent: BaseAgent,
+    branch_ctx: InvocationContext,
+    broadcaster: Optional[_LiveRequestBroadcaster],
+) -> AsyncGenerator[Event, None]:
+  """Runs a sub-agent live, removing its queue from the broadcast once done."""
+  queue = branch_ctx.live_request_queue
+  try:
+    async for event in sub_agent.run_live(branch_ctx):
+      yield event
+  finally:
+    if broadcaster:
+      broadcaster.remove(queue)
 
 
 class ParallelAgent(BaseAgent):
@@ -92,6 +251,30 @@ class ParallelAgent(BaseAgent):
   - Generating multiple responses for review by a subsequent evaluation agent.
   """
 
+  max_concurrency: Optional[int] = Field(default=None, ge=1)
+  """The maximum number of sub-agents running at once.
+
+  The other sub-agents start, in order, as running ones finish. If not set,
+  all sub-agents start at once.
+  """
+
+  mode: ParallelMode = ParallelMode.ALL
+  """When the agent finishes: once all sub-agents have, or, when racing, once
+  the first one has, cancelling the others."""
+
+  fail_fast: bool = True
+  """Whether an error in a sub-agent cancels the others and is raised at once.
+
+  Otherwise, the other sub-agents keep running and the first error is raised
+  once they have finished, or, when racing, only if none of them succeeds.
+  """
+
+  max_pending_live_requests: int = Field(default=64, ge=1)
+  """The maximum number of live requests buffered per sub-agent in live mode.
+
+  Realtime blobs beyond this are dropped for the sub-agent that lags behind.
+  """
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
@@ -102,12 +285,61 @@ class ParallelAgent(BaseAgent):
         )
         for sub_agent in self.sub_agents
     ]
-    async for event in _merge_agent_run(agent_runs):
-      yield event
+    merged_run = _merge_agent_run(
+        agent_runs,
+        max_concurrency=self.max_concurrency,
+        race=self.mode == ParallelMode.RACE,
+        fail_fast=self.fail_fast,
+    )
+    try:
+      async for event in merged_run:
+        yield event
+    finally:
+      # Cancels the sub-agents right away if the run is closed early.
+      await merged_run.aclose()
 
   @override
   async def _run_live_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
-    raise NotImplementedError("This is not supported yet for ParallelAgent.")
-    yield  # AsyncGenerator requires having at least one yield statement
+    """Runs the sub-agents in parallel in live mode.
+
+    The live requests sent to the invocation are broadcast to every
+    sub-agent, each reading its own queue.
+    """
+    branch_ctxs = [
+        _create_branch_ctx_for_sub_agent(self, sub_agent, ctx)
+        for sub_agent in self.sub_agents
+    ]
+    broadcaster = None
+    broadcast_task = None
+    if ctx.live_request_queue:
+      broadcaster = _LiveRequestBroadcaster(
+          ctx.live_request_queue,
+          len(self.sub_agents),
+          self.max_pending_live_requests,
+      )
+      for branch_ctx, queue in zip(branch_ctxs, broadcaster.queues):
+        branch_ctx.live_request_queue = queue
+      broadcast_task = asyncio.create_task(broadcaster.run())
+
+    merged_run = _merge_agent_run(
+        [
+            _run_live_branch(sub_agent, branch_ctx, broadcaster)
+            for sub_agent, branch_ctx in zip(self.sub_agents, branch_ctxs)
+        ],
+        max_concurrency=self.max_concurrency,
+        race=self.mode == ParallelMode.RACE,
+        fail_fast=self.fail_fast,
+    )
+    try:
+      async for event in merged_run:
+        yield event
+    finally:
+      await merged_run.aclose()
+      if broadcast_task:
+        broadcast_task.cancel()
+        try:
+          await broadcast_task
+        except asyncio.CancelledError:
+          pass
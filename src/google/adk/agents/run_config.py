@@ -89,6 +89,25 @@ class RunConfig(BaseModel):
     - Less than or equal to 0: This allows for unbounded number of llm calls.
   """
 
+  max_tokens: int = 0
+  """
+  A limit on the total number of prompt and candidate tokens for a given run.
+
+  No new llm call starts, and a live session is closed, once the limit is
+  reached. Instead, the run ends with an event whose error code is
+  TOKEN_LIMIT_EXCEEDED. Less than or equal
+  to 0 allows for an unbounded number of tokens.
+  """
+
+  max_session_tokens: int = 0
+  """
+  A limit on the total number of prompt and candidate tokens for all the runs
+  of a session, as recorded in the usage metadata of its events.
+
+  Enforced the same way as max_tokens. Less than or equal to 0 allows for an
+  unbounded number of tokens.
+  """
+
   @field_validator('max_llm_calls', mode='after')
   @classmethod
   def validate_max_llm_calls(cls, value: int) -> int:
@@ -26,6 +26,31 @@ from .base_agent import BaseAgent
 from .llm_agent import LlmAgent
 
 
+def task_completed():
+  """
+  Signals that the model has successfully completed the user's question
+  or task.
+  """
+  return "Task completion signaled."
+
+
+def _add_task_completed_tool(agent: BaseAgent) -> None:
+  """Lets a live LlmAgent signal that it is done, so the next agent can run."""
+  if not isinstance(agent, LlmAgent):
+    return
+  # Use function name to dedupe.
+  if any(
+      getattr(tool, "__name__", None) == task_completed.__name__
+      for tool in agent.tools
+  ):
+    return
+  agent.tools.append(task_completed)
+  agent.instruction += f"""If you finished the user's request
+          according to its description, call the {task_completed.__name__} function
+          to exit so the next agents can take over. When calling this function,
+          do not generate any text other than the function call."""
+
+
 class SequentialAgent(BaseAgent):
   """A shell agent that runs its sub-agents in sequence."""
 
@@ -54,22 +79,7 @@ class SequentialAgent(BaseAgent):
     """
     # There is no way to know if it's using live during init phase so we have to init it here
     for sub_agent in self.sub_agents:
-      # add tool
-      def task_completed():
-        """
-        Signals that the model has successfully completed the user's question
-        or task.
-        """
-        return "Task completion signaled."
-
-      if isinstance(sub_agent, LlmAgent):
-        # Use function name to dedupe.
-        if task_completed.__name__ not in sub_agent.tools:
-          sub_agent.tools.append(task_completed)
-          sub_agent.instruction += f"""If you finished the user's request
-          according to its description, call the {task_completed.__name__} function
-          to exit so the next agents can take over. When calling this function,
-          do not generate any text other than the function call."""
+      _add_task_completed_tool(sub_agent)
 
     for sub_agent in self.sub_agents:
       async for event in sub_agent.run_live(ctx):
@@ -13,11 +13,15 @@
 # limitations under the License.
 
 from .base_artifact_service import BaseArtifactService
+from .content_addressed_artifact_service import ContentAddressedArtifactService
+from .file_artifact_service import FileArtifactService
 from .gcs_artifact_service import GcsArtifactService
 from .in_memory_artifact_service import InMemoryArtifactService
 
 __all__ = [
     'BaseArtifactService',
+    'ContentAddressedArtifactService',
+    'FileArtifactService',
     'GcsArtifactService',
     'InMemoryArtifactService',
 ]
@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A per-invocation cache of the artifacts of the current session."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from google.genai import types
+
+if TYPE_CHECKING:
+  from ..agents.invocation_context import InvocationContext
+  from ..sessions.session import Session
+
+
+class ArtifactManifest:
+  """Caches the artifact keys and loaded artifacts of an invocation's session.
+
+  Agents may list and load the same artifacts on every LLM step, which is a
+  round trip to the artifact service each time. The manifest keeps the result
+  for the rest of the invocation, and stays up to date by:
+
+  * Recording artifacts saved through the callback and tool contexts.
+  * Applying the `artifact_delta` of events appended to the session since the
+    last access, e.g. by code execution.
+
+  Artifacts saved to the artifact service directly, bypassing both, are not
+  seen until the next invocation.
+  """
+
+  def __init__(self):
+    self._keys: Optional[set[str]] = None
+    self._artifacts: dict[tuple[str, Optional[int]], types.Part] = {}
+    """Keys are (filename, version), with version None for the latest."""
+    self._session: Optional[Session] = None
+    self._num_events_seen = 0
+
+  def record_save(self, filename: str, version: int) -> None:
+    """Records that a new version of an artifact was saved."""
+    if self._keys is not None:
+      self._keys.add(filename)
+    self._artifacts.pop((filename, None), None)
+
+  def _sync_with_session(self, invocation_context: InvocationContext) -> None:
+    session = invocation_context.session
+    if session is not self._session or len(session.events) < (
+        self._num_events_seen
+    ):
+      self._keys = None
+      self._artifacts.clear()
+      self._session = session
+      self._num_events_seen = 0
+    for event in session.events[self._num_events_seen :]:
+      for filename, version in event.actions.artifact_delta.items():
+        self.record_save(filename, version)
+    self._num_events_seen = len(session.events)
+
+  async def list_artifact_keys(
+      self, invocation_context: InvocationContext
+  ) -> list[str]:
+    """Lists the filenames of the artifacts of the current session."""
+    if invocation_context.artifact_service is None:
+      raise ValueError('Artifact service is not initialized.')
+    self._sync_with_session(invocation_context)
+    if self._keys is None:
+      self._keys = set(
+          await invocation_context.artifact_service.list_artifact_keys(
+              app_name=invocation_context.app_name,
+              user_id=invocation_context.user_id,
+              session_id=invocation_context.session.id,
+          )
+      )
+    return sorted(self._keys)
+
+  async def load_artifact(
+      self,
+      invocation_context: InvocationContext,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    """Loads an artifact of the current session, through the cache."""
+    if invocation_context.artifact_service is None:
+      raise ValueError('Artifact service is not initialized.')
+    self._sync_with_session(invocation_context)
+    key = (filename, version)
+    if key in self._artifacts:
+      return self._artifacts[key]
+    kwargs = {} if version is None else {'version': version}
+    artifact = await invocation_context.artifact_service.load_artifact(
+        app_name=invocation_context.app_name,
+        user_id=invocation_context.user_id,
+        session_id=invocation_context.session.id,
+        filename=filename,
+        **kwargs,
+    )
+    if artifact is not None:
+      self._artifacts[key] = artifact
+    return artifact
+
+  async def load_artifacts(
+      self, invocation_context: InvocationContext, filenames: list[str]
+  ) -> list[Optional[types.Part]]:
+    """Loads the latest versions of several artifacts concurrently."""
+    return await asyncio.gather(*[
+        self.load_artifact(invocation_context, filename)
+        for filename in filenames
+    ])
@@ -0,0 +1,549 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service that stores each distinct content only once."""
+
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Callable
+from typing import Optional
+import weakref
+
+from google.api_core import exceptions
+from google.cloud import storage
+from google.genai import types
+from typing_extensions import override
+
+from ..utils._local_paths import join_under_root
+from ._namespaces import file_has_user_namespace
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_BLOBS_PREFIX = "blobs/"
+_REFCOUNTS_PREFIX = "refcounts/"
+_REFS_PREFIX = "refs/"
+_MAX_UPDATE_ATTEMPTS = 10
+
+
+class BlobStore(ABC):
+  """A flat store of named byte strings used by the content-addressed service.
+
+  Names are `/`-separated paths. Prefixes passed to `list_names` always end
+  with `/`.
+  """
+
+  @abstractmethod
+  async def read(self, name: str) -> Optional[bytes]:
+    """Returns the data stored under the name, or None if there is none."""
+
+  @abstractmethod
+  async def write(self, name: str, data: bytes) -> None:
+    """Stores the data under the name, replacing any previous data."""
+
+  @abstractmethod
+  async def exists(self, name: str) -> bool:
+    """Returns whether data is stored under the name."""
+
+  @abstractmethod
+  async def delete(self, name: str) -> None:
+    """Deletes the data stored under the name, if any."""
+
+  @abstractmethod
+  async def list_names(self, prefix: str) -> list[str]:
+    """Lists the names starting with the prefix."""
+
+  async def update(
+      self,
+      name: str,
+      update_fn: Callable[[Optional[bytes]], Optional[bytes]],
+  ) -> Optional[bytes]:
+    """Replaces the data stored under the name with `update_fn` of it.
+
+    `update_fn` gets the current data, or None if there is none, and returns
+    the new data, or None to delete it. Stores that retry conflicting updates
+    may call it several times.
+
+    The default implementation reads and then writes, which is only safe if a
+    single process writes to the store. Stores shared by several processes
+    override it with an atomic update.
+
+    Returns:
+        The new data.
+    """
+    data = update_fn(await self.read(name))
+    if data is None:
+      await self.delete(name)
+    else:
+      await self.write(name, data)
+    return data
+
+
+class InMemoryBlobStore(BlobStore):
+  """A blob store that keeps everything in a dict."""
+
+  def __init__(self):
+    self.blobs: dict[str, bytes] = {}
+
+  @override
+  async def read(self, name: str) -> Optional[bytes]:
+    return self.blobs.get(name)
+
+  @override
+  async def write(self, name: str, data: bytes) -> None:
+    self.blobs[name] = data
+
+  @override
+  async def exists(self, name: str) -> bool:
+    return name in self.blobs
+
+  @override
+  async def delete(self, name: str) -> None:
+    self.blobs.pop(name, None)
+
+  @override
+  async def list_names(self, prefix: str) -> list[str]:
+    return [name for name in self.blobs if name.startswith(prefix)]
+
+
+class LocalBlobStore(BlobStore):
+  """A blob store backed by files under a root directory.
+
+  Writes go to a temporary file that is then renamed, so readers never see
+  partially written data. Names with empty, "." or ".." components, or that
+  would resolve outside the root directory, are rejected with a ValueError.
+  """
+
+  def __init__(self, root_dir: str):
+    self.root_dir = root_dir
+
+  def _path(self, name: str) -> str:
+    return join_under_root(self.root_dir, *name.split("/"))
+
+  def _read(self, name: str) -> Optional[bytes]:
+    try:
+      with open(self._path(name), "rb") as f:
+        return f.read()
+    except FileNotFoundError:
+      return None
+
+  def _write(self, name: str, data: bytes) -> None:
+    path = self._path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+      os.replace(tmp_path, path)
+    except BaseException:
+      os.remove(tmp_path)
+      raise
+
+  def _delete(self, name: str) -> None:
+    try:
+      os.remove(self._path(name))
+    except FileNotFoundError:
+      pass
+
+  def _list_names(self, prefix: str) -> list[str]:
+    names = []
+    for dir_path, _, file_names in os.walk(self._path(prefix.rstrip("/"))):
+      relative_dir = os.path.relpath(dir_path, self.root_dir)
+      for file_name in file_names:
+        if not file_name.endswith(".tmp"):
+          names.append("/".join(relative_dir.split(os.sep) + [file_name]))
+    return names
+
+  @override
+  async def read(self, name: str) -> Optional[bytes]:
+    return await asyncio.to_thread(self._read, name)
+
+  @override
+  async def write(self, name: str, data: bytes) -> None:
+    await asyncio.to_thread(self._write, name, data)
+
+  @override
+  async def exists(self, name: str) -> bool:
+    return await asyncio.to_thread(os.path.exists, self._path(name))
+
+  @override
+  async def delete(self, name: str) -> None:
+    await asyncio.to_thread(self._delete, name)
+
+  @override
+  async def list_names(self, prefix: str) -> list[str]:
+    return await asyncio.to_thread(self._list_names, prefix)
+
+
+class GcsBlobStore(BlobStore):
+  """A blob store backed by a Google Cloud Storage bucket.
+
+  Updates are made atomic with generation preconditions, so several processes
+  can share a bucket.
+  """
+
+  def __init__(self, bucket_name: str, *, prefix: str = "", **kwargs):
+    """Initializes the GcsBlobStore.
+
+    Args:
+        bucket_name: The name of the bucket to use.
+        prefix: A prefix prepended to all blob names, e.g. `"artifacts/"`.
+        **kwargs: Keyword arguments to pass to the Google Cloud Storage client.
+    """
+    self.storage_client = storage.Client(**kwargs)
+    self.bucket = self.storage_client.bucket(bucket_name)
+    self.prefix = prefix
+
+  def _read(self, name: str) -> Optional[bytes]:
+    try:
+      return self.bucket.blob(self.prefix + name).download_as_bytes()
+    except exceptions.NotFound:
+      return None
+
+  def _list_names(self, prefix: str) -> list[str]:
+    return [
+        blob.name.removeprefix(self.prefix)
+        for blob in self.storage_client.list_blobs(
+            self.bucket, prefix=self.prefix + prefix
+        )
+    ]
+
+  def _update(
+      self,
+      name: str,
+      update_fn: Callable[[Optional[bytes]], Optional[bytes]],
+  ) -> Optional[bytes]:
+    for attempt in range(_MAX_UPDATE_ATTEMPTS):
+      blob = self.bucket.get_blob(self.prefix + name)
+      # Generation 0 makes the write fail if the blob was created meanwhile.
+      generation = blob.generation if blob else 0
+      try:
+        data = update_fn(
+            blob.download_as_bytes(if_generation_match=generation)
+            if blob
+            else None
+        )
+        if data is None:
+          if blob:
+            blob.delete(if_generation_match=generation)
+        else:
+          self.bucket.blob(self.prefix + name).upload_from_string(
+              data, if_generation_match=generation
+          )
+        return data
+      except (exceptions.PreconditionFailed, exceptions.NotFound):
+        if attempt == _MAX_UPDATE_ATTEMPTS - 1:
+          raise
+        logger.debug("%s was updated concurrently, retrying", name)
+
+  @override
+  async def read(self, name: str) -> Optional[bytes]:
+    return await asyncio.to_thread(self._read, name)
+
+  @override
+  async def write(self, name: str, data: bytes) -> None:
+    await asyncio.to_thread(
+        self.bucket.blob(self.prefix + name).upload_from_string, data
+    )
+
+  @override
+  async def exists(self, name: str) -> bool:
+    return await asyncio.to_thread(self.bucket.blob(self.prefix + name).exists)
+
+  @override
+  async def delete(self, name: str) -> None:
+    try:
+      await asyncio.to_thread(self.bucket.blob(self.prefix + name).delete)
+    except exceptions.NotFound:
+      pass
+
+  @override
+  async def list_names(self, prefix: str) -> list[str]:
+    return await asyncio.to_thread(self._list_names, prefix)
+
+  @override
+  async def update(
+      self,
+      name: str,
+      update_fn: Callable[[Optional[bytes]], Optional[bytes]],
+  ) -> Optional[bytes]:
+    return await asyncio.to_thread(self._update, name, update_fn)
+
+
+class _LruByteCache:
+  """An LRU cache of blob contents bounded by their total size."""
+
+  def __init__(self, max_bytes: int):
+    self._max_bytes = max_bytes
+    self._size = 0
+    self._entries: collections.OrderedDict[str, bytes] = (
+        collections.OrderedDict()
+    )
+
+  def get(self, key: str) -> Optional[bytes]:
+    data = self._entries.get(key)
+    if data is not None:
+      self._entries.move_to_end(key)
+    return data
+
+  def put(self, key: str, data: bytes) -> None:
+    if len(data) > self._max_bytes:
+      return
+    self.pop(key)
+    self._entries[key] = data
+    self._size += len(data)
+    while self._size > self._max_bytes:
+      _, evicted = self._entries.popitem(last=False)
+      self._size -= len(evicted)
+
+  def pop(self, key: str) -> None:
+    data = self._entries.pop(key, None)
+    if data is not None:
+      self._size -= len(data)
+
+
+class ContentAddressedArtifactService(BaseArtifactService):
+  """An artifact service that stores each distinct content only once.
+
+  Artifact contents are stored in a `BlobStore` under their SHA-256 digest.
+  Artifact versions are small JSON refs pointing at a digest, and each digest
+  has a reference count of the versions pointing at it. Saving content that is
+  already stored, e.g. the same PDF uploaded by many users, only writes a ref
+  and bumps the count; the blob is deleted once its last version is deleted.
+
+  Loads go through an in-process LRU cache of blob contents, which is always
+  valid because a digest's content never changes.
+
+  Reference counts are changed with `BlobStore.update`, so a store can be
+  shared by several processes if its updates are atomic, as those of
+  `GcsBlobStore` are. The in-memory and local stores are only updated
+  atomically within a process.
+  """
+
+  def __init__(
+      self,
+      store: Optional[BlobStore] = None,
+      *,
+      cache_max_bytes: int = 64 * 1024 * 1024,
+  ):
+    """Initializes the ContentAddressedArtifactService.
+
+    Args:
+        store: The store to keep blobs, refs and reference counts in. Defaults
+          to an `InMemoryBlobStore`.
+        cache_max_bytes: The total size of blob contents kept in the LRU cache.
+    """
+    self.store = store or InMemoryBlobStore()
+    self._cache = _LruByteCache(cache_max_bytes)
+    self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+        weakref.WeakValueDictionary()
+    )
+
+  def _lock(self, key: str) -> asyncio.Lock:
+    return self._locks.setdefault(key, asyncio.Lock())
+
+  def _artifact_prefix(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> str:
+    """Constructs the prefix of the refs of an artifact's versions."""
+    if file_has_user_namespace(filename):
+      return f"{_REFS_PREFIX}{app_name}/{user_id}/user/{filename}/"
+    return f"{_REFS_PREFIX}{app_name}/{user_id}/{session_id}/{filename}/"
+
+  async def _change_refcount(self, digest: str, change: int) -> int:
+    """Changes the reference count of a digest and returns its previous value.
+
+    A count dropping to 0 is kept, rather than deleted, until the blob has been
+    deleted.
+    """
+    previous = 0
+
+    def update(refcount_data: Optional[bytes]) -> bytes:
+      nonlocal previous
+      previous = int(refcount_data) if refcount_data else 0
+      return str(max(previous + change, 0)).encode()
+
+    await self.store.update(_REFCOUNTS_PREFIX + digest, update)
+    return previous
+
+  async def _add_reference(self, digest: str, data: bytes) -> None:
+    async with self._lock(digest):
+      # The count is raised before the blob is checked, so that a concurrent
+      # deletion of the blob sees the new reference; see _release_reference.
+      if await self._change_refcount(digest, 1):
+        return
+      try:
+        if not await self.store.exists(_BLOBS_PREFIX + digest):
+          await self.store.write(_BLOBS_PREFIX + digest, data)
+      except BaseException:
+        await self._release_reference(digest)
+        raise
+
+  async def _remove_reference(self, digest: str) -> None:
+    async with self._lock(digest):
+      await self._release_reference(digest)
+
+  async def _release_reference(self, digest: str) -> None:
+    """Drops a reference, deleting the blob with the last one.
+
+    The caller must hold the lock of the digest.
+    """
+    if await self._change_refcount(digest, -1) > 1:
+      return
+    data = self._cache.get(digest) or await self.store.read(
+        _BLOBS_PREFIX + digest
+    )
+    self._cache.pop(digest)
+    await self.store.delete(_BLOBS_PREFIX + digest)
+    # The count is only deleted if it is still 0. Otherwise, the content was
+    # saved again, possibly by another process that found the blob before it
+    # was deleted, so the blob is written back.
+    refcount_data = await self.store.update(
+        _REFCOUNTS_PREFIX + digest,
+        lambda refcount_data: (
+            refcount_data if refcount_data and int(refcount_data) > 0 else None
+        ),
+    )
+    if refcount_data is not None and data:
+      await self.store.write(_BLOBS_PREFIX + digest, data)
+
+  async def _read_ref(self, name: str) -> Optional[dict]:
+    ref_data = await self.store.read(name)
+    return json.loads(ref_data) if ref_data else None
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    data = artifact.inline_data.data
+    digest = hashlib.sha256(data).hexdigest()
+    prefix = self._artifact_prefix(app_name, user_id, session_id, filename)
+    async with self._lock(prefix):
+      # Listing the versions first lets the store reject invalid names before
+      # anything is written.
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      version = 0 if not versions else max(versions) + 1
+      # The blob and its reference are written before the ref, so a failed
+      # save never leaves a ref to a missing blob. The reference is dropped
+      # again if the ref can't be written.
+      await self._add_reference(digest, data)
+      self._cache.put(digest, data)
+      ref = {
+          "sha256": digest,
+          "mime_type": artifact.inline_data.mime_type,
+          "size": len(data),
+      }
+      try:
+        await self.store.write(f"{prefix}{version}", json.dumps(ref).encode())
+      except BaseException:
+        await self._remove_reference(digest)
+        raise
+    return version
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    prefix = self._artifact_prefix(app_name, user_id, session_id, filename)
+    if version is None:
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      if not versions:
+        return None
+      version = max(versions)
+
+    ref = await self._read_ref(f"{prefix}{version}")
+    if not ref:
+      return None
+    digest = ref["sha256"]
+    data = self._cache.get(digest)
+    if data is None:
+      data = await self.store.read(_BLOBS_PREFIX + digest)
+      if data is None:
+        logger.warning("Blob %s of artifact %s is missing", digest, prefix)
+        return None
+      self._cache.put(digest, data)
+    return types.Part.from_bytes(data=data, mime_type=ref["mime_type"])
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    session_prefix = f"{_REFS_PREFIX}{app_name}/{user_id}/{session_id}/"
+    user_namespace_prefix = f"{_REFS_PREFIX}{app_name}/{user_id}/user/"
+    session_names, user_namespace_names = await asyncio.gather(
+        self.store.list_names(session_prefix),
+        self.store.list_names(user_namespace_prefix),
+    )
+    filenames = set()
+    for name in session_names + user_namespace_names:
+      *_, filename, _ = name.split("/")
+      filenames.add(filename)
+    return sorted(filenames)
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    prefix = self._artifact_prefix(app_name, user_id, session_id, filename)
+    async with self._lock(prefix):
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      for version in versions:
+        ref = await self._read_ref(f"{prefix}{version}")
+        await self.store.delete(f"{prefix}{version}")
+        if ref:
+          await self._remove_reference(ref["sha256"])
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    prefix = self._artifact_prefix(app_name, user_id, session_id, filename)
+    names = await self.store.list_names(prefix)
+    return sorted(int(name.removeprefix(prefix)) for name in names)
@@ -0,0 +1,365 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service implementation using the local filesystem."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from typing import AsyncIterable
+from typing import BinaryIO
+from typing import Iterable
+from typing import Optional
+from typing import Union
+from urllib.parse import unquote
+
+from google.genai import types
+from typing_extensions import override
+
+from ..utils._local_paths import encode_path_component
+from ..utils._local_paths import join_under_root
+from ._namespaces import file_has_user_namespace
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_METADATA_SUFFIX = ".meta.json"
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+ArtifactStream = Union[BinaryIO, Iterable[bytes], AsyncIterable[bytes]]
+
+
+class MappedArtifact:
+  """A read-only, memory-mapped view of a stored artifact version.
+
+  The data is paged in from disk on access instead of being copied into a
+  `bytes` object up front. Close it, or use it as a context manager, to release
+  the mapping.
+  """
+
+  def __init__(self, path: str, mime_type: str):
+    self.mime_type = mime_type
+    with open(path, "rb") as f:
+      size = os.fstat(f.fileno()).st_size
+      # Empty files cannot be mapped.
+      self._mmap = (
+          mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+      )
+    self.data = memoryview(self._mmap) if self._mmap else memoryview(b"")
+
+  def close(self) -> None:
+    self.data.release()
+    if self._mmap:
+      self._mmap.close()
+
+  def __enter__(self) -> MappedArtifact:
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+
+class FileArtifactService(BaseArtifactService):
+  """An artifact service implementation using the local filesystem.
+
+  Each artifact version is stored as a data file with a JSON metadata sidecar
+  under `<root_dir>/<app_name>/<user_id>/<session_id or "user">/<filename>/`.
+  Path components are percent-encoded, names that are empty, "." or ".." are
+  rejected with a ValueError, and every path is checked to resolve inside the
+  root, so names cannot escape it.
+
+  Data files are written to a temporary file and then hard-linked to their
+  version number, which fails if the version already exists, so concurrent
+  saves from several processes never overwrite each other. A version becomes
+  visible once its sidecar has been written.
+
+  `load_artifact` reads the whole version into memory; `open_artifact` maps it
+  instead, for callers that can work with a read-only view of the data.
+  """
+
+  def __init__(self, root_dir: str):
+    """Initializes the FileArtifactService.
+
+    Args:
+        root_dir: The directory to store artifacts in.
+    """
+    self.root_dir = root_dir
+
+  def _namespace_dir(self, app_name: str, user_id: str, namespace: str) -> str:
+    return join_under_root(
+        self.root_dir,
+        encode_path_component(app_name),
+        encode_path_component(user_id),
+        encode_path_component(namespace),
+    )
+
+  def _artifact_dir(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> str:
+    """Constructs the directory holding the versions of an artifact.
+
+    Raises:
+      ValueError: If a name is empty, "." or "..", or the directory would not
+        be inside the root directory.
+    """
+    namespace = "user" if file_has_user_namespace(filename) else session_id
+    return join_under_root(
+        self.root_dir,
+        encode_path_component(app_name),
+        encode_path_component(user_id),
+        encode_path_component(namespace),
+        encode_path_component(filename),
+    )
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    return await self.save_artifact_from_stream(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        stream=[artifact.inline_data.data],
+        mime_type=artifact.inline_data.mime_type,
+    )
+
+  async def save_artifact_from_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      stream: ArtifactStream,
+      mime_type: str,
+  ) -> int:
+    """Saves an artifact whose data is read from a stream, chunk by chunk.
+
+    Unlike `save_artifact`, the data never has to be held in memory as a
+    whole, which matters for large uploads.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      session_id: The session ID.
+      filename: The filename of the artifact.
+      stream: A binary file object, or a sync or async iterable of chunks.
+      mime_type: The MIME type of the artifact.
+
+    Returns:
+      The revision ID of the saved artifact.
+    """
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    await asyncio.to_thread(os.makedirs, artifact_dir, exist_ok=True)
+    fd, tmp_path = await asyncio.to_thread(
+        tempfile.mkstemp, dir=artifact_dir, suffix=".tmp"
+    )
+    try:
+      with os.fdopen(fd, "wb") as f:
+        size = 0
+        async for chunk in _iterate_chunks(stream):
+          await asyncio.to_thread(f.write, chunk)
+          size += len(chunk)
+        await asyncio.to_thread(f.flush)
+        await asyncio.to_thread(os.fsync, f.fileno())
+      return await asyncio.to_thread(
+          self._commit_version, artifact_dir, tmp_path, mime_type, size
+      )
+    finally:
+      await asyncio.to_thread(_remove_if_exists, tmp_path)
+
+  def _commit_version(
+      self, artifact_dir: str, tmp_path: str, mime_type: str, size: int
+  ) -> int:
+    versions = self._list_versions(artifact_dir)
+    version = max(versions) + 1 if versions else 0
+    while True:
+      try:
+        os.link(tmp_path, os.path.join(artifact_dir, str(version)))
+        break
+      except FileExistsError:
+        # Another save, possibly from another process, took the version.
+        version += 1
+    metadata = {
+        "mime_type": mime_type,
+        "size": size,
+        "create_time": time.time(),
+    }
+    fd, tmp_metadata_path = tempfile.mkstemp(dir=artifact_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+      json.dump(metadata, f)
+    os.replace(
+        tmp_metadata_path,
+        os.path.join(artifact_dir, f"{version}{_METADATA_SUFFIX}"),
+    )
+    return version
+
+  def _read_metadata(self, artifact_dir: str, version: int) -> Optional[dict]:
+    try:
+      with open(
+          os.path.join(artifact_dir, f"{version}{_METADATA_SUFFIX}"),
+          encoding="utf-8",
+      ) as f:
+        return json.load(f)
+    except FileNotFoundError:
+      return None
+
+  async def _resolve_version(
+      self, artifact_dir: str, version: Optional[int]
+  ) -> Optional[int]:
+    if version is not None:
+      return version
+    versions = await asyncio.to_thread(self._list_versions, artifact_dir)
+    return max(versions) if versions else None
+
+  async def open_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[MappedArtifact]:
+    """Opens an artifact version as a memory-mapped, read-only view.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      session_id: The session ID.
+      filename: The filename of the artifact.
+      version: The version of the artifact. If None, the latest version is
+        opened.
+
+    Returns:
+      The mapped artifact, which the caller must close, or None if not found.
+    """
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    version = await self._resolve_version(artifact_dir, version)
+    if version is None:
+      return None
+    metadata = await asyncio.to_thread(
+        self._read_metadata, artifact_dir, version
+    )
+    if not metadata:
+      return None
+    return await asyncio.to_thread(
+        MappedArtifact,
+        os.path.join(artifact_dir, str(version)),
+        metadata["mime_type"],
+    )
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    version = await self._resolve_version(artifact_dir, version)
+    if version is None:
+      return None
+    metadata = await asyncio.to_thread(
+        self._read_metadata, artifact_dir, version
+    )
+    if not metadata:
+      return None
+    data = await asyncio.to_thread(
+        _read_file, os.path.join(artifact_dir, str(version))
+    )
+    return types.Part.from_bytes(data=data, mime_type=metadata["mime_type"])
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    filenames = set()
+    for namespace in [session_id, "user"]:
+      namespace_dir = self._namespace_dir(app_name, user_id, namespace)
+      for entry in await asyncio.to_thread(_list_dir, namespace_dir):
+        if await asyncio.to_thread(
+            self._list_versions, os.path.join(namespace_dir, entry)
+        ):
+          filenames.add(unquote(entry))
+    return sorted(filenames)
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    await asyncio.to_thread(shutil.rmtree, artifact_dir, ignore_errors=True)
+
+  def _list_versions(self, artifact_dir: str) -> list[int]:
+    return sorted(
+        int(entry.removesuffix(_METADATA_SUFFIX))
+        for entry in _list_dir(artifact_dir)
+        if entry.endswith(_METADATA_SUFFIX)
+    )
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    artifact_dir = self._artifact_dir(app_name, user_id, session_id, filename)
+    return await asyncio.to_thread(self._list_versions, artifact_dir)
+
+
+async def _iterate_chunks(stream: ArtifactStream) -> AsyncIterable[bytes]:
+  if hasattr(stream, "read"):
+    while chunk := await asyncio.to_thread(stream.read, _STREAM_CHUNK_SIZE):
+      yield chunk
+  elif hasattr(stream, "__aiter__"):
+    async for chunk in stream:
+      yield chunk
+  else:
+    for chunk in stream:
+      yield chunk
+
+
+def _read_file(path: str) -> bytes:
+  with open(path, "rb") as f:
+    return f.read()
+
+
+def _list_dir(path: str) -> list[str]:
+  try:
+    return os.listdir(path)
+  except FileNotFoundError:
+    return []
+
+
+def _remove_if_exists(path: str) -> None:
+  try:
+    os.remove(path)
+  except FileNotFoundError:
+    pass
@@ -13,11 +13,21 @@
 # limitations under the License.
 
 """An artifact service implementation using Google Cloud Storage (GCS)."""
+
 from __future__ import annotations
 
+import asyncio
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
+from typing import Any
+from typing import Callable
 from typing import Optional
+from typing import TypeVar
+import weakref
 
+from google.api_core import exceptions
 from google.cloud import storage
 from google.genai import types
 from typing_extensions import override
@@ -26,20 +36,84 @@ from .base_artifact_service import BaseArtifactService
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_T = TypeVar("_T")
+
+_MAX_SAVE_ATTEMPTS = 3
+_DEFAULT_MAX_CACHED_LATEST_VERSIONS = 10000
+
 
 class GcsArtifactService(BaseArtifactService):
-  """An artifact service implementation using Google Cloud Storage (GCS)."""
+  """An artifact service implementation using Google Cloud Storage (GCS).
+
+  The `google.cloud.storage` client is blocking, so every GCS call runs in a
+  bounded thread pool instead of on the event loop. Call `close()` to shut the
+  thread pool down once the service is no longer used.
+
+  The latest versions of the most recently used artifacts are cached after
+  they are first listed or saved, so saves and loads of the latest version do
+  not list the artifact's versions again. Saves of one artifact in this process
+  run one at a time, and a version is only cached once it is uploaded. Saves
+  upload with a "does not exist yet" precondition, so a version written by
+  another process in the meantime is never overwritten; the cache is refreshed
+  and the save retried instead. Loads of the latest version may not see
+  versions saved by other processes after the cache was filled; pass
+  `cache_latest_versions=False` if that matters. If another process deleted
+  the cached latest version, the versions are listed again.
+  """
 
-  def __init__(self, bucket_name: str, **kwargs):
+  def __init__(
+      self,
+      bucket_name: str,
+      *,
+      max_workers: int = 8,
+      cache_latest_versions: bool = True,
+      max_cached_latest_versions: int = _DEFAULT_MAX_CACHED_LATEST_VERSIONS,
+      **kwargs,
+  ):
     """Initializes the GcsArtifactService.
 
     Args:
         bucket_name: The name of the bucket to use.
+        max_workers: The maximum number of concurrent GCS calls.
+        cache_latest_versions: Whether to cache the latest version of each
+          artifact.
+        max_cached_latest_versions: The maximum number of artifacts whose
+          latest version is cached. The least recently used ones are evicted
+          first.
         **kwargs: Keyword arguments to pass to the Google Cloud Storage client.
     """
     self.bucket_name = bucket_name
     self.storage_client = storage.Client(**kwargs)
     self.bucket = self.storage_client.bucket(self.bucket_name)
+    self._executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="gcs_artifact_service"
+    )
+    self._cache_latest_versions = cache_latest_versions
+    self._max_cached_latest_versions = max_cached_latest_versions
+    self._latest_versions: collections.OrderedDict[str, int] = (
+        collections.OrderedDict()
+    )
+    """Keys are blob name prefixes of artifacts, values their latest version,
+    least recently used first."""
+    self._version_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+        weakref.WeakValueDictionary()
+    )
+
+  def close(self) -> None:
+    """Shuts down the thread pool used for GCS calls.
+
+    Waits for GCS calls in progress to finish. The service cannot be used
+    afterwards.
+    """
+    self._executor.shutdown(wait=True)
+
+  async def _run(
+      self, func: Callable[..., _T], *args: Any, **kwargs: Any
+  ) -> _T:
+    """Runs a blocking GCS call in the thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        self._executor, functools.partial(func, *args, **kwargs)
+    )
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -53,6 +127,20 @@ class GcsArtifactService(BaseArtifactService):
     """
     return filename.startswith("user:")
 
+  def _get_cached_latest_version(self, prefix: str) -> Optional[int]:
+    version = self._latest_versions.get(prefix)
+    if version is not None:
+      self._latest_versions.move_to_end(prefix)
+    return version
+
+  def _cache_latest_version(self, prefix: str, version: int) -> None:
+    if not self._cache_latest_versions:
+      return
+    self._latest_versions[prefix] = version
+    self._latest_versions.move_to_end(prefix)
+    while len(self._latest_versions) > self._max_cached_latest_versions:
+      self._latest_versions.popitem(last=False)
+
   def _get_blob_name(
       self,
       app_name: str,
@@ -77,35 +165,72 @@ class GcsArtifactService(BaseArtifactService):
       return f"{app_name}/{user_id}/user/{filename}/{version}"
     return f"{app_name}/{user_id}/{session_id}/{filename}/{version}"
 
-  @override
-  async def save_artifact(
+  async def _get_latest_version(
       self,
-      *,
       app_name: str,
       user_id: str,
       session_id: str,
       filename: str,
-      artifact: types.Part,
-  ) -> int:
+  ) -> Optional[int]:
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    version = self._get_cached_latest_version(prefix)
+    if version is not None:
+      return version
     versions = await self.list_versions(
         app_name=app_name,
         user_id=user_id,
         session_id=session_id,
         filename=filename,
     )
-    version = 0 if not versions else max(versions) + 1
-
-    blob_name = self._get_blob_name(
-        app_name, user_id, session_id, filename, version
-    )
-    blob = self.bucket.blob(blob_name)
-
-    blob.upload_from_string(
-        data=artifact.inline_data.data,
-        content_type=artifact.inline_data.mime_type,
-    )
+    return max(versions) if versions else None
 
-    return version
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    # Saves of the artifact in this process are serialized, so they do not
+    # race for a version.
+    lock = self._version_locks.setdefault(prefix, asyncio.Lock())
+    async with lock:
+      for attempt in range(_MAX_SAVE_ATTEMPTS):
+        latest_version = await self._get_latest_version(
+            app_name, user_id, session_id, filename
+        )
+        version = 0 if latest_version is None else latest_version + 1
+        blob_name = self._get_blob_name(
+            app_name, user_id, session_id, filename, version
+        )
+        blob = self.bucket.blob(blob_name)
+        try:
+          await self._run(
+              blob.upload_from_string,
+              data=artifact.inline_data.data,
+              content_type=artifact.inline_data.mime_type,
+              if_generation_match=0,
+          )
+        except Exception as e:
+          self._latest_versions.pop(prefix, None)
+          if (
+              not isinstance(e, exceptions.PreconditionFailed)
+              or attempt == _MAX_SAVE_ATTEMPTS - 1
+          ):
+            raise
+          logger.debug(
+              "Artifact version %s was written concurrently, retrying",
+              blob_name,
+          )
+          continue
+        # Only cache the version once it exists, so loads never see a version
+        # that is still being uploaded.
+        self._cache_latest_version(prefix, version)
+        return version
 
   @override
   async def load_artifact(
@@ -117,23 +242,43 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       version: Optional[int] = None,
   ) -> Optional[types.Part]:
-    if version is None:
-      versions = await self.list_versions(
-          app_name=app_name,
-          user_id=user_id,
-          session_id=session_id,
-          filename=filename,
+    if version is not None:
+      return await self._load_version(
+          app_name, user_id, session_id, filename, version
+      )
+
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    for attempt in range(2):
+      version = await self._get_latest_version(
+          app_name, user_id, session_id, filename
       )
-      if not versions:
+      if version is None:
         return None
-      version = max(versions)
+      try:
+        return await self._load_version(
+            app_name, user_id, session_id, filename, version
+        )
+      except exceptions.NotFound:
+        if attempt:
+          return None
+        # Another process deleted the cached latest version, so the versions
+        # are listed again.
+        self._latest_versions.pop(prefix, None)
 
+  async def _load_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: int,
+  ) -> Optional[types.Part]:
     blob_name = self._get_blob_name(
         app_name, user_id, session_id, filename, version
     )
     blob = self.bucket.blob(blob_name)
 
-    artifact_bytes = blob.download_as_bytes()
+    artifact_bytes = await self._run(blob.download_as_bytes)
     if not artifact_bytes:
       return None
     artifact = types.Part.from_bytes(
@@ -141,26 +286,26 @@ class GcsArtifactService(BaseArtifactService):
     )
     return artifact
 
+  def _list_blob_names(self, prefix: str) -> list[str]:
+    return [
+        blob.name
+        for blob in self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    ]
+
   @override
   async def list_artifact_keys(
       self, *, app_name: str, user_id: str, session_id: str
   ) -> list[str]:
-    filenames = set()
-
     session_prefix = f"{app_name}/{user_id}/{session_id}/"
-    session_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=session_prefix
-    )
-    for blob in session_blobs:
-      *_, filename, _ = blob.name.split("/")
-      filenames.add(filename)
-
     user_namespace_prefix = f"{app_name}/{user_id}/user/"
-    user_namespace_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=user_namespace_prefix
+    session_blob_names, user_namespace_blob_names = await asyncio.gather(
+        self._run(self._list_blob_names, session_prefix),
+        self._run(self._list_blob_names, user_namespace_prefix),
     )
-    for blob in user_namespace_blobs:
-      *_, filename, _ = blob.name.split("/")
+
+    filenames = set()
+    for blob_name in session_blob_names + user_namespace_blob_names:
+      *_, filename, _ = blob_name.split("/")
       filenames.add(filename)
 
     return sorted(list(filenames))
@@ -175,12 +320,20 @@ class GcsArtifactService(BaseArtifactService):
         session_id=session_id,
         filename=filename,
     )
-    for version in versions:
-      blob_name = self._get_blob_name(
-          app_name, user_id, session_id, filename, version
-      )
-      blob = self.bucket.blob(blob_name)
-      blob.delete()
+    self._latest_versions.pop(
+        self._get_blob_name(app_name, user_id, session_id, filename, ""), None
+    )
+    # The thread pool bounds how many deletes are in flight at once.
+    await asyncio.gather(*[
+        self._run(
+            self.bucket.blob(
+                self._get_blob_name(
+                    app_name, user_id, session_id, filename, version
+                )
+            ).delete
+        )
+        for version in versions
+    ])
     return
 
   @override
@@ -188,9 +341,13 @@ class GcsArtifactService(BaseArtifactService):
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> list[int]:
     prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
-    blobs = self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    blob_names = await self._run(self._list_blob_names, prefix)
     versions = []
-    for blob in blobs:
-      _, _, _, _, version = blob.name.split("/")
+    for blob_name in blob_names:
+      _, _, _, _, version = blob_name.split("/")
       versions.append(int(version))
+    if versions:
+      self._cache_latest_version(prefix, max(versions))
+    else:
+      self._latest_versions.pop(prefix, None)
     return versions
@@ -42,6 +42,9 @@ from google.genai import types
 import graphviz
 from opentelemetry import trace
 from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.export import MetricReader
 from opentelemetry.sdk.trace import export
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace import TracerProvider
@@ -50,6 +53,7 @@ from pydantic import ValidationError
 from starlette.types import Lifespan
 from typing_extensions import override
 
+from .. import metrics as adk_metrics
 from ..agents import RunConfig
 from ..agents.live_request_queue import LiveRequest
 from ..agents.live_request_queue import LiveRequestQueue
@@ -83,6 +87,7 @@ from .utils import create_empty_state
 from .utils import envs
 from .utils import evals
 from .utils.agent_loader import AgentLoader
+from .utils.trace_store import TraceStore
 
 logger = logging.getLogger("google_adk." + __name__)
 
@@ -91,8 +96,8 @@ _EVAL_SET_FILE_EXTENSION = ".evalset.json"
 
 class ApiServerSpanExporter(export.SpanExporter):
 
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
+  def __init__(self, trace_store: TraceStore):
+    self.trace_store = trace_store
 
   def export(
       self, spans: typing.Sequence[ReadableSpan]
@@ -107,7 +112,9 @@ class ApiServerSpanExporter(export.SpanExporter):
         attributes["trace_id"] = span.get_span_context().trace_id
         attributes["span_id"] = span.get_span_context().span_id
         if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
+          self.trace_store.add_event_attributes(
+              attributes["gcp.vertex.agent.event_id"], attributes
+          )
     return export.SpanExportResult.SUCCESS
 
   def force_flush(self, timeout_millis: int = 30000) -> bool:
@@ -116,26 +123,20 @@ class ApiServerSpanExporter(export.SpanExporter):
 
 class InMemoryExporter(export.SpanExporter):
 
-  def __init__(self, trace_dict):
+  def __init__(self, trace_store: TraceStore):
     super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
+    self.trace_store = trace_store
 
   @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export.SpanExportResult:
     for span in spans:
-      trace_id = span.context.trace_id
       if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
+        session_id = span.attributes.get("gcp.vertex.agent.session_id", None)
         if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+          self.trace_store.add_session_trace(session_id, span.context.trace_id)
+      self.trace_store.add_span(span)
     return export.SpanExportResult.SUCCESS
 
   @override
@@ -143,13 +144,10 @@ class InMemoryExporter(export.SpanExporter):
     return True
 
   def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+    return self.trace_store.get_session_spans(session_id)
 
   def clear(self):
-    self._spans.clear()
+    self.trace_store.clear_spans()
 
 
 class AgentRunRequest(common.BaseModel):
@@ -206,17 +204,18 @@ def get_fast_api_app(
     port: int = 8000,
     trace_to_cloud: bool = False,
     lifespan: Optional[Lifespan[FastAPI]] = None,
+    trace_store: Optional[TraceStore] = None,
+    metric_readers: Optional[list[MetricReader]] = None,
 ) -> FastAPI:
-  # InMemory tracing dict.
-  trace_dict: dict[str, Any] = {}
-  session_trace_dict: dict[str, Any] = {}
+  # Bounded in-memory store of the traces shown by the dev UI.
+  trace_store = trace_store or TraceStore()
 
   # Set up tracing in the FastAPI server.
   provider = TracerProvider()
   provider.add_span_processor(
-      export.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict))
+      export.SimpleSpanProcessor(ApiServerSpanExporter(trace_store))
   )
-  memory_exporter = InMemoryExporter(session_trace_dict)
+  memory_exporter = InMemoryExporter(trace_store)
   provider.add_span_processor(export.SimpleSpanProcessor(memory_exporter))
   if trace_to_cloud:
     envs.load_dotenv_for_agent("", agents_dir)
@@ -233,6 +232,13 @@ def get_fast_api_app(
 
   trace.set_tracer_provider(provider)
 
+  # Set up metrics. The in-memory reader serves /debug/metrics, the others
+  # export elsewhere.
+  metric_reader = InMemoryMetricReader()
+  adk_metrics.set_meter_provider(
+      MeterProvider(metric_readers=[metric_reader, *(metric_readers or [])])
+  )
+
   @asynccontextmanager
   async def internal_lifespan(app: FastAPI):
 
@@ -355,11 +361,18 @@ def get_fast_api_app(
 
   @app.get("/debug/trace/{event_id}")
   def get_trace_dict(event_id: str) -> Any:
-    event_dict = trace_dict.get(event_id, None)
+    event_dict = trace_store.get_event_attributes(event_id)
     if event_dict is None:
       raise HTTPException(status_code=404, detail="Trace not found")
     return event_dict
 
+  @app.get("/debug/metrics")
+  def get_metrics() -> Any:
+    metrics_data = metric_reader.get_metrics_data()
+    if metrics_data is None:
+      return {}
+    return json.loads(metrics_data.to_json())
+
   @app.get("/debug/trace/session/{session_id}")
   def get_session_trace(session_id: str) -> Any:
     spans = memory_exporter.get_finished_spans(session_id)
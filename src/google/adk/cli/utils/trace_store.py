@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import threading
+from typing import Any
+from typing import Optional
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+
+class TraceStore:
+  """A bounded in-memory store of finished spans for the dev and API servers.
+
+  Spans are kept in a ring buffer of at most `max_spans` spans; once it is
+  full, the oldest spans are dropped first. Spans are indexed by trace, and
+  traces by the session they belong to, so a session's spans are found
+  without scanning the buffer. Sessions are evicted least recently used first
+  once there are more than `max_sessions`, together with their spans.
+
+  Span attributes are also indexed by the event id they were recorded for,
+  keeping the most recent `max_events` events.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_spans: int = 100_000,
+      max_sessions: int = 1_000,
+      max_events: int = 10_000,
+  ):
+    self._max_spans = max_spans
+    self._max_sessions = max_sessions
+    self._max_events = max_events
+    self._ring: collections.deque[int] = collections.deque()
+    """Trace ids of the stored spans, oldest first."""
+    self._spans_by_trace: dict[int, collections.deque[ReadableSpan]] = {}
+    self._num_spans = 0
+    self._traces_by_session: collections.OrderedDict[str, list[int]] = (
+        collections.OrderedDict()
+    )
+    self._session_by_trace: dict[int, str] = {}
+    self._event_attributes: collections.OrderedDict[str, dict[str, Any]] = (
+        collections.OrderedDict()
+    )
+    self._lock = threading.Lock()
+
+  def add_span(self, span: ReadableSpan) -> None:
+    """Stores a finished span."""
+    trace_id = span.context.trace_id
+    with self._lock:
+      self._spans_by_trace.setdefault(trace_id, collections.deque()).append(
+          span
+      )
+      self._ring.append(trace_id)
+      self._num_spans += 1
+      self._evict_spans()
+
+  def add_session_trace(self, session_id: str, trace_id: int) -> None:
+    """Associates a trace with a session."""
+    with self._lock:
+      trace_ids = self._traces_by_session.setdefault(session_id, [])
+      self._traces_by_session.move_to_end(session_id)
+      if self._session_by_trace.get(trace_id) != session_id:
+        trace_ids.append(trace_id)
+        self._session_by_trace[trace_id] = session_id
+      while len(self._traces_by_session) > self._max_sessions:
+        _, evicted_trace_ids = self._traces_by_session.popitem(last=False)
+        for evicted_trace_id in evicted_trace_ids:
+          self._drop_trace(evicted_trace_id)
+
+  def add_event_attributes(
+      self, event_id: str, attributes: dict[str, Any]
+  ) -> None:
+    """Stores the span attributes recorded for an event."""
+    with self._lock:
+      self._event_attributes[event_id] = attributes
+      self._event_attributes.move_to_end(event_id)
+      while len(self._event_attributes) > self._max_events:
+        self._event_attributes.popitem(last=False)
+
+  def get_event_attributes(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the span attributes recorded for an event, if any."""
+    with self._lock:
+      return self._event_attributes.get(event_id)
+
+  def get_session_spans(self, session_id: str) -> list[ReadableSpan]:
+    """Returns the stored spans of a session's traces."""
+    with self._lock:
+      trace_ids = self._traces_by_session.get(session_id)
+      if not trace_ids:
+        return []
+      self._traces_by_session.move_to_end(session_id)
+      return [
+          span
+          for trace_id in trace_ids
+          for span in self._spans_by_trace.get(trace_id, ())
+      ]
+
+  def clear_spans(self) -> None:
+    """Drops all stored spans, keeping the session and event indexes."""
+    with self._lock:
+      self._ring.clear()
+      self._spans_by_trace.clear()
+      self._num_spans = 0
+
+  def _drop_trace(self, trace_id: int) -> None:
+    spans = self._spans_by_trace.pop(trace_id, None)
+    if spans:
+      self._num_spans -= len(spans)
+    self._session_by_trace.pop(trace_id, None)
+    # The ring still holds the dropped spans' trace ids, which are skipped
+    # when evicting. Compact it once they dominate.
+    if len(self._ring) > 2 * max(self._num_spans, self._max_spans):
+      self._ring = collections.deque(
+          t for t in self._ring if t in self._spans_by_trace
+      )
+
+  def _evict_spans(self) -> None:
+    while self._num_spans > self._max_spans:
+      trace_id = self._ring.popleft()
+      spans = self._spans_by_trace.get(trace_id)
+      if not spans:
+        continue
+      spans.popleft()
+      self._num_spans -= 1
+      if not spans:
+        del self._spans_by_trace[trace_id]
@@ -0,0 +1,147 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+from typing import Any
+from typing import Optional
+
+from google.genai import types
+from opentelemetry import trace
+
+from ...agents.invocation_context import InvocationContext
+from ...models.llm_response import LlmResponse
+from ...telemetry import tracer
+from ...tools.base_tool import BaseTool
+from ...tools.tool_context import ToolContext
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+def _get_call_key(name: Optional[str], args: dict[str, Any]) -> str:
+  return json.dumps([name, args], sort_keys=True, default=str)
+
+
+def _discard_result(task: asyncio.Task) -> None:
+  if not task.cancelled() and task.exception():
+    logger.debug('Discarded speculative tool call failed: %r', task.exception())
+
+
+async def _run_tool(
+    tool: BaseTool,
+    args: dict[str, Any],
+    tool_context: ToolContext,
+    span: trace.Span,
+) -> Any:
+  with trace.use_span(span, end_on_exit=False):
+    return await tool.run_async(args=args, tool_context=tool_context)
+
+
+class PrefetchedCall:
+  """A read-only tool call started before the model response confirmed it."""
+
+  def __init__(
+      self,
+      args: dict[str, Any],
+      tool_context: ToolContext,
+      task: asyncio.Task,
+      span: trace.Span,
+  ):
+    self.args = args
+    """The arguments the tool was called with."""
+    self.tool_context = tool_context
+    """The tool context of the call, whose function call id is only set once
+    the call is confirmed."""
+    self.task = task
+    """The task running the tool."""
+    self.span = span
+    """The `execute_tool` span of the call, which the tool runs in. It is
+    ended by whoever handles the confirmed call."""
+
+  def cancel(self) -> None:
+    """Discards the call, cancelling the tool if it is still running."""
+    self.task.cancel()
+    self.task.add_done_callback(_discard_result)
+    self.span.set_attribute('gcp.vertex.agent.tool_call_discarded', True)
+    self.span.end()
+
+
+class ToolPrefetcher:
+  """Runs read-only tools while the model response is still streaming.
+
+  Function calls that a model reports complete in partial responses are
+  started right away if their tools are read-only. When the final response
+  makes a call with the same name and arguments, its result is reused. Calls
+  the final response doesn't make are cancelled once the model step ends.
+
+  Flows only prefetch for agents without before_tool callbacks, as those may
+  answer or block a call before its tool runs.
+  """
+
+  def __init__(
+      self,
+      invocation_context: InvocationContext,
+      tools_dict: dict[str, BaseTool],
+  ):
+    self._invocation_context = invocation_context
+    self._tools_dict = tools_dict
+    self._calls: dict[str, list[PrefetchedCall]] = {}
+    self._started: set[str] = set()
+
+  def prefetch(self, llm_response: LlmResponse) -> None:
+    """Starts the read-only function calls of a partial model response."""
+    if not llm_response.content or not llm_response.content.parts:
+      return
+    for part in llm_response.content.parts:
+      function_call = part.function_call
+      if not function_call:
+        continue
+      tool = self._tools_dict.get(function_call.name)
+      if not tool or not tool.is_read_only or tool.is_long_running:
+        continue
+      args = function_call.args or {}
+      key = _get_call_key(function_call.name, args)
+      # Models may repeat a call in later partial responses.
+      if (function_call.id or key) in self._started:
+        continue
+      self._started.add(function_call.id or key)
+
+      tool_context = ToolContext(self._invocation_context)
+      span = tracer.start_span(f'execute_tool {tool.name}')
+      task = asyncio.create_task(
+          _run_tool(tool, copy.deepcopy(args), tool_context, span)
+      )
+      self._calls.setdefault(key, []).append(
+          PrefetchedCall(copy.deepcopy(args), tool_context, task, span)
+      )
+
+  def pop(self, function_call: types.FunctionCall) -> Optional[PrefetchedCall]:
+    """Returns the prefetched call matching a confirmed function call."""
+    calls = self._calls.get(
+        _get_call_key(function_call.name, function_call.args or {})
+    )
+    if not calls:
+      return None
+    return calls.pop(0)
+
+  def cancel(self) -> None:
+    """Discards the calls that were never confirmed."""
+    for calls in self._calls.values():
+      for call in calls:
+        call.cancel()
+    self._calls.clear()
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import typing
 from typing import AsyncGenerator
+from typing import Optional
 
 from typing_extensions import override
 
@@ -46,15 +47,11 @@ class _AgentTransferLlmRequestProcessor(BaseLlmRequestProcessor):
     if not isinstance(invocation_context.agent, LlmAgent):
       return
 
-    transfer_targets = _get_transfer_targets(invocation_context.agent)
-    if not transfer_targets:
+    instructions = _get_transfer_instructions(invocation_context.agent)
+    if not instructions:
       return
 
-    llm_request.append_instructions([
-        _build_target_agents_instructions(
-            invocation_context.agent, transfer_targets
-        )
-    ])
+    llm_request.append_instructions([instructions])
 
     transfer_to_agent_tool = FunctionTool(func=transfer_to_agent)
     tool_context = ToolContext(invocation_context)
@@ -110,6 +107,23 @@ to your parent agent.
 _TRANSFER_TO_AGENT_FUNCTION_NAME = transfer_to_agent.__name__
 
 
+def _get_transfer_instructions(agent: LlmAgent) -> Optional[str]:
+  """Returns the transfer instructions of an agent, if it has targets.
+
+  The targets and instructions are cached in the agent tree index, which is
+  rebuilt once the tree changes.
+  """
+  transfers = agent._get_tree_index().transfers
+  cached = transfers.get(agent.name)
+  if cached is None or cached[0] is not agent:
+    targets = _get_transfer_targets(agent)
+    instructions = (
+        _build_target_agents_instructions(agent, targets) if targets else None
+    )
+    cached = transfers[agent.name] = (agent, targets, instructions)
+  return cached[2]
+
+
 def _get_transfer_targets(agent: LlmAgent) -> list[BaseAgent]:
   from ...agents.llm_agent import LlmAgent
 
@@ -27,9 +27,11 @@ from google.genai import types
 from websockets.exceptions import ConnectionClosedOK
 
 from . import functions
+from ... import metrics
 from ...agents.base_agent import BaseAgent
 from ...agents.callback_context import CallbackContext
 from ...agents.invocation_context import InvocationContext
+from ...agents.invocation_context import TOKEN_LIMIT_EXCEEDED_ERROR_CODE
 from ...agents.live_request_queue import LiveRequestQueue
 from ...agents.readonly_context import ReadonlyContext
 from ...agents.run_config import StreamingMode
@@ -42,6 +44,7 @@ from ...telemetry import trace_call_llm
 from ...telemetry import trace_send_data
 from ...telemetry import tracer
 from ...tools.tool_context import ToolContext
+from ._tool_prefetcher import ToolPrefetcher
 
 if TYPE_CHECKING:
   from ...agents.llm_agent import LlmAgent
@@ -77,6 +80,9 @@ class BaseLlmFlow(ABC):
       yield event
     if invocation_context.end_invocation:
       return
+    if error_message := invocation_context.enforce_token_limits():
+      yield self._create_token_limit_event(invocation_context, error_message)
+      return
 
     llm = self.__get_llm(invocation_context)
     logger.debug(
@@ -238,6 +244,9 @@ class BaseLlmFlow(ABC):
     try:
       while True:
         async for llm_response in llm_connection.receive():
+          # Live responses report the usage of each turn.
+          if llm_response.usage_metadata:
+            invocation_context.record_token_usage(llm_response.usage_metadata)
           model_response_event = Event(
               id=Event.new_id(),
               invocation_id=invocation_context.invocation_id,
@@ -268,6 +277,12 @@ class BaseLlmFlow(ABC):
                   )
               )
             yield event
+          # Ends the live session once a token limit is reached.
+          if error_message := invocation_context.enforce_token_limits():
+            yield self._create_token_limit_event(
+                invocation_context, error_message
+            )
+            return
         # Give opportunity for other tasks to run.
         await asyncio.sleep(0)
     except ConnectionClosedOK:
@@ -311,16 +326,36 @@ class BaseLlmFlow(ABC):
         author=invocation_context.agent.name,
         branch=invocation_context.branch,
     )
-    async for llm_response in self._call_llm_async(
-        invocation_context, llm_request, model_response_event
+    # Read-only tools start as soon as a partial response has their call.
+    prefetcher = None
+    if (
+        invocation_context.run_config.streaming_mode == StreamingMode.SSE
+        # Callbacks may answer or block a call before its tool runs.
+        and not invocation_context.agent.canonical_before_tool_callbacks
     ):
-      # Postprocess after calling the LLM.
-      async for event in self._postprocess_async(
-          invocation_context, llm_request, llm_response, model_response_event
+      prefetcher = ToolPrefetcher(invocation_context, llm_request.tools_dict)
+      llm_request.prefetch_read_only_tools = True
+    try:
+      async for llm_response in self._call_llm_async(
+          invocation_context, llm_request, model_response_event
       ):
-        # Update the mutable event id to avoid conflict
-        model_response_event.id = Event.new_id()
-        yield event
+        if prefetcher and llm_response.partial:
+          prefetcher.prefetch(llm_response)
+        # Postprocess after calling the LLM.
+        async for event in self._postprocess_async(
+            invocation_context,
+            llm_request,
+            llm_response,
+            model_response_event,
+            prefetcher=prefetcher,
+        ):
+          # Update the mutable event id to avoid conflict. The timestamp is
+          # kept, as it tells the events of one llm call apart.
+          model_response_event.id = Event.new_id()
+          yield event
+    finally:
+      if prefetcher:
+        prefetcher.cancel()
 
   async def _preprocess_async(
       self, invocation_context: InvocationContext, llm_request: LlmRequest
@@ -333,17 +368,22 @@ class BaseLlmFlow(ABC):
 
     # Runs processors.
     for processor in self.request_processors:
-      async for event in processor.run_async(invocation_context, llm_request):
+      async for event in metrics.record_phase_async_gen(
+          processor.run_async(invocation_context, llm_request),
+          metrics.PHASE_REQUEST_PROCESSOR,
+          type(processor).__name__,
+      ):
         yield event
 
     # Run processors for tools.
-    for tool in await agent.canonical_tools(
-        ReadonlyContext(invocation_context)
-    ):
-      tool_context = ToolContext(invocation_context)
-      await tool.process_llm_request(
-          tool_context=tool_context, llm_request=llm_request
-      )
+    with metrics.record_phase(metrics.PHASE_TOOL_RESOLUTION):
+      for tool in await agent.canonical_tools(
+          ReadonlyContext(invocation_context)
+      ):
+        tool_context = ToolContext(invocation_context)
+        await tool.process_llm_request(
+            tool_context=tool_context, llm_request=llm_request
+        )
 
   async def _postprocess_async(
       self,
@@ -351,6 +391,7 @@ class BaseLlmFlow(ABC):
       llm_request: LlmRequest,
       llm_response: LlmResponse,
       model_response_event: Event,
+      prefetcher: Optional[ToolPrefetcher] = None,
   ) -> AsyncGenerator[Event, None]:
     """Postprocess after calling the LLM.
 
@@ -359,6 +400,8 @@ class BaseLlmFlow(ABC):
       llm_request: The original LLM request.
       llm_response: The LLM response from the LLM call.
       model_response_event: A mutable event for the LLM response.
+      prefetcher: The prefetcher of the read-only tools called in partial
+        responses, if any.
 
     Yields:
       A generator of events.
@@ -385,10 +428,13 @@ class BaseLlmFlow(ABC):
     )
     yield model_response_event
 
-    # Handles function calls.
-    if model_response_event.get_function_calls():
+    # Handles function calls, which partial responses only announce.
+    if (
+        model_response_event.get_function_calls()
+        and not model_response_event.partial
+    ):
       async for event in self._postprocess_handle_function_calls_async(
-          invocation_context, model_response_event, llm_request
+          invocation_context, model_response_event, llm_request, prefetcher
       ):
         yield event
 
@@ -453,7 +499,11 @@ class BaseLlmFlow(ABC):
       self, invocation_context: InvocationContext, llm_response: LlmResponse
   ) -> AsyncGenerator[Event, None]:
     for processor in self.response_processors:
-      async for event in processor.run_async(invocation_context, llm_response):
+      async for event in metrics.record_phase_async_gen(
+          processor.run_async(invocation_context, llm_response),
+          metrics.PHASE_RESPONSE_PROCESSOR,
+          type(processor).__name__,
+      ):
         yield event
 
   async def _postprocess_handle_function_calls_async(
@@ -461,9 +511,13 @@ class BaseLlmFlow(ABC):
       invocation_context: InvocationContext,
       function_call_event: Event,
       llm_request: LlmRequest,
+      prefetcher: Optional[ToolPrefetcher] = None,
   ) -> AsyncGenerator[Event, None]:
     if function_response_event := await functions.handle_function_calls_async(
-        invocation_context, function_call_event, llm_request.tools_dict
+        invocation_context,
+        function_call_event,
+        llm_request.tools_dict,
+        prefetcher=prefetcher,
     ):
       auth_event = functions.generate_auth_event(
           invocation_context, function_response_event
@@ -480,6 +534,17 @@ class BaseLlmFlow(ABC):
         async for event in agent_to_run.run_async(invocation_context):
           yield event
 
+  def _create_token_limit_event(
+      self, invocation_context: InvocationContext, error_message: str
+  ) -> Event:
+    return Event(
+        invocation_id=invocation_context.invocation_id,
+        author=invocation_context.agent.name,
+        branch=invocation_context.branch,
+        error_code=TOKEN_LIMIT_EXCEEDED_ERROR_CODE,
+        error_message=error_message,
+    )
+
   def _get_agent_to_run(
       self, invocation_context: InvocationContext, agent_name: str
   ) -> BaseAgent:
@@ -532,28 +597,48 @@ class BaseLlmFlow(ABC):
           if llm_response.turn_complete:
             invocation_context.live_request_queue.close()
       else:
+        # Ends the invocation instead of making this llm call once a token
+        # limit is reached.
+        if error_message := invocation_context.enforce_token_limits():
+          yield LlmResponse(
+              error_code=TOKEN_LIMIT_EXCEEDED_ERROR_CODE,
+              error_message=error_message,
+          )
+          return
         # Check if we can make this llm call or not. If the current call pushes
         # the counter beyond the max set value, then the execution is stopped
         # right here, and exception is thrown.
         invocation_context.increment_llm_call_count()
-        async for llm_response in llm.generate_content_async(
-            llm_request,
-            stream=invocation_context.run_config.streaming_mode
-            == StreamingMode.SSE,
-        ):
-          trace_call_llm(
-              invocation_context,
-              model_response_event.id,
-              llm_request,
-              llm_response,
-          )
-          # Runs after_model_callback if it exists.
-          if altered_llm_response := await self._handle_after_model_callback(
-              invocation_context, llm_response, model_response_event
+        # Streamed responses report the usage so far, so only the last one
+        # counts.
+        usage_metadata = None
+        try:
+          async for llm_response in metrics.record_llm_call(
+              llm.generate_content_async(
+                  llm_request,
+                  stream=invocation_context.run_config.streaming_mode
+                  == StreamingMode.SSE,
+              ),
+              llm_request.model,
           ):
-            llm_response = altered_llm_response
+            trace_call_llm(
+                invocation_context,
+                model_response_event.id,
+                llm_request,
+                llm_response,
+            )
+            if llm_response.usage_metadata:
+              usage_metadata = llm_response.usage_metadata
+            # Runs after_model_callback if it exists.
+            if altered_llm_response := await self._handle_after_model_callback(
+                invocation_context, llm_response, model_response_event
+            ):
+              llm_response = altered_llm_response
 
-          yield llm_response
+            yield llm_response
+        finally:
+          if usage_metadata:
+            invocation_context.record_token_usage(usage_metadata)
 
   async def _handle_before_model_callback(
       self,
@@ -574,14 +659,15 @@ class BaseLlmFlow(ABC):
         invocation_context, event_actions=model_response_event.actions
     )
 
-    for callback in agent.canonical_before_model_callbacks:
-      before_model_callback_content = callback(
-          callback_context=callback_context, llm_request=llm_request
-      )
-      if inspect.isawaitable(before_model_callback_content):
-        before_model_callback_content = await before_model_callback_content
-      if before_model_callback_content:
-        return before_model_callback_content
+    with metrics.record_phase(metrics.PHASE_CALLBACK, 'before_model'):
+      for callback in agent.canonical_before_model_callbacks:
+        before_model_callback_content = callback(
+            callback_context=callback_context, llm_request=llm_request
+        )
+        if inspect.isawaitable(before_model_callback_content):
+          before_model_callback_content = await before_model_callback_content
+        if before_model_callback_content:
+          return before_model_callback_content
 
   async def _handle_after_model_callback(
       self,
@@ -602,14 +688,15 @@ class BaseLlmFlow(ABC):
         invocation_context, event_actions=model_response_event.actions
     )
 
-    for callback in agent.canonical_after_model_callbacks:
-      after_model_callback_content = callback(
-          callback_context=callback_context, llm_response=llm_response
-      )
-      if inspect.isawaitable(after_model_callback_content):
-        after_model_callback_content = await after_model_callback_content
-      if after_model_callback_content:
-        return after_model_callback_content
+    with metrics.record_phase(metrics.PHASE_CALLBACK, 'after_model'):
+      for callback in agent.canonical_after_model_callbacks:
+        after_model_callback_content = callback(
+            callback_context=callback_context, llm_response=llm_response
+        )
+        if inspect.isawaitable(after_model_callback_content):
+          after_model_callback_content = await after_model_callback_content
+        if after_model_callback_content:
+          return after_model_callback_content
 
   def _finalize_model_response_event(
       self,
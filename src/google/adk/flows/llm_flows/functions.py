@@ -23,10 +23,13 @@ from typing import Any
 from typing import AsyncGenerator
 from typing import cast
 from typing import Optional
+from typing import TYPE_CHECKING
 import uuid
 
 from google.genai import types
+from opentelemetry import trace
 
+from ... import metrics
 from ...agents.active_streaming_tool import ActiveStreamingTool
 from ...agents.invocation_context import InvocationContext
 from ...auth.auth_tool import AuthToolArguments
@@ -38,6 +41,9 @@ from ...telemetry import tracer
 from ...tools.base_tool import BaseTool
 from ...tools.tool_context import ToolContext
 
+if TYPE_CHECKING:
+  from ._tool_prefetcher import ToolPrefetcher
+
 AF_FUNCTION_CALL_ID_PREFIX = 'adk-'
 REQUEST_EUC_FUNCTION_CALL_NAME = 'adk_request_credential'
 
@@ -128,8 +134,12 @@ async def handle_function_calls_async(
     function_call_event: Event,
     tools_dict: dict[str, BaseTool],
     filters: Optional[set[str]] = None,
+    prefetcher: Optional[ToolPrefetcher] = None,
 ) -> Optional[Event]:
-  """Calls the functions and returns the function response event."""
+  """Calls the functions and returns the function response event.
+
+  Function calls that the prefetcher already started are not called again.
+  """
   from ...agents.llm_agent import LlmAgent
 
   agent = invocation_context.agent
@@ -148,39 +158,55 @@ async def handle_function_calls_async(
         function_call,
         tools_dict,
     )
+    prefetched = prefetcher.pop(function_call) if prefetcher else None
+    if prefetched:
+      tool_context = prefetched.tool_context
+      tool_context.function_call_id = function_call.id
+      # The prefetched tool already runs in the span of the call.
+      span = trace.use_span(prefetched.span, end_on_exit=True)
+    else:
+      span = tracer.start_as_current_span(f'execute_tool {tool.name}')
 
-    with tracer.start_as_current_span(f'execute_tool {tool.name}'):
+    with span:
       # do not use "args" as the variable name, because it is a reserved keyword
       # in python debugger.
       function_args = function_call.args or {}
       function_response: Optional[dict] = None
 
-      for callback in agent.canonical_before_tool_callbacks:
-        function_response = callback(
-            tool=tool, args=function_args, tool_context=tool_context
-        )
-        if inspect.isawaitable(function_response):
-          function_response = await function_response
-        if function_response:
-          break
+      if agent.canonical_before_tool_callbacks:
+        with metrics.record_phase(metrics.PHASE_CALLBACK, 'before_tool'):
+          for callback in agent.canonical_before_tool_callbacks:
+            function_response = callback(
+                tool=tool, args=function_args, tool_context=tool_context
+            )
+            if inspect.isawaitable(function_response):
+              function_response = await function_response
+            if function_response:
+              break
 
       if not function_response:
-        function_response = await __call_tool_async(
-            tool, args=function_args, tool_context=tool_context
-        )
-
-      for callback in agent.canonical_after_tool_callbacks:
-        altered_function_response = callback(
-            tool=tool,
-            args=function_args,
-            tool_context=tool_context,
-            tool_response=function_response,
-        )
-        if inspect.isawaitable(altered_function_response):
-          altered_function_response = await altered_function_response
-        if altered_function_response is not None:
-          function_response = altered_function_response
-          break
+        with metrics.record_phase(metrics.PHASE_TOOL, tool.name):
+          if prefetched:
+            function_response = await prefetched.task
+          else:
+            function_response = await __call_tool_async(
+                tool, args=function_args, tool_context=tool_context
+            )
+
+      if agent.canonical_after_tool_callbacks:
+        with metrics.record_phase(metrics.PHASE_CALLBACK, 'after_tool'):
+          for callback in agent.canonical_after_tool_callbacks:
+            altered_function_response = callback(
+                tool=tool,
+                args=function_args,
+                tool_context=tool_context,
+                tool_response=function_response,
+            )
+            if inspect.isawaitable(altered_function_response):
+              altered_function_response = await altered_function_response
+            if altered_function_response is not None:
+              function_response = altered_function_response
+              break
 
       if tool.is_long_running:
         # Allow long running function to return None to not provide function response.
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING
 
 from typing_extensions import override
 
+from ... import metrics
 from ...agents.readonly_context import ReadonlyContext
 from ...events.event import Event
 from ...sessions.state import State
@@ -61,9 +62,12 @@ class _InstructionsLlmRequestProcessor(BaseLlmRequestProcessor):
       )
       si = raw_si
       if not bypass_state_injection:
-        si = await instructions_utils.inject_session_state(
-            raw_si, ReadonlyContext(invocation_context)
-        )
+        with metrics.record_phase(
+            metrics.PHASE_INSTRUCTION_INJECTION, 'global_instruction'
+        ):
+          si = await instructions_utils.inject_session_state(
+              raw_si, ReadonlyContext(invocation_context)
+          )
       llm_request.append_instructions([si])
 
     # Appends agent instructions if set.
@@ -73,9 +77,12 @@ class _InstructionsLlmRequestProcessor(BaseLlmRequestProcessor):
       )
       si = raw_si
       if not bypass_state_injection:
-        si = await instructions_utils.inject_session_state(
-            raw_si, ReadonlyContext(invocation_context)
-        )
+        with metrics.record_phase(
+            metrics.PHASE_INSTRUCTION_INJECTION, 'instruction'
+        ):
+          si = await instructions_utils.inject_session_state(
+              raw_si, ReadonlyContext(invocation_context)
+          )
       llm_request.append_instructions([si])
 
     # Maintain async generator behavior
@@ -35,3 +35,13 @@ except ImportError:
       ' VertexAiRagMemoryService please install it. If not, you can ignore this'
       ' warning.'
   )
+
+try:
+  from .local_vector_memory_service import LocalVectorMemoryService
+
+  __all__.append('LocalVectorMemoryService')
+except ImportError:
+  logger.debug(
+      'NumPy is not installed. If you want to use the LocalVectorMemoryService'
+      ' please install it. If not, you can ignore this warning.'
+  )
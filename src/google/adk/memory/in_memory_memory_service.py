@@ -15,7 +15,11 @@
 
 from __future__ import annotations
 
+import collections
+import dataclasses
+import math
 import re
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -29,66 +33,167 @@ if TYPE_CHECKING:
   from ..events.event import Event
   from ..sessions.session import Session
 
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
 
 def _user_key(app_name: str, user_id: str):
   return f'{app_name}/{user_id}'
 
 
-def _extract_words_lower(text: str) -> set[str]:
+def _extract_words_lower(text: str) -> list[str]:
   """Extracts words from a string and converts them to lowercase."""
-  return set([word.lower() for word in re.findall(r'[A-Za-z]+', text)])
+  return [word.lower() for word in re.findall(r'[A-Za-z]+', text)]
+
+
+@dataclasses.dataclass
+class _IndexedEvent:
+  event: Event
+  term_frequencies: collections.Counter[str]
+  length: int
+  sequence: int
+  """Insertion order, used to break ties between equally ranked events."""
+
+
+class _UserIndex:
+  """An inverted index over the remembered events of one user."""
+
+  def __init__(self):
+    self.events: dict[tuple[str, int], _IndexedEvent] = {}
+    """Keys are (session_id, position of the event in the session)."""
+    self.session_lengths: dict[str, int] = {}
+    self.postings: dict[str, dict[tuple[str, int], int]] = {}
+    """Keys are tokens. Values map event refs to term frequencies."""
+    self.total_length = 0
+    self._next_sequence = 0
+
+  def add(self, ref: tuple[str, int], event: Event):
+    words = _extract_words_lower(
+        ' '.join([part.text for part in event.content.parts if part.text])
+    )
+    if not words:
+      return
+    term_frequencies = collections.Counter(words)
+    self.events[ref] = _IndexedEvent(
+        event=event,
+        term_frequencies=term_frequencies,
+        length=len(words),
+        sequence=self._next_sequence,
+    )
+    self._next_sequence += 1
+    self.total_length += len(words)
+    for word, frequency in term_frequencies.items():
+      self.postings.setdefault(word, {})[ref] = frequency
+
+  def remove(self, ref: tuple[str, int]):
+    indexed_event = self.events.pop(ref, None)
+    if not indexed_event:
+      return
+    self.total_length -= indexed_event.length
+    for word in indexed_event.term_frequencies:
+      posting = self.postings[word]
+      del posting[ref]
+      if not posting:
+        del self.postings[word]
+
+  def search(self, query: str, top_k: Optional[int]) -> list[_IndexedEvent]:
+    """Returns the events matching any query word, ranked by BM25."""
+    num_events = len(self.events)
+    if not num_events:
+      return []
+    average_length = self.total_length / num_events
+    scores: dict[tuple[str, int], float] = collections.defaultdict(float)
+    for word in set(_extract_words_lower(query)):
+      posting = self.postings.get(word)
+      if not posting:
+        continue
+      idf = math.log(
+          1 + (num_events - len(posting) + 0.5) / (len(posting) + 0.5)
+      )
+      for ref, frequency in posting.items():
+        length_norm = (
+            1 - _BM25_B + _BM25_B * (self.events[ref].length / average_length)
+        )
+        scores[ref] += (
+            idf
+            * frequency
+            * (_BM25_K1 + 1)
+            / (frequency + _BM25_K1 * length_norm)
+        )
+    ranked = sorted(
+        scores,
+        key=lambda ref: (-scores[ref], self.events[ref].sequence),
+    )
+    if top_k is not None:
+      ranked = ranked[:top_k]
+    return [self.events[ref] for ref in ranked]
 
 
 class InMemoryMemoryService(BaseMemoryService):
   """An in-memory memory service for prototyping purpose only.
 
-  Uses keyword matching instead of semantic search.
+  Uses keyword matching instead of semantic search. Events are indexed in an
+  inverted index when sessions are added, and search results are ranked by
+  BM25.
   """
 
-  def __init__(self):
-    self._session_events: dict[str, dict[str, list[Event]]] = {}
-    """Keys are app_name/user_id, session_id. Values are session event lists."""
+  def __init__(self, *, top_k: Optional[int] = None):
+    """Initializes the memory service.
+
+    Args:
+      top_k: The maximum number of memories returned by a search. All matching
+        memories are returned if None.
+    """
+    self._top_k = top_k
+    self._user_indexes: dict[str, _UserIndex] = {}
+    """Keys are app_name/user_id."""
 
   @override
   async def add_session_to_memory(self, session: Session):
-    user_key = _user_key(session.app_name, session.user_id)
-    self._session_events[user_key] = self._session_events.get(
-        _user_key(session.app_name, session.user_id), {}
+    user_index = self._user_indexes.setdefault(
+        _user_key(session.app_name, session.user_id), _UserIndex()
     )
-    self._session_events[user_key][session.id] = [
+    events = [
         event
         for event in session.events
         if event.content and event.content.parts
     ]
 
+    # Sessions are usually re-added after new events were appended, so only
+    # the events that are new or moved since the last add are re-indexed.
+    previous_length = user_index.session_lengths.get(session.id, 0)
+    for position in range(max(previous_length, len(events))):
+      ref = (session.id, position)
+      indexed_event = user_index.events.get(ref)
+      event = events[position] if position < len(events) else None
+      if (
+          indexed_event
+          and event
+          and indexed_event.event.id == event.id
+          and indexed_event.event.content == event.content
+      ):
+        continue
+      user_index.remove(ref)
+      if event:
+        user_index.add(ref, event)
+    user_index.session_lengths[session.id] = len(events)
+
   @override
   async def search_memory(
       self, *, app_name: str, user_id: str, query: str
   ) -> SearchMemoryResponse:
-    user_key = _user_key(app_name, user_id)
-    if user_key not in self._session_events:
+    user_index = self._user_indexes.get(_user_key(app_name, user_id))
+    if not user_index:
       return SearchMemoryResponse()
 
-    words_in_query = set(query.lower().split())
     response = SearchMemoryResponse()
-
-    for session_events in self._session_events[user_key].values():
-      for event in session_events:
-        if not event.content or not event.content.parts:
-          continue
-        words_in_event = _extract_words_lower(
-            ' '.join([part.text for part in event.content.parts if part.text])
-        )
-        if not words_in_event:
-          continue
-
-        if any(query_word in words_in_event for query_word in words_in_query):
-          response.memories.append(
-              MemoryEntry(
-                  content=event.content,
-                  author=event.author,
-                  timestamp=_utils.format_timestamp(event.timestamp),
-              )
+    for indexed_event in user_index.search(query, self._top_k):
+      event = indexed_event.event
+      response.memories.append(
+          MemoryEntry(
+              content=event.content,
+              author=event.author,
+              timestamp=_utils.format_timestamp(event.timestamp),
           )
-
+      )
     return response
@@ -0,0 +1,429 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+
+from google.genai import types
+import numpy as np
+from typing_extensions import override
+
+from . import _utils
+from ..utils._local_paths import encode_path_component
+from ..utils._local_paths import join_under_root
+from ..utils.feature_decorator import experimental
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+if TYPE_CHECKING:
+  from ..sessions.session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+EmbeddingFunction = Callable[
+    [list[str]],
+    Union[Sequence[Sequence[float]], Awaitable[Sequence[Sequence[float]]]],
+]
+"""Embeds a batch of texts. May be synchronous or asynchronous."""
+
+_VECTORS_FILE_NAME = 'vectors.f32'
+_ENTRIES_FILE_NAME = 'entries.jsonl'
+_METADATA_FILE_NAME = 'metadata.json'
+_KMEANS_ITERATIONS = 10
+
+
+class HashingEmbedder:
+  """A deterministic embedder based on feature hashing of lowercase words.
+
+  It needs no model or network access, which makes it suitable for tests and
+  for prototyping. Texts sharing words get similar embeddings, but there is no
+  semantic understanding.
+  """
+
+  def __init__(self, dimensions: int = 256):
+    self.dimensions = dimensions
+
+  def __call__(self, texts: list[str]) -> np.ndarray:
+    embeddings = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+      for word in re.findall(r'[a-z0-9]+', text.lower()):
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little')
+        sign = 1.0 if value & 1 else -1.0
+        embeddings[row, (value >> 1) % self.dimensions] += sign
+    return embeddings
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+  norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+  norms[norms == 0] = 1.0
+  return vectors / norms
+
+
+class _IvfIndex:
+  """An inverted file index: rows are bucketed by their nearest centroid.
+
+  A search only scores the rows in the buckets of the `nprobe` centroids
+  closest to the query, trading a little recall for sublinear search time.
+  """
+
+  def __init__(self, matrix: np.ndarray, nprobe: int):
+    self.nprobe = nprobe
+    self.built_size = len(matrix)
+    num_lists = max(1, int(np.sqrt(len(matrix))))
+    rng = np.random.default_rng(0)
+    centroids = matrix[
+        rng.choice(len(matrix), size=num_lists, replace=False)
+    ].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+      assignments = np.argmax(matrix @ centroids.T, axis=1)
+      for i in range(num_lists):
+        members = matrix[assignments == i]
+        if len(members):
+          centroids[i] = members.mean(axis=0)
+      centroids = _normalize(centroids)
+    self.centroids = centroids
+    assignments = np.argmax(matrix @ centroids.T, axis=1)
+    self.lists: list[list[int]] = [
+        np.flatnonzero(assignments == i).tolist() for i in range(num_lists)
+    ]
+
+  def add(self, first_row: int, vectors: np.ndarray):
+    for offset, list_id in enumerate(
+        np.argmax(vectors @ self.centroids.T, axis=1)
+    ):
+      self.lists[list_id].append(first_row + offset)
+
+  def candidates(self, query: np.ndarray) -> np.ndarray:
+    nprobe = min(self.nprobe, len(self.centroids))
+    closest = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+    return np.fromiter(
+        (row for list_id in closest for row in self.lists[list_id]),
+        dtype=np.int64,
+    )
+
+
+class _VectorStore:
+  """The embeddings and memory entries of one user.
+
+  Embeddings are kept as a float32 matrix in two parts: the rows loaded from
+  disk, which stay memory-mapped, and the rows added since, which live in a
+  growable in-memory buffer.
+
+  The store does blocking file I/O in `load` and `append_to_disk`, which are
+  meant to be run in a worker thread.
+  """
+
+  def __init__(self, directory: Optional[str], dimensions: int):
+    self.directory = directory
+    self.dimensions = dimensions
+    self.entries: list[dict[str, Any]] = []
+    self.event_keys: set[tuple[str, str]] = set()
+    self.loaded = np.zeros((0, dimensions), dtype=np.float32)
+    self.appended = np.zeros((0, dimensions), dtype=np.float32)
+    self.num_appended = 0
+    self.ivf: Optional[_IvfIndex] = None
+    # Serializes adds, so that the files are appended to in order.
+    self.add_lock = asyncio.Lock()
+
+  def __len__(self) -> int:
+    return len(self.loaded) + self.num_appended
+
+  def matrix(self) -> np.ndarray:
+    if not self.num_appended:
+      return self.loaded
+    if not len(self.loaded):
+      return self.appended[: self.num_appended]
+    return np.concatenate(
+        [self.loaded, self.appended[: self.num_appended]], axis=0
+    )
+
+  def add(self, entries: list[dict[str, Any]], vectors: np.ndarray):
+    first_row = len(self)
+    if self.num_appended + len(vectors) > len(self.appended):
+      capacity = max(
+          2 * len(self.appended), self.num_appended + len(vectors), 64
+      )
+      grown = np.zeros((capacity, self.dimensions), dtype=np.float32)
+      grown[: self.num_appended] = self.appended[: self.num_appended]
+      self.appended = grown
+    self.appended[self.num_appended : self.num_appended + len(vectors)] = (
+        vectors
+    )
+    self.num_appended += len(vectors)
+    self.entries.extend(entries)
+    for entry in entries:
+      self.event_keys.add((entry['session_id'], entry['event_id']))
+    if self.ivf:
+      self.ivf.add(first_row, vectors)
+
+  def scores(self, query: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+    if rows is None:
+      parts = [self.loaded @ query]
+      if self.num_appended:
+        parts.append(self.appended[: self.num_appended] @ query)
+      return np.concatenate(parts)
+    split = len(self.loaded)
+    scores = np.empty(len(rows), dtype=np.float32)
+    in_loaded = rows < split
+    scores[in_loaded] = self.loaded[rows[in_loaded]] @ query
+    scores[~in_loaded] = self.appended[rows[~in_loaded] - split] @ query
+    return scores
+
+  def load(self):
+    vectors_path = os.path.join(self.directory, _VECTORS_FILE_NAME)
+    entries_path = os.path.join(self.directory, _ENTRIES_FILE_NAME)
+    if not os.path.exists(vectors_path) or not os.path.exists(entries_path):
+      return
+    self._check_dimensions()
+    entries = []
+    with open(entries_path, 'r', encoding='utf-8') as f:
+      for line in f:
+        try:
+          entries.append(json.loads(line))
+        except ValueError:
+          break
+    row_bytes = self.dimensions * np.dtype(np.float32).itemsize
+    num_rows = min(os.path.getsize(vectors_path) // row_bytes, len(entries))
+    if num_rows:
+      self.loaded = np.memmap(
+          vectors_path,
+          dtype=np.float32,
+          mode='r',
+          shape=(num_rows, self.dimensions),
+      )
+    self.entries = entries[:num_rows]
+    self.event_keys = {
+        (entry['session_id'], entry['event_id']) for entry in self.entries
+    }
+    if num_rows != len(entries) or num_rows * row_bytes != os.path.getsize(
+        vectors_path
+    ):
+      # A previous append was interrupted; drop the partial tail.
+      logger.warning('Truncating incomplete memory store in %s', self.directory)
+      with open(vectors_path, 'r+b') as f:
+        f.truncate(num_rows * row_bytes)
+      with open(entries_path, 'w', encoding='utf-8') as f:
+        for entry in self.entries:
+          f.write(json.dumps(entry) + '\n')
+
+  def _check_dimensions(self):
+    metadata_path = os.path.join(self.directory, _METADATA_FILE_NAME)
+    if not os.path.exists(metadata_path):
+      return
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+      dimensions = json.load(f)['dimensions']
+    if dimensions != self.dimensions:
+      # Reading the rows with other dimensions would garble the embeddings,
+      # and the size mismatch would be mistaken for an interrupted append.
+      raise ValueError(
+          f'The memory store in {self.directory} holds embeddings of'
+          f' {dimensions} dimensions, but the embedding function produces'
+          f' {self.dimensions}.'
+      )
+
+  def append_to_disk(self, entries: list[dict[str, Any]], vectors: np.ndarray):
+    os.makedirs(self.directory, exist_ok=True)
+    metadata_path = os.path.join(self.directory, _METADATA_FILE_NAME)
+    if not os.path.exists(metadata_path):
+      with open(metadata_path, 'w', encoding='utf-8') as f:
+        json.dump({'dimensions': self.dimensions}, f)
+    # Vectors are written first, so that an entry on disk always has its
+    # vector; rows without an entry are truncated on load.
+    with open(os.path.join(self.directory, _VECTORS_FILE_NAME), 'ab') as f:
+      f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+    with open(
+        os.path.join(self.directory, _ENTRIES_FILE_NAME), 'a', encoding='utf-8'
+    ) as f:
+      for entry in entries:
+        f.write(json.dumps(entry) + '\n')
+
+
+@experimental
+class LocalVectorMemoryService(BaseMemoryService):
+  """A memory service that searches event embeddings locally.
+
+  Each event with text is embedded with `embedding_function` and stored, per
+  app and user, in a float32 matrix of unit vectors. Searches compute the
+  cosine similarity to every stored event with a single matrix-vector product
+  and return the `top_k` best matches. Once a user has more than
+  `ann_threshold` memories, searches go through an inverted file (IVF) index
+  that only scores the events closest to the query.
+
+  If `persist_dir` is set, each user's memories are appended to a raw float32
+  matrix file and a JSON lines file of memory entries under
+  `<persist_dir>/<app_name>/<user_id>/`. On startup the matrix is memory-mapped
+  rather than read, so loading is zero-copy. The dimensions of the embeddings
+  are recorded along with them, and loading memories of other dimensions
+  raises a ValueError. App names and user IDs that are
+  empty, "." or ".." are then rejected with a ValueError, so that memories
+  are never stored outside of `persist_dir`.
+  """
+
+  def __init__(
+      self,
+      *,
+      embedding_function: Optional[EmbeddingFunction] = None,
+      dimensions: int = 256,
+      persist_dir: Optional[str] = None,
+      top_k: int = 10,
+      ann_threshold: Optional[int] = 10000,
+      nprobe: int = 8,
+  ):
+    """Initializes the memory service.
+
+    Args:
+      embedding_function: Embeds a batch of texts into vectors of
+        `dimensions` floats. Defaults to a `HashingEmbedder`.
+      dimensions: The number of dimensions of the embeddings.
+      persist_dir: Directory to persist memories in. Memories are kept in
+        memory only if None.
+      top_k: The maximum number of memories returned by a search.
+      ann_threshold: The number of memories of a user past which searches use
+        an approximate IVF index. Searches are always exact if None.
+      nprobe: The number of IVF buckets scored by an approximate search.
+    """
+    self._embedding_function = embedding_function or HashingEmbedder(dimensions)
+    self._dimensions = dimensions
+    self._persist_dir = persist_dir
+    self._top_k = top_k
+    self._ann_threshold = ann_threshold
+    self._nprobe = nprobe
+    self._stores: dict[tuple[str, str], _VectorStore] = {}
+    self._stores_lock: Optional[asyncio.Lock] = None
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    store = await self._get_store(session.app_name, session.user_id)
+    entries = []
+    texts = []
+    for event in session.events:
+      if (session.id, event.id) in store.event_keys:
+        continue
+      if not event.content or not event.content.parts:
+        continue
+      text = ' '.join([part.text for part in event.content.parts if part.text])
+      if not text:
+        continue
+      entries.append({
+          'session_id': session.id,
+          'event_id': event.id,
+          'author': event.author,
+          'timestamp': _utils.format_timestamp(event.timestamp),
+          'content': event.content.model_dump(exclude_none=True, mode='json'),
+      })
+      texts.append(text)
+    if not texts:
+      return
+
+    vectors = await self._embed(texts)
+    async with store.add_lock:
+      # Another add of the same session may have completed while embedding.
+      keep = [
+          i
+          for i, entry in enumerate(entries)
+          if (entry['session_id'], entry['event_id']) not in store.event_keys
+      ]
+      if not keep:
+        return
+      entries = [entries[i] for i in keep]
+      vectors = vectors[keep]
+      if store.directory:
+        await asyncio.to_thread(store.append_to_disk, entries, vectors)
+      store.add(entries, vectors)
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    store = await self._get_store(app_name, user_id)
+    if not len(store):
+      return SearchMemoryResponse()
+    query_vector = (await self._embed([query]))[0]
+
+    rows = None
+    if self._ann_threshold is not None and len(store) > self._ann_threshold:
+      if not store.ivf or len(store) > 2 * store.ivf.built_size:
+        store.ivf = _IvfIndex(store.matrix(), self._nprobe)
+      rows = store.ivf.candidates(query_vector)
+    scores = store.scores(query_vector, rows)
+    if rows is None:
+      rows = np.arange(len(scores))
+
+    top_k = min(self._top_k, len(scores))
+    if not top_k:
+      # The probed IVF buckets may all be empty.
+      return SearchMemoryResponse()
+    best = np.argpartition(-scores, top_k - 1)[:top_k]
+    best = best[np.argsort(-scores[best], kind='stable')]
+
+    response = SearchMemoryResponse()
+    for i in best:
+      if scores[i] <= 0:
+        break
+      entry = store.entries[rows[i]]
+      response.memories.append(
+          MemoryEntry(
+              content=types.Content.model_validate(entry['content']),
+              author=entry['author'],
+              timestamp=entry['timestamp'],
+          )
+      )
+    return response
+
+  async def _get_store(self, app_name: str, user_id: str) -> _VectorStore:
+    key = (app_name, user_id)
+    if self._stores_lock is None:
+      self._stores_lock = asyncio.Lock()
+    async with self._stores_lock:
+      if key not in self._stores:
+        directory = None
+        if self._persist_dir:
+          directory = join_under_root(
+              self._persist_dir,
+              encode_path_component(app_name),
+              encode_path_component(user_id),
+          )
+        store = _VectorStore(directory, self._dimensions)
+        if directory:
+          await asyncio.to_thread(store.load)
+        self._stores[key] = store
+    return self._stores[key]
+
+  async def _embed(self, texts: list[str]) -> np.ndarray:
+    embeddings = self._embedding_function(texts)
+    if inspect.isawaitable(embeddings):
+      embeddings = await embeddings
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if vectors.shape != (len(texts), self._dimensions):
+      raise ValueError(
+          f'Expected embeddings of shape {(len(texts), self._dimensions)}, got'
+          f' {vectors.shape}.'
+      )
+    return _normalize(vectors)
@@ -0,0 +1,191 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""OpenTelemetry metrics for the phases of an agent run.
+
+Every phase records its duration to the `adk.phase.duration` histogram,
+with the phase in the `adk.phase` attribute and, where there are several of a
+kind (request processors, tools, callbacks, loop agents), which one in
+`adk.phase.name`.
+Failed phases also increment the `adk.phase.errors` counter.
+
+Model calls additionally record the time to the first response chunk to
+`adk.llm.time_to_first_token` and the token usage to `adk.llm.tokens`.
+
+Metrics go to the global meter provider unless another one is set with
+`set_meter_provider`. Without an OpenTelemetry SDK, recording is a no-op.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import AsyncGenerator
+from typing import Iterator
+from typing import Optional
+from typing import TypeVar
+
+from opentelemetry import metrics
+
+from .models.llm_response import LlmResponse
+
+_METER_NAME = 'gcp.vertex.agent'
+
+PHASE_SESSION_FETCH = 'session_fetch'
+PHASE_APPEND_EVENT = 'append_event'
+PHASE_REQUEST_PROCESSOR = 'request_processor'
+PHASE_RESPONSE_PROCESSOR = 'response_processor'
+PHASE_INSTRUCTION_INJECTION = 'instruction_injection'
+PHASE_TOOL_RESOLUTION = 'tool_resolution'
+PHASE_MODEL = 'model'
+PHASE_TOOL = 'tool'
+PHASE_CALLBACK = 'callback'
+PHASE_LOOP_ITERATION = 'loop_iteration'
+
+_T = TypeVar('_T')
+
+
+class _Instruments:
+
+  def __init__(self, meter: metrics.Meter):
+    self.phase_duration = meter.create_histogram(
+        'adk.phase.duration',
+        unit='s',
+        description='Duration of a phase of an agent run.',
+    )
+    self.phase_errors = meter.create_counter(
+        'adk.phase.errors',
+        description='Number of phases of an agent run that raised.',
+    )
+    self.time_to_first_token = meter.create_histogram(
+        'adk.llm.time_to_first_token',
+        unit='s',
+        description='Time from sending an LLM request to its first response.',
+    )
+    self.tokens = meter.create_counter(
+        'adk.llm.tokens',
+        unit='{token}',
+        description='Number of tokens used by LLM calls.',
+    )
+
+
+_meter_provider: Optional[metrics.MeterProvider] = None
+_instruments: Optional[_Instruments] = None
+
+
+def set_meter_provider(meter_provider: Optional[metrics.MeterProvider]):
+  """Sets the meter provider the Agent Development Kit records metrics to.
+
+  Args:
+    meter_provider: The meter provider, or None to use the global one.
+  """
+  global _meter_provider, _instruments
+  _meter_provider = meter_provider
+  _instruments = None
+
+
+def get_meter_provider() -> metrics.MeterProvider:
+  """Returns the meter provider the Agent Development Kit records metrics to."""
+  return _meter_provider or metrics.get_meter_provider()
+
+
+def _get_instruments() -> _Instruments:
+  global _instruments
+  if _instruments is None:
+    _instruments = _Instruments(get_meter_provider().get_meter(_METER_NAME))
+  return _instruments
+
+
+def _phase_attributes(phase: str, name: Optional[str]) -> dict[str, str]:
+  if name is None:
+    return {'adk.phase': phase}
+  return {'adk.phase': phase, 'adk.phase.name': name}
+
+
+@contextlib.contextmanager
+def record_phase(phase: str, name: Optional[str] = None) -> Iterator[None]:
+  """Records the duration of the enclosed block as a phase."""
+  instruments = _get_instruments()
+  attributes = _phase_attributes(phase, name)
+  start = time.perf_counter()
+  try:
+    yield
+  except BaseException:
+    instruments.phase_errors.add(1, attributes)
+    raise
+  finally:
+    instruments.phase_duration.record(time.perf_counter() - start, attributes)
+
+
+async def record_phase_async_gen(
+    agen: AsyncGenerator[_T, None], phase: str, name: Optional[str] = None
+) -> AsyncGenerator[_T, None]:
+  """Re-yields an async generator, recording the time spent inside it.
+
+  Only the time spent producing items counts towards the phase, not the time
+  the consumer holds on to them.
+  """
+  instruments = _get_instruments()
+  attributes = _phase_attributes(phase, name)
+  elapsed = 0.0
+  try:
+    while True:
+      start = time.perf_counter()
+      try:
+        item = await agen.__anext__()
+      except StopAsyncIteration:
+        elapsed += time.perf_counter() - start
+        break
+      except BaseException:
+        elapsed += time.perf_counter() - start
+        instruments.phase_errors.add(1, attributes)
+        raise
+      elapsed += time.perf_counter() - start
+      yield item
+  finally:
+    await agen.aclose()
+    instruments.phase_duration.record(elapsed, attributes)
+
+
+async def record_llm_call(
+    responses: AsyncGenerator[LlmResponse, None], model: Optional[str]
+) -> AsyncGenerator[LlmResponse, None]:
+  """Re-yields the responses of an LLM call, recording its metrics."""
+  instruments = _get_instruments()
+  model_attributes = {'gen_ai.request.model': model or ''}
+  usage_metadata = None
+  start = time.perf_counter()
+  first_response = True
+  async for llm_response in record_phase_async_gen(
+      responses, PHASE_MODEL, model
+  ):
+    if first_response:
+      instruments.time_to_first_token.record(
+          time.perf_counter() - start, model_attributes
+      )
+      first_response = False
+    if llm_response.usage_metadata is not None:
+      usage_metadata = llm_response.usage_metadata
+    yield llm_response
+  if usage_metadata is not None:
+    if usage_metadata.prompt_token_count:
+      instruments.tokens.add(
+          usage_metadata.prompt_token_count,
+          {**model_attributes, 'gen_ai.token.type': 'input'},
+      )
+    if usage_metadata.candidates_token_count:
+      instruments.tokens.add(
+          usage_metadata.candidates_token_count,
+          {**model_attributes, 'gen_ai.token.type': 'output'},
+      )
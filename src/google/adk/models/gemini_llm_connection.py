@@ -133,6 +133,16 @@ class GeminiLlmConnection(BaseLlmConnection):
     text = ''
     async for message in self._gemini_session.receive():
       logger.debug('Got LLM Live message: %s', message)
+      if message.usage_metadata:
+        yield LlmResponse(
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=message.usage_metadata.prompt_token_count,
+                candidates_token_count=(
+                    message.usage_metadata.response_token_count
+                ),
+                total_token_count=message.usage_metadata.total_token_count,
+            )
+        )
       if message.server_content:
         content = message.server_content.model_turn
         if content and content.parts:
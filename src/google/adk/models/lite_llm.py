@@ -736,6 +736,7 @@ class LiteLlm(BaseLlm):
 
             if chunk.name:
               function_calls[index]["name"] += chunk.name
+            args_completed = False
             if chunk.args:
               function_calls[index]["args"] += chunk.args
 
@@ -744,12 +745,43 @@ class LiteLlm(BaseLlm):
               try:
                 json.loads(function_calls[index]["args"])
                 fallback_index += 1
+                args_completed = True
               except json.JSONDecodeError:
                 pass
 
             function_calls[index]["id"] = (
                 chunk.id or function_calls[index]["id"] or str(index)
             )
+            func_data = function_calls[index]
+            tool = llm_request.tools_dict.get(func_data["name"])
+            if (
+                args_completed
+                and llm_request.prefetch_read_only_tools
+                and tool
+                and tool.is_read_only
+                and not tool.is_long_running
+            ):
+              # Announces the call before the stream ends, so that the
+              # read-only tool can start early. The aggregated response
+              # confirms it.
+              yield _message_to_generate_content_response(
+                  ChatCompletionAssistantMessage(
+                      role="assistant",
+                      content=None,
+                      tool_calls=[
+                          ChatCompletionMessageToolCall(
+                              type="function",
+                              id=func_data["id"],
+                              function=Function(
+                                  name=func_data["name"],
+                                  arguments=func_data["args"],
+                                  index=index,
+                              ),
+                          )
+                      ],
+                  ),
+                  is_partial=True,
+              )
           elif isinstance(chunk, TextChunk):
             text += chunk.text
             yield _message_to_generate_content_response(
@@ -34,6 +34,7 @@ class LlmRequest(BaseModel):
     contents: The contents to send to the model.
     config: Additional config for the generate content request.
     tools_dict: The tools dictionary.
+    prefetch_read_only_tools: Whether read-only tools are prefetched.
   """
 
   model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -54,6 +55,14 @@ class LlmRequest(BaseModel):
   tools_dict: dict[str, BaseTool] = Field(default_factory=dict, exclude=True)
   """The tools dictionary."""
 
+  prefetch_read_only_tools: bool = Field(default=False, exclude=True)
+  """Whether the flow starts read-only tools as soon as a streamed partial
+  response has a complete call to them.
+
+  Models that only report function calls at the end of a stream may then
+  announce calls to read-only tools early in partial responses.
+  """
+
   def append_instructions(self, instructions: list[str]) -> None:
     """Appends instructions to the system instruction.
 
@@ -24,6 +24,7 @@ import warnings
 
 from google.genai import types
 
+from . import metrics
 from .agents.active_streaming_tool import ActiveStreamingTool
 from .agents.base_agent import BaseAgent
 from .agents.invocation_context import InvocationContext
@@ -178,9 +179,10 @@ class Runner:
       The events generated by the agent.
     """
     with tracer.start_as_current_span('invocation'):
-      session = await self.session_service.get_session(
-          app_name=self.app_name, user_id=user_id, session_id=session_id
-      )
+      with metrics.record_phase(metrics.PHASE_SESSION_FETCH):
+        session = await self.session_service.get_session(
+            app_name=self.app_name, user_id=user_id, session_id=session_id
+        )
       if not session:
         raise ValueError(f'Session not found: {session_id}')
 
@@ -202,7 +204,10 @@ class Runner:
       invocation_context.agent = self._find_agent_to_run(session, root_agent)
       async for event in invocation_context.agent.run_async(invocation_context):
         if not event.partial:
-          await self.session_service.append_event(session=session, event=event)
+          with metrics.record_phase(metrics.PHASE_APPEND_EVENT):
+            await self.session_service.append_event(
+                session=session, event=event
+            )
         yield event
 
   async def _append_new_message_to_session(
@@ -247,7 +252,8 @@ class Runner:
         author='user',
         content=new_message,
     )
-    await self.session_service.append_event(session=session, event=event)
+    with metrics.record_phase(metrics.PHASE_APPEND_EVENT):
+      await self.session_service.append_event(session=session, event=event)
 
   async def run_live(
       self,
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 from typing import Any
 
 
@@ -63,6 +64,15 @@ class State:
     self._value.update(delta)
     self._delta.update(delta)
 
+  def copy_on_write(self) -> collections.ChainMap[str, Any]:
+    """Returns a snapshot of the state dict that keeps its own changes apart.
+
+    Reads see the value with the delta applied as of this call; later changes
+    to the state are not visible, and writes to the snapshot do not change the
+    state. Writes are kept in the first map of the returned ChainMap.
+    """
+    return collections.ChainMap({}, self.to_dict())
+
   def to_dict(self) -> dict[str, Any]:
     """Returns the state dict."""
     result = {}
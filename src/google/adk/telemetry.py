@@ -23,8 +23,12 @@
 
 from __future__ import annotations
 
+import enum
 import json
+import logging
+import os
 from typing import Any
+from typing import Optional
 
 from google.genai import types
 from opentelemetry import trace
@@ -35,8 +39,129 @@ from .models.llm_request import LlmRequest
 from .models.llm_response import LlmResponse
 from .tools.base_tool import BaseTool
 
+logger = logging.getLogger('google_adk.' + __name__)
+
 tracer = trace.get_tracer('gcp.vertex.agent')
 
+_TELEMETRY_LEVEL_ENV_VARIABLE_NAME = 'ADK_TELEMETRY_LEVEL'
+_MAX_PAYLOAD_CHARS_ENV_VARIABLE_NAME = 'ADK_TELEMETRY_MAX_PAYLOAD_CHARS'
+
+_UNCHANGED: Any = object()
+"""Marks an argument of set_telemetry_level that keeps its current value."""
+
+
+class TelemetryLevel(enum.Enum):
+  """How much the Agent Development Kit records on its spans."""
+
+  OFF = 'off'
+  """No attributes are recorded."""
+
+  METADATA = 'metadata'
+  """Ids, names, model and token usage, but no request or response payloads."""
+
+  FULL = 'full'
+  """Metadata and the serialized request and response payloads."""
+
+
+def _level_from_env() -> TelemetryLevel:
+  value = os.environ.get(_TELEMETRY_LEVEL_ENV_VARIABLE_NAME)
+  if not value:
+    return TelemetryLevel.FULL
+  try:
+    return TelemetryLevel(value.strip().lower())
+  except ValueError:
+    logger.warning(
+        'Ignoring invalid %s=%r, expected one of %s. Using %r.',
+        _TELEMETRY_LEVEL_ENV_VARIABLE_NAME,
+        value,
+        [level.value for level in TelemetryLevel],
+        TelemetryLevel.FULL.value,
+    )
+    return TelemetryLevel.FULL
+
+
+def _max_payload_chars_from_env() -> Optional[int]:
+  value = os.environ.get(_MAX_PAYLOAD_CHARS_ENV_VARIABLE_NAME)
+  if not value:
+    return None
+  try:
+    return int(value)
+  except ValueError:
+    logger.warning(
+        'Ignoring invalid %s=%r, expected an integer. Payloads are not'
+        ' truncated.',
+        _MAX_PAYLOAD_CHARS_ENV_VARIABLE_NAME,
+        value,
+    )
+    return None
+
+
+_telemetry_level = _level_from_env()
+_max_payload_chars = _max_payload_chars_from_env()
+
+
+def set_telemetry_level(
+    level: TelemetryLevel | str,
+    *,
+    max_payload_chars: Optional[int] = _UNCHANGED,
+) -> None:
+  """Sets how much is recorded on the spans of the Agent Development Kit.
+
+  Defaults to the `ADK_TELEMETRY_LEVEL` and `ADK_TELEMETRY_MAX_PAYLOAD_CHARS`
+  environment variables, or full payloads without a cap if they are unset.
+
+  Args:
+    level: The telemetry level, or its string value.
+    max_payload_chars: Payload attributes longer than this are truncated. None
+      means no cap. The current cap is kept if omitted.
+  """
+  global _telemetry_level, _max_payload_chars
+  _telemetry_level = TelemetryLevel(level)
+  if max_payload_chars is not _UNCHANGED:
+    _max_payload_chars = max_payload_chars
+
+
+def get_telemetry_level() -> TelemetryLevel:
+  """Returns the current telemetry level."""
+  return _telemetry_level
+
+
+def _get_recording_span() -> Optional[trace.Span]:
+  """Returns the current span if attributes should be recorded on it.
+
+  Spans that are not sampled, or that belong to the no-op tracer used when no
+  tracer provider is configured, are not recording. Nothing is serialized for
+  them.
+  """
+  if _telemetry_level is TelemetryLevel.OFF:
+    return None
+  span = trace.get_current_span()
+  if not span.is_recording():
+    return None
+  return span
+
+
+def _should_record_payloads() -> bool:
+  return _telemetry_level is TelemetryLevel.FULL
+
+
+def _cap_payload(payload: str) -> str:
+  """Truncates a payload that is too long, keeping the attribute valid JSON.
+
+  A truncated payload is replaced by a JSON object with its original length
+  and its first `max_payload_chars` characters as a string.
+  """
+  if _max_payload_chars is None or len(payload) <= _max_payload_chars:
+    return payload
+  return json.dumps(
+      {
+          'truncated': True,
+          'length': len(payload),
+          'prefix': payload[:_max_payload_chars],
+      },
+      ensure_ascii=False,
+  )
+
 
 def _safe_json_serialize(obj) -> str:
   """Convert any Python object to a JSON-serializable type or string.
@@ -69,7 +194,9 @@ def trace_tool_call(
     args: The arguments to the tool call.
     function_response_event: The event with the function response details.
   """
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if span is None:
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', tool.name)
@@ -85,24 +212,26 @@ def trace_tool_call(
       tool_response = function_response.response
 
   span.set_attribute('gen_ai.tool.call.id', tool_call_id)
+  span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
+  # Setting empty llm request and response (as UI expect these) while not
+  # applicable for tool_response.
+  span.set_attribute('gcp.vertex.agent.llm_request', '{}')
+  span.set_attribute(
+      'gcp.vertex.agent.llm_response',
+      '{}',
+  )
+  if not _should_record_payloads():
+    return
 
   if not isinstance(tool_response, dict):
     tool_response = {'result': tool_response}
   span.set_attribute(
       'gcp.vertex.agent.tool_call_args',
-      _safe_json_serialize(args),
+      _cap_payload(_safe_json_serialize(args)),
   )
-  span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
   span.set_attribute(
       'gcp.vertex.agent.tool_response',
-      _safe_json_serialize(tool_response),
-  )
-  # Setting empty llm request and response (as UI expect these) while not
-  # applicable for tool_response.
-  span.set_attribute('gcp.vertex.agent.llm_request', '{}')
-  span.set_attribute(
-      'gcp.vertex.agent.llm_response',
-      '{}',
+      _cap_payload(_safe_json_serialize(tool_response)),
   )
 
 
@@ -120,15 +249,26 @@ def trace_merged_tool_calls(
     function_response_event: The merged response event.
   """
 
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if span is None:
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', '(merged tools)')
   span.set_attribute('gen_ai.tool.description', '(merged tools)')
   span.set_attribute('gen_ai.tool.call.id', response_event_id)
+  span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
+  # Setting empty llm request and response (as UI expect these) while not
+  # applicable for tool_response.
+  span.set_attribute('gcp.vertex.agent.llm_request', '{}')
+  span.set_attribute(
+      'gcp.vertex.agent.llm_response',
+      '{}',
+  )
+  if not _should_record_payloads():
+    return
 
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
-  span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
   try:
     function_response_event_json = function_response_event.model_dumps_json(
         exclude_none=True
@@ -138,14 +278,7 @@ def trace_merged_tool_calls(
 
   span.set_attribute(
       'gcp.vertex.agent.tool_response',
-      function_response_event_json,
-  )
-  # Setting empty llm request and response (as UI expect these) while not
-  # applicable for tool_response.
-  span.set_attribute('gcp.vertex.agent.llm_request', '{}')
-  span.set_attribute(
-      'gcp.vertex.agent.llm_response',
-      '{}',
+      _cap_payload(function_response_event_json),
   )
 
 
@@ -166,7 +299,9 @@ def trace_call_llm(
     llm_request: The LLM request object.
     llm_response: The LLM response object.
   """
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if span is None:
+    return
   # Special standard Open Telemetry GenaI attributes that indicate
   # that this is a span related to a Generative AI system.
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
@@ -178,10 +313,28 @@ def trace_call_llm(
       'gcp.vertex.agent.session_id', invocation_context.session.id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+
+  if llm_response.usage_metadata is not None:
+    span.set_attribute(
+        'gen_ai.usage.input_tokens',
+        llm_response.usage_metadata.prompt_token_count,
+    )
+    span.set_attribute(
+        'gen_ai.usage.output_tokens',
+        llm_response.usage_metadata.total_token_count,
+    )
+
+  if not _should_record_payloads():
+    # The UI expects the llm request and response attributes to be set.
+    span.set_attribute('gcp.vertex.agent.llm_request', '{}')
+    span.set_attribute('gcp.vertex.agent.llm_response', '{}')
+    return
   # Consider removing once GenAI SDK provides a way to record this info.
   span.set_attribute(
       'gcp.vertex.agent.llm_request',
-      _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
+      _cap_payload(
+          _safe_json_serialize(_build_llm_request_for_trace(llm_request))
+      ),
   )
   # Consider removing once GenAI SDK provides a way to record this info.
 
@@ -192,19 +345,9 @@ def trace_call_llm(
 
   span.set_attribute(
       'gcp.vertex.agent.llm_response',
-      llm_response_json,
+      _cap_payload(llm_response_json),
   )
 
-  if llm_response.usage_metadata is not None:
-    span.set_attribute(
-        'gen_ai.usage.input_tokens',
-        llm_response.usage_metadata.prompt_token_count,
-    )
-    span.set_attribute(
-        'gen_ai.usage.output_tokens',
-        llm_response.usage_metadata.total_token_count,
-    )
-
 
 def trace_send_data(
     invocation_context: InvocationContext,
@@ -221,21 +364,27 @@ def trace_send_data(
     event_id: The ID of the event.
     data: A list of content objects.
   """
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if span is None:
+    return
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+  if not _should_record_payloads():
+    return
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
   span.set_attribute(
       'gcp.vertex.agent.data',
-      _safe_json_serialize([
-          types.Content(role=content.role, parts=content.parts).model_dump(
-              exclude_none=True
-          )
-          for content in data
-      ]),
+      _cap_payload(
+          _safe_json_serialize([
+              types.Content(role=content.role, parts=content.parts).model_dump(
+                  exclude_none=True
+              )
+              for content in data
+          ])
+      ),
   )
 
 
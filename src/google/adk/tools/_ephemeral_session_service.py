@@ -0,0 +1,109 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from typing import Mapping
+from typing import Optional
+import uuid
+
+from typing_extensions import override
+
+from ..sessions.base_session_service import BaseSessionService
+from ..sessions.base_session_service import GetSessionConfig
+from ..sessions.base_session_service import ListSessionsResponse
+from ..sessions.session import Session
+
+
+class EphemeralSessionService(BaseSessionService):
+  """Session service for the short-lived sessions of agent tool calls.
+
+  Unlike InMemorySessionService, sessions are neither copied when created nor
+  when read: the state is the given mapping itself, e.g. a copy-on-write
+  snapshot of the parent state, and the session is the same object on every
+  read.
+  Sessions are kept until deleted.
+  """
+
+  def __init__(self):
+    self._sessions: dict[str, Session] = {}
+
+  @override
+  async def create_session(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      state: Optional[Mapping[str, Any]] = None,
+      session_id: Optional[str] = None,
+  ) -> Session:
+    session_id = (
+        session_id.strip()
+        if session_id and session_id.strip()
+        else str(uuid.uuid4())
+    )
+    # Skips validation, which would copy the state into a new dict.
+    session = Session.model_construct(
+        id=session_id,
+        app_name=app_name,
+        user_id=user_id,
+        state=state if state is not None else {},
+        events=[],
+        last_update_time=time.time(),
+    )
+    self._sessions[session_id] = session
+    return session
+
+  @override
+  async def get_session(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      config: Optional[GetSessionConfig] = None,
+  ) -> Optional[Session]:
+    session = self._sessions.get(session_id)
+    if (
+        session is None
+        or session.app_name != app_name
+        or session.user_id != user_id
+    ):
+      return None
+    return session
+
+  @override
+  async def list_sessions(
+      self, *, app_name: str, user_id: str
+  ) -> ListSessionsResponse:
+    return ListSessionsResponse(
+        sessions=[
+            Session(
+                id=session.id,
+                app_name=session.app_name,
+                user_id=session.user_id,
+                last_update_time=session.last_update_time,
+            )
+            for session in self._sessions.values()
+            if session.app_name == app_name and session.user_id == user_id
+        ]
+    )
+
+  @override
+  async def delete_session(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> None:
+    self._sessions.pop(session_id, None)
@@ -94,3 +94,94 @@ class ForwardingArtifactService(BaseArtifactService):
         session_id=self._invocation_context.session.id,
         filename=filename,
     )
+
+
+class SessionForwardingArtifactService(BaseArtifactService):
+  """Artifact service that forwards to the tool context of each session.
+
+  Lets a long-lived runner serve several agent tool calls at once, each
+  registered with the session it runs in.
+  """
+
+  def __init__(self):
+    self._services: dict[str, ForwardingArtifactService] = {}
+
+  def register(self, session_id: str, tool_context: ToolContext) -> None:
+    """Forwards the artifacts of a session to a tool context."""
+    self._services[session_id] = ForwardingArtifactService(tool_context)
+
+  def unregister(self, session_id: str) -> None:
+    """Stops forwarding the artifacts of a session."""
+    self._services.pop(session_id, None)
+
+  def _get_service(self, session_id: str) -> ForwardingArtifactService:
+    service = self._services.get(session_id)
+    if service is None:
+      raise ValueError(f"No tool context registered for session {session_id}.")
+    return service
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    return await self._get_service(session_id).save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=artifact,
+    )
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    return await self._get_service(session_id).load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=version,
+    )
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    return await self._get_service(session_id).list_artifact_keys(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    await self._get_service(session_id).delete_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    return await self._get_service(session_id).list_versions(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import types
@@ -24,8 +25,8 @@ from typing_extensions import override
 from . import _automatic_function_calling_util
 from ..memory.in_memory_memory_service import InMemoryMemoryService
 from ..runners import Runner
-from ..sessions.in_memory_session_service import InMemorySessionService
-from ._forwarding_artifact_service import ForwardingArtifactService
+from ._ephemeral_session_service import EphemeralSessionService
+from ._forwarding_artifact_service import SessionForwardingArtifactService
 from .base_tool import BaseTool
 from .tool_context import ToolContext
 
@@ -49,6 +50,7 @@ class AgentTool(BaseTool):
   def __init__(self, agent: BaseAgent, skip_summarization: bool = False):
     self.agent = agent
     self.skip_summarization: bool = skip_summarization
+    self._runner: Optional[Runner] = None
 
     super().__init__(name=agent.name, description=agent.description)
 
@@ -58,6 +60,22 @@ class AgentTool(BaseTool):
     data['name'] = data['agent'].name
     return data
 
+  def _get_runner(self) -> Runner:
+    """Returns the runner shared by all the calls of this tool.
+
+    Each call runs in a session of its own, whose artifacts are forwarded to
+    the tool context of the call.
+    """
+    if self._runner is None:
+      self._runner = Runner(
+          app_name=self.agent.name,
+          agent=self.agent,
+          artifact_service=SessionForwardingArtifactService(),
+          session_service=EphemeralSessionService(),
+          memory_service=InMemoryMemoryService(),
+      )
+    return self._runner
+
   @override
   def _get_declaration(self) -> types.FunctionDeclaration:
     from ..agents.llm_agent import LlmAgent
@@ -110,27 +128,32 @@ class AgentTool(BaseTool):
           role='user',
           parts=[types.Part.from_text(text=args['request'])],
       )
-    runner = Runner(
-        app_name=self.agent.name,
-        agent=self.agent,
-        artifact_service=ForwardingArtifactService(tool_context),
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService(),
-    )
+    runner = self._get_runner()
+    # The session starts from a snapshot of the parent state and keeps its own
+    # changes apart; they are forwarded to the parent through state deltas.
     session = await runner.session_service.create_session(
         app_name=self.agent.name,
         user_id='tmp_user',
-        state=tool_context.state.to_dict(),
+        state=tool_context.state.copy_on_write(),
     )
+    runner.artifact_service.register(session.id, tool_context)
 
     last_event = None
-    async for event in runner.run_async(
-        user_id=session.user_id, session_id=session.id, new_message=content
-    ):
-      # Forward state delta to parent session.
-      if event.actions.state_delta:
-        tool_context.state.update(event.actions.state_delta)
-      last_event = event
+    try:
+      async for event in runner.run_async(
+          user_id=session.user_id, session_id=session.id, new_message=content
+      ):
+        # Forward state delta to parent session.
+        if event.actions.state_delta:
+          tool_context.state.update(event.actions.state_delta)
+        last_event = event
+    finally:
+      runner.artifact_service.unregister(session.id)
+      await runner.session_service.delete_session(
+          app_name=session.app_name,
+          user_id=session.user_id,
+          session_id=session.id,
+      )
 
     if not last_event or not last_event.content or not last_event.content.parts:
       return ''
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Union
@@ -100,6 +103,7 @@ class ApplicationIntegrationToolset(BaseToolset):
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      lazy_load_spec: bool = True,
   ):
     """Args:
 
@@ -119,6 +123,11 @@ class ApplicationIntegrationToolset(BaseToolset):
         tool_filter: The filter used to filter the tools in the toolset. It can
           be either a tool predicate or a list of tool names of the tools to
           expose.
+        lazy_load_spec: If True (the default), the spec is fetched on the
+          first `get_tools` call with the async clients, so that construction
+          does not block on network calls and the entity and action schemas are
+          fetched concurrently. If False, the spec is fetched during
+          initialization.
 
     Raises:
         ValueError: If none of the following conditions are met:
@@ -142,7 +151,7 @@ class ApplicationIntegrationToolset(BaseToolset):
     self._auth_scheme = auth_scheme
     self._auth_credential = auth_credential
 
-    integration_client = IntegrationClient(
+    self._integration_client = IntegrationClient(
         project,
         location,
         integration,
@@ -152,26 +161,56 @@ class ApplicationIntegrationToolset(BaseToolset):
         actions,
         service_account_json,
     )
-    connection_details = {}
-    if integration:
-      spec = integration_client.get_openapi_spec_for_integration()
-    elif connection and (entity_operations or actions):
-      connections_client = ConnectionsClient(
+    self._connections_client = None
+    if not integration:
+      if not (connection and (entity_operations or actions)):
+        raise ValueError(
+            "Invalid request, Either integration or (connection and"
+            " (entity_operations or actions)) should be provided."
+        )
+      self._connections_client = ConnectionsClient(
           project, location, connection, service_account_json
       )
-      connection_details = connections_client.get_connection_details()
-      spec = integration_client.get_openapi_spec_for_connection(
-          tool_name_prefix,
-          tool_instructions,
+    self._openapi_toolset = None
+    self._tools = []
+    self._spec_loaded = False
+    if not lazy_load_spec:
+      self._load_spec()
+
+  def _load_spec(self) -> None:
+    """Fetches the spec and generates the tools."""
+    connection_details = {}
+    if self._integration:
+      spec = self._integration_client.get_openapi_spec_for_integration()
+    else:
+      connection_details = self._connections_client.get_connection_details()
+      spec = self._integration_client.get_openapi_spec_for_connection(
+          self._tool_name_prefix,
+          self._tool_instructions,
+      )
+    self._parse_spec_to_toolset(spec, connection_details)
+    self._spec_loaded = True
+
+  async def _load_spec_async(self) -> None:
+    """Fetches the spec and generates the tools without blocking the loop."""
+    connection_details: Dict[str, Any] = {}
+    if self._integration:
+      spec = (
+          await self._integration_client.get_openapi_spec_for_integration_async()
       )
     else:
-      raise ValueError(
-          "Invalid request, Either integration or (connection and"
-          " (entity_operations or actions)) should be provided."
+      connection_details, spec = await asyncio.gather(
+          self._connections_client.get_connection_details_async(),
+          self._integration_client.get_openapi_spec_for_connection_async(
+              self._tool_name_prefix,
+              self._tool_instructions,
+          ),
       )
-    self._openapi_toolset = None
-    self._tools = []
+    # Another get_tools call may have loaded the spec while this one awaited.
+    if self._spec_loaded:
+      return
     self._parse_spec_to_toolset(spec, connection_details)
+    self._spec_loaded = True
 
   def _parse_spec_to_toolset(self, spec_dict, connection_details):
     """Parses the spec dict to OpenAPI toolset."""
@@ -262,6 +301,8 @@ class ApplicationIntegrationToolset(BaseToolset):
       self,
       readonly_context: Optional[ReadonlyContext] = None,
   ) -> List[RestApiTool]:
+    if not self._spec_loaded:
+      await self._load_spec_async()
     return (
         [
             tool
@@ -274,5 +315,7 @@ class ApplicationIntegrationToolset(BaseToolset):
 
   @override
   async def close(self) -> None:
+    if self._connections_client:
+      self._connections_client.close()
     if self._openapi_toolset:
       await self._openapi_toolset.close()
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
+import threading
 import time
 from typing import Any
 from typing import Dict
@@ -26,6 +28,12 @@ from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 import requests
 
+# Exponential backoff settings used when polling long-running operations
+# asynchronously.
+_POLL_INITIAL_INTERVAL_SECONDS = 0.5
+_POLL_MAX_INTERVAL_SECONDS = 8.0
+_POLL_TIMEOUT_SECONDS = 300.0
+
 
 class ConnectionsClient:
   """Utility class for interacting with Google Cloud Connectors API."""
@@ -53,6 +61,11 @@ class ConnectionsClient:
     self.connector_url = "https://connectors.googleapis.com"
     self.service_account_json = service_account_json
     self.credential_cache = None
+    # requests.Session is not thread-safe, so each worker thread used by the
+    # async methods gets its own session.
+    self._thread_local = threading.local()
+    self._sessions: List[requests.Session] = []
+    self._sessions_lock = threading.Lock()
 
   def get_connection_details(self) -> Dict[str, Any]:
     """Retrieves service details (service name and host) for a given connection.
@@ -70,8 +83,19 @@ class ConnectionsClient:
     url = f"{self.connector_url}/v1/projects/{self.project}/locations/{self.location}/connections/{self.connection}?view=BASIC"
 
     response = self._execute_api_call(url)
+    return self._parse_connection_details(response.json())
+
+  async def get_connection_details_async(self) -> Dict[str, Any]:
+    """Async version of `get_connection_details`."""
+    url = f"{self.connector_url}/v1/projects/{self.project}/locations/{self.location}/connections/{self.connection}?view=BASIC"
+
+    response = await self._execute_api_call_async(url)
+    return self._parse_connection_details(response.json())
 
-    connection_data = response.json()
+  @staticmethod
+  def _parse_connection_details(
+      connection_data: Dict[str, Any],
+  ) -> Dict[str, Any]:
     connection_name = connection_data.get("name", "")
     service_name = connection_data.get("serviceDirectory", "")
     host = connection_data.get("host", "")
@@ -112,7 +136,29 @@ class ConnectionsClient:
       )
 
     operation_response = self._poll_operation(operation_id)
+    return self._parse_entity_schema_and_operations(operation_response)
 
+  async def get_entity_schema_and_operations_async(
+      self, entity: str
+  ) -> Tuple[Dict[str, Any], List[str]]:
+    """Async version of `get_entity_schema_and_operations`."""
+    url = f"{self.connector_url}/v1/projects/{self.project}/locations/{self.location}/connections/{self.connection}/connectionSchemaMetadata:getEntityType?entityId={entity}"
+
+    response = await self._execute_api_call_async(url)
+    operation_id = response.json().get("name")
+
+    if not operation_id:
+      raise ValueError(
+          f"Failed to get entity schema and operations for entity: {entity}"
+      )
+
+    operation_response = await self._poll_operation_async(operation_id)
+    return self._parse_entity_schema_and_operations(operation_response)
+
+  @staticmethod
+  def _parse_entity_schema_and_operations(
+      operation_response: Dict[str, Any],
+  ) -> Tuple[Dict[str, Any], List[str]]:
     schema = operation_response.get("response", {}).get("jsonSchema", {})
     operations = operation_response.get("response", {}).get("operations", [])
     return schema, operations
@@ -141,7 +187,26 @@ class ConnectionsClient:
       raise ValueError(f"Failed to get action schema for action: {action}")
 
     operation_response = self._poll_operation(operation_id)
+    return self._parse_action_schema(operation_response)
+
+  async def get_action_schema_async(self, action: str) -> Dict[str, Any]:
+    """Async version of `get_action_schema`."""
+    url = f"{self.connector_url}/v1/projects/{self.project}/locations/{self.location}/connections/{self.connection}/connectionSchemaMetadata:getAction?actionId={action}"
+
+    response = await self._execute_api_call_async(url)
+
+    operation_id = response.json().get("name")
 
+    if not operation_id:
+      raise ValueError(f"Failed to get action schema for action: {action}")
+
+    operation_response = await self._poll_operation_async(operation_id)
+    return self._parse_action_schema(operation_response)
+
+  @staticmethod
+  def _parse_action_schema(
+      operation_response: Dict[str, Any],
+  ) -> Dict[str, Any]:
     input_schema = operation_response.get("response", {}).get(
         "inputJsonSchema", {}
     )
@@ -824,11 +889,31 @@ class ConnectionsClient:
     self.credential_cache = credentials
     return credentials.token
 
-  def _execute_api_call(self, url):
+  def close(self) -> None:
+    """Closes the HTTP sessions used by the async methods, if any."""
+    with self._sessions_lock:
+      sessions, self._sessions = self._sessions, []
+      self._thread_local = threading.local()
+    for session in sessions:
+      session.close()
+
+  def _get_session(self) -> requests.Session:
+    """Returns the session of the calling thread, creating it if needed."""
+    session = getattr(self._thread_local, "session", None)
+    if session is None:
+      session = requests.Session()
+      with self._sessions_lock:
+        self._thread_local.session = session
+        self._sessions.append(session)
+    return session
+
+  def _execute_api_call(self, url, session: Optional[requests.Session] = None):
     """Executes an API call to the given URL.
 
     Args:
         url (str): The URL to call.
+        session: Optional session to send the request with, so that
+          connections are reused across calls.
 
     Returns:
         requests.Response: The response object from the API call.
@@ -844,7 +929,7 @@ class ConnectionsClient:
           "Authorization": f"Bearer {self._get_access_token()}",
       }
 
-      response = requests.get(url, headers=headers)
+      response = (session or requests).get(url, headers=headers)
       response.raise_for_status()
       return response
 
@@ -891,3 +976,44 @@ class ConnectionsClient:
       operation_done = operation_response.get("done", False)
       time.sleep(1)
     return operation_response
+
+  async def _execute_api_call_async(self, url) -> requests.Response:
+    """Executes an API call without blocking the event loop.
+
+    The request is sent from a worker thread over that thread's session, so
+    that calls reuse connections to the Connectors API.
+    """
+    return await asyncio.to_thread(
+        lambda: self._execute_api_call(url, self._get_session())
+    )
+
+  async def _poll_operation_async(self, operation_id: str) -> Dict[str, Any]:
+    """Polls an operation until it is done, backing off exponentially.
+
+    Args:
+        operation_id: The ID of the operation to poll.
+
+    Returns:
+        The final response of the operation.
+
+    Raises:
+        TimeoutError: If the operation is not done within the poll timeout.
+        PermissionError: If there are credential issues.
+        ValueError: If there's a request error.
+        Exception: For any other unexpected errors.
+    """
+    get_operation_url = f"{self.connector_url}/v1/{operation_id}"
+    interval = _POLL_INITIAL_INTERVAL_SECONDS
+    deadline = time.monotonic() + _POLL_TIMEOUT_SECONDS
+    while True:
+      response = await self._execute_api_call_async(get_operation_url)
+      operation_response = response.json()
+      if operation_response.get("done", False):
+        return operation_response
+      if time.monotonic() + interval > deadline:
+        raise TimeoutError(
+            f"Operation {operation_id} did not complete within"
+            f" {_POLL_TIMEOUT_SECONDS} seconds."
+        )
+      await asyncio.sleep(interval)
+      interval = min(interval * 2, _POLL_MAX_INTERVAL_SECONDS)
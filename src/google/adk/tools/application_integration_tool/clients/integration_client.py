@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
 import google.auth
@@ -80,6 +84,20 @@ class IntegrationClient:
         ValueError: If there's a request error or processing error.
         Exception: For any other unexpected errors.
     """
+    return self._fetch_openapi_spec_for_integration(requests)
+
+  async def get_openapi_spec_for_integration_async(self):
+    """Async version of `get_openapi_spec_for_integration`.
+
+    The request is sent from a worker thread so that the event loop is not
+    blocked while the spec is generated.
+    """
+    with requests.Session() as session:
+      return await asyncio.to_thread(
+          self._fetch_openapi_spec_for_integration, session
+      )
+
+  def _fetch_openapi_spec_for_integration(self, http):
     try:
       url = f"https://{self.location}-integrations.googleapis.com/v1/projects/{self.project}/locations/{self.location}:generateOpenApiSpec"
       headers = {
@@ -95,7 +113,7 @@ class IntegrationClient:
           ],
           "fileFormat": "JSON",
       }
-      response = requests.post(url, headers=headers, json=data)
+      response = http.post(url, headers=headers, json=data)
       response.raise_for_status()
       spec = response.json().get("openApiSpec", {})
       return json.loads(spec)
@@ -127,8 +145,59 @@ class IntegrationClient:
         PermissionError: If there are credential issues.
         Exception: For any other unexpected errors.
     """
-    # Application Integration needs to be provisioned in the same region as connection and an integration with name "ExecuteConnection" and trigger "api_trigger/ExecuteConnection" should be created as per the documentation.
-    integration_name = "ExecuteConnection"
+    connections_client = self._create_connections_client()
+    entity_schemas = {
+        entity: connections_client.get_entity_schema_and_operations(entity)
+        for entity in self.entity_operations
+    }
+    action_details = {
+        action: connections_client.get_action_schema(action)
+        for action in self.actions
+    }
+    return self._build_connection_spec(
+        connections_client,
+        entity_schemas,
+        action_details,
+        tool_name,
+        tool_instructions,
+    )
+
+  async def get_openapi_spec_for_connection_async(
+      self, tool_name="", tool_instructions=""
+  ):
+    """Async version of `get_openapi_spec_for_connection`.
+
+    The schemas of all requested entities and actions are fetched concurrently
+    over a shared connection pool instead of one after another.
+    """
+    connections_client = self._create_connections_client()
+    try:
+      entity_schemas, action_details = await asyncio.gather(
+          self._gather_by_key(
+              self.entity_operations,
+              connections_client.get_entity_schema_and_operations_async,
+          ),
+          self._gather_by_key(
+              self.actions, connections_client.get_action_schema_async
+          ),
+      )
+    finally:
+      connections_client.close()
+    return self._build_connection_spec(
+        connections_client,
+        entity_schemas,
+        action_details,
+        tool_name,
+        tool_instructions,
+    )
+
+  @staticmethod
+  async def _gather_by_key(keys, fetch) -> Dict[str, Any]:
+    keys = list(keys)
+    results = await asyncio.gather(*(fetch(key) for key in keys))
+    return dict(zip(keys, results))
+
+  def _create_connections_client(self) -> ConnectionsClient:
     connections_client = ConnectionsClient(
         self.project,
         self.location,
@@ -140,11 +209,22 @@ class IntegrationClient:
           "No entity operations or actions provided. Please provide at least"
           " one of them."
       )
+    return connections_client
+
+  def _build_connection_spec(
+      self,
+      connections_client: ConnectionsClient,
+      entity_schemas: Dict[str, Tuple[Dict[str, Any], List[str]]],
+      action_details_by_action: Dict[str, Dict[str, Any]],
+      tool_name: str,
+      tool_instructions: str,
+  ) -> Dict[str, Any]:
+    """Builds the connector spec from the fetched entity and action schemas."""
+    # Application Integration needs to be provisioned in the same region as connection and an integration with name "ExecuteConnection" and trigger "api_trigger/ExecuteConnection" should be created as per the documentation.
+    integration_name = "ExecuteConnection"
     connector_spec = connections_client.get_connector_base_spec()
     for entity, operations in self.entity_operations.items():
-      schema, supported_operations = (
-          connections_client.get_entity_schema_and_operations(entity)
-      )
+      schema, supported_operations = entity_schemas[entity]
       if not operations:
         operations = supported_operations
       json_schema_as_string = json.dumps(schema)
@@ -195,7 +275,7 @@ class IntegrationClient:
               f"Invalid operation: {operation} for entity: {entity}"
           )
     for action in self.actions:
-      action_details = connections_client.get_action_schema(action)
+      action_details = action_details_by_action[action]
       input_schema = action_details["inputSchema"]
       output_schema = action_details["outputSchema"]
       # Remove spaces from the display name to generate valid spec
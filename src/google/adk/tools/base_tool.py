@@ -41,10 +41,26 @@ class BaseTool(ABC):
   """Whether the tool is a long running operation, which typically returns a
   resource id first and finishes the operation later."""
 
-  def __init__(self, *, name, description, is_long_running: bool = False):
+  is_read_only: bool = False
+  """Whether the tool only reads data, so that calling it has no side effects.
+
+  In SSE streaming mode, read-only tools may be called as soon as a partial
+  model response has their call, and that result is discarded if the final
+  response doesn't make the call.
+  """
+
+  def __init__(
+      self,
+      *,
+      name,
+      description,
+      is_long_running: bool = False,
+      is_read_only: bool = False,
+  ):
     self.name = name
     self.description = description
     self.is_long_running = is_long_running
+    self.is_read_only = is_read_only
 
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
     """Gets the OpenAPI specification of this tool in the form of a FunctionDeclaration.
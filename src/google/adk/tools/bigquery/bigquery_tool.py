@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import inspect
 from typing import Any
 from typing import Callable
@@ -126,4 +128,18 @@ class BigQueryTool(FunctionTool):
       args_to_call["credentials"] = credentials
     if "config" in signature.parameters:
       args_to_call["config"] = tool_config
+
+    if not self._is_async_func():
+      if "tool_context" in signature.parameters:
+        args_to_call["tool_context"] = tool_context
+      missing_mandatory_args = [
+          arg for arg in self._get_mandatory_args() if arg not in args_to_call
+      ]
+      # BigQuery client calls block on network I/O, so run synchronous tool
+      # functions in a worker thread to keep the event loop responsive.
+      # Missing arguments are reported by FunctionTool.run_async below.
+      if not missing_mandatory_args:
+        return await asyncio.to_thread(
+            functools.partial(self.func, **args_to_call)
+        )
     return await super().run_async(args=args_to_call, tool_context=tool_context)
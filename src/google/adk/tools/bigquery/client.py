@@ -14,20 +14,62 @@
 
 from __future__ import annotations
 
+import collections
+import threading
+from typing import Optional
+from typing import Tuple
+
 import google.api_core.client_info
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
 
 from ... import version
+from .metadata_cache import get_credentials_principal
 
 USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 
+# Clients pooled per credentials principal and project, least recently used
+# first. OAuth credentials are rebuilt for every tool call, so the pool is
+# keyed by the principal behind them rather than by the credentials object.
+# Each client keeps the credentials it was created with alive, so the pool is
+# bounded and evicts the least recently used client when full.
+_CLIENT_POOL_MAX_SIZE = 32
+_client_pool: collections.OrderedDict[
+    Tuple[str, Optional[str]], bigquery.Client
+] = collections.OrderedDict()
+_client_pool_lock = threading.Lock()
+
 
 def get_bigquery_client(
     *, project: str, credentials: Credentials
 ) -> bigquery.Client:
-  """Get a BigQuery client."""
+  """Get a BigQuery client.
+
+  Clients are reused across calls with credentials of the same principal and
+  the same project, so that tool calls share HTTP connections instead of
+  creating a new client every time. Credentials whose principal can't be
+  identified get a new client.
+  """
+  principal = get_credentials_principal(credentials)
+  if principal is None:
+    return _create_bigquery_client(project=project, credentials=credentials)
+
+  key = (principal, project)
+  with _client_pool_lock:
+    client = _client_pool.get(key)
+    if client is not None:
+      _client_pool.move_to_end(key)
+      return client
+    client = _create_bigquery_client(project=project, credentials=credentials)
+    _client_pool[key] = client
+    if len(_client_pool) > _CLIENT_POOL_MAX_SIZE:
+      _client_pool.popitem(last=False)
+    return client
 
+
+def _create_bigquery_client(
+    *, project: str, credentials: Credentials
+) -> bigquery.Client:
   client_info = google.api_core.client_info.ClientInfo(user_agent=USER_AGENT)
 
   bigquery_client = bigquery.Client(
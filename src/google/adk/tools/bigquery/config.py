@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -44,3 +45,17 @@ class BigQueryToolConfig(BaseModel):
   By default, the tool will allow only read operations. This behaviour may
   change in future versions.
   """
+
+  max_query_result_rows: int = 50
+  """Maximum number of rows returned by the execute_sql tool.
+
+  Rows are fetched page by page and fetching stops once this many rows have
+  been downloaded.
+  """
+
+  max_query_result_bytes: Optional[int] = None
+  """Maximum approximate size, in bytes, of the rows returned by execute_sql.
+
+  The size is measured on the JSON-serialized rows. If None, only
+  `max_query_result_rows` limits the result.
+  """
@@ -0,0 +1,190 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import copy
+import hashlib
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+from google.auth.credentials import Credentials
+
+_T = TypeVar("_T")
+
+
+def get_credentials_principal(credentials: Credentials) -> Optional[str]:
+  """Returns a stable identifier of the principal behind the credentials.
+
+  Service accounts are identified by their email. User credentials are
+  identified by a hash of their refresh token (or access token), which stays
+  the same across sessions of the same user without exposing the secret.
+
+  Returns:
+    The principal identifier, or None if the credentials cannot be identified,
+    in which case results must not be shared through the cache.
+  """
+  if credentials is None:
+    return None
+  for attr in ("service_account_email", "signer_email", "account"):
+    value = getattr(credentials, attr, None)
+    if isinstance(value, str) and value and value != "default":
+      return value
+  for attr in ("refresh_token", "token"):
+    value = getattr(credentials, attr, None)
+    if isinstance(value, str) and value:
+      return f"{attr}:{hashlib.sha256(value.encode()).hexdigest()}"
+  return None
+
+
+class MetadataCache:
+  """A size-bounded LRU cache of BigQuery metadata with per-project TTLs.
+
+  Entries are keyed by the credentials principal and project, so that metadata
+  fetched for one principal is shared across that principal's sessions but
+  never returned to a different principal.
+  """
+
+  def __init__(
+      self,
+      *,
+      ttl_seconds: float = 300.0,
+      project_ttl_seconds: Optional[Dict[str, float]] = None,
+      max_entries: int = 1024,
+  ):
+    """Initializes the metadata cache.
+
+    Args:
+      ttl_seconds: How long cached metadata is served before it is fetched
+        again.
+      project_ttl_seconds: Per-project overrides of `ttl_seconds`, e.g. a long
+        TTL for public datasets that rarely change.
+      max_entries: Maximum number of cached entries. The least recently used
+        entries are evicted first.
+    """
+    self._ttl_seconds = ttl_seconds
+    self._project_ttl_seconds = project_ttl_seconds or {}
+    self._max_entries = max_entries
+    self._entries: collections.OrderedDict[
+        Tuple[Hashable, ...], Tuple[float, Any]
+    ] = collections.OrderedDict()
+    self._lock = threading.Lock()
+
+  def get_or_load(
+      self,
+      credentials: Credentials,
+      project_id: str,
+      key: Tuple[Hashable, ...],
+      loader: Callable[[], _T],
+  ) -> _T:
+    """Returns the cached value for the key, calling `loader` on a miss.
+
+    Exceptions raised by `loader` are propagated and nothing is cached.
+
+    Args:
+      credentials: The credentials the metadata is fetched with.
+      project_id: The project the metadata belongs to.
+      key: Identifies the metadata within the project, e.g.
+        `("table", dataset_id, table_id)`.
+      loader: Fetches the metadata on a cache miss.
+
+    Returns:
+      A copy of the cached or freshly loaded value.
+    """
+    principal = get_credentials_principal(credentials)
+    if principal is None:
+      return loader()
+
+    full_key = (principal, project_id) + tuple(key)
+    found, value = self._get(full_key, project_id)
+    if not found:
+      value = loader()
+      self._put(full_key, value)
+    return copy.deepcopy(value)
+
+  def invalidate(
+      self,
+      project_id: Optional[str] = None,
+      *,
+      credentials: Optional[Credentials] = None,
+  ) -> None:
+    """Drops cached entries.
+
+    Args:
+      project_id: Only drop entries of this project. If None, entries of all
+        projects are dropped.
+      credentials: Only drop entries of the principal behind these
+        credentials. If None, entries of all principals are dropped.
+    """
+    principal = None
+    if credentials is not None:
+      principal = get_credentials_principal(credentials)
+      if principal is None:
+        # Nothing is cached for credentials without a principal.
+        return
+    with self._lock:
+      if project_id is None and principal is None:
+        self._entries.clear()
+        return
+      for full_key in [
+          k
+          for k in self._entries
+          if (project_id is None or k[1] == project_id)
+          and (principal is None or k[0] == principal)
+      ]:
+        del self._entries[full_key]
+
+  def _get(
+      self, full_key: Tuple[Hashable, ...], project_id: str
+  ) -> Tuple[bool, Any]:
+    ttl_seconds = self._project_ttl_seconds.get(project_id, self._ttl_seconds)
+    with self._lock:
+      entry = self._entries.get(full_key)
+      if entry is None:
+        return False, None
+      stored_at, value = entry
+      if time.monotonic() - stored_at >= ttl_seconds:
+        del self._entries[full_key]
+        return False, None
+      self._entries.move_to_end(full_key)
+      return True, value
+
+  def _put(self, full_key: Tuple[Hashable, ...], value: Any) -> None:
+    with self._lock:
+      self._entries[full_key] = (time.monotonic(), value)
+      self._entries.move_to_end(full_key)
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+
+
+_default_metadata_cache = MetadataCache()
+
+
+def get_default_metadata_cache() -> MetadataCache:
+  """Returns the process-wide cache used by the BigQuery metadata tools."""
+  return _default_metadata_cache
+
+
+def set_default_metadata_cache(cache: MetadataCache) -> None:
+  """Replaces the process-wide cache used by the BigQuery metadata tools."""
+  global _default_metadata_cache
+  _default_metadata_cache = cache
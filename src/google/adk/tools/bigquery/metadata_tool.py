@@ -16,6 +16,7 @@ from google.auth.credentials import Credentials
 from google.cloud import bigquery
 
 from . import client
+from .metadata_cache import get_default_metadata_cache
 
 
 def list_dataset_ids(project_id: str, credentials: Credentials) -> list[str]:
@@ -42,14 +43,12 @@ def list_dataset_ids(project_id: str, credentials: Credentials) -> list[str]:
        'bbc_news']
   """
   try:
-    bq_client = client.get_bigquery_client(
-        project=project_id, credentials=credentials
+    return get_default_metadata_cache().get_or_load(
+        credentials,
+        project_id,
+        ("datasets",),
+        lambda: _list_dataset_ids(project_id, credentials),
     )
-
-    datasets = []
-    for dataset in bq_client.list_datasets(project_id):
-      datasets.append(dataset.dataset_id)
-    return datasets
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -108,13 +107,12 @@ def get_dataset_info(
       }
   """
   try:
-    bq_client = client.get_bigquery_client(
-        project=project_id, credentials=credentials
-    )
-    dataset = bq_client.get_dataset(
-        bigquery.DatasetReference(project_id, dataset_id)
+    return get_default_metadata_cache().get_or_load(
+        credentials,
+        project_id,
+        ("dataset", dataset_id),
+        lambda: _get_dataset_info(project_id, dataset_id, credentials),
     )
-    return dataset.to_api_repr()
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -141,16 +139,12 @@ def list_table_ids(
        'local_data_for_better_health_county_data']
   """
   try:
-    bq_client = client.get_bigquery_client(
-        project=project_id, credentials=credentials
+    return get_default_metadata_cache().get_or_load(
+        credentials,
+        project_id,
+        ("tables", dataset_id),
+        lambda: _list_table_ids(project_id, dataset_id, credentials),
     )
-
-    tables = []
-    for table in bq_client.list_tables(
-        bigquery.DatasetReference(project_id, dataset_id)
-    ):
-      tables.append(table.table_id)
-    return tables
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -257,16 +251,63 @@ def get_table_info(
       }
   """
   try:
-    bq_client = client.get_bigquery_client(
-        project=project_id, credentials=credentials
+    return get_default_metadata_cache().get_or_load(
+        credentials,
+        project_id,
+        ("table", dataset_id, table_id),
+        lambda: _get_table_info(project_id, dataset_id, table_id, credentials),
     )
-    return bq_client.get_table(
-        bigquery.TableReference(
-            bigquery.DatasetReference(project_id, dataset_id), table_id
-        )
-    ).to_api_repr()
   except Exception as ex:
     return {
         "status": "ERROR",
         "error_details": str(ex),
     }
+
+
+def _list_dataset_ids(project_id: str, credentials: Credentials) -> list[str]:
+  bq_client = client.get_bigquery_client(
+      project=project_id, credentials=credentials
+  )
+  datasets = []
+  for dataset in bq_client.list_datasets(project_id):
+    datasets.append(dataset.dataset_id)
+  return datasets
+
+
+def _get_dataset_info(
+    project_id: str, dataset_id: str, credentials: Credentials
+) -> dict:
+  bq_client = client.get_bigquery_client(
+      project=project_id, credentials=credentials
+  )
+  dataset = bq_client.get_dataset(
+      bigquery.DatasetReference(project_id, dataset_id)
+  )
+  return dataset.to_api_repr()
+
+
+def _list_table_ids(
+    project_id: str, dataset_id: str, credentials: Credentials
+) -> list[str]:
+  bq_client = client.get_bigquery_client(
+      project=project_id, credentials=credentials
+  )
+  tables = []
+  for table in bq_client.list_tables(
+      bigquery.DatasetReference(project_id, dataset_id)
+  ):
+    tables.append(table.table_id)
+  return tables
+
+
+def _get_table_info(
+    project_id: str, dataset_id: str, table_id: str, credentials: Credentials
+) -> dict:
+  bq_client = client.get_bigquery_client(
+      project=project_id, credentials=credentials
+  )
+  return bq_client.get_table(
+      bigquery.TableReference(
+          bigquery.DatasetReference(project_id, dataset_id), table_id
+      )
+  ).to_api_repr()
@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import functools
+import json
+import threading
 import types
 from typing import Callable
+from typing import Tuple
 
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
@@ -22,9 +26,42 @@ from google.cloud import bigquery
 from . import client
 from .config import BigQueryToolConfig
 from .config import WriteMode
+from .metadata_cache import get_default_metadata_cache
 
 MAX_DOWNLOADED_QUERY_RESULT_ROWS = 50
 
+# Statement types from dry runs, keyed by (project id, query text). The
+# statement type of a query does not change, so a query the model retries or
+# repeats is validated without another dry-run job.
+_DRY_RUN_CACHE_MAX_SIZE = 256
+_dry_run_cache: collections.OrderedDict[Tuple[str, str], str] = (
+    collections.OrderedDict()
+)
+_dry_run_cache_lock = threading.Lock()
+
+
+def _get_statement_type(
+    bq_client: bigquery.Client, project_id: str, query: str
+) -> str:
+  """Returns the statement type of the query, dry-running it if not cached."""
+  key = (project_id, query)
+  with _dry_run_cache_lock:
+    if key in _dry_run_cache:
+      _dry_run_cache.move_to_end(key)
+      return _dry_run_cache[key]
+
+  query_job = bq_client.query(
+      query,
+      project=project_id,
+      job_config=bigquery.QueryJobConfig(dry_run=True),
+  )
+  statement_type = query_job.statement_type
+  with _dry_run_cache_lock:
+    _dry_run_cache[key] = statement_type
+    while len(_dry_run_cache) > _DRY_RUN_CACHE_MAX_SIZE:
+      _dry_run_cache.popitem(last=False)
+  return statement_type
+
 
 def execute_sql(
     project_id: str,
@@ -75,27 +112,47 @@ def execute_sql(
     bq_client = client.get_bigquery_client(
         project=project_id, credentials=credentials
     )
+    statement_type = _get_statement_type(bq_client, project_id, query)
     if not config or config.write_mode == WriteMode.BLOCKED:
-      query_job = bq_client.query(
-          query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(dry_run=True),
-      )
-      if query_job.statement_type != "SELECT":
+      if statement_type != "SELECT":
         return {
             "status": "ERROR",
             "error_details": "Read-only mode only supports SELECT statements.",
         }
 
-    row_iterator = bq_client.query_and_wait(
-        query, project=project_id, max_results=MAX_DOWNLOADED_QUERY_RESULT_ROWS
+    max_rows = (
+        config.max_query_result_rows
+        if config
+        else MAX_DOWNLOADED_QUERY_RESULT_ROWS
     )
-    rows = [{key: val for key, val in row.items()} for row in row_iterator]
+    max_bytes = config.max_query_result_bytes if config else None
+    try:
+      row_iterator = bq_client.query_and_wait(
+          query, project=project_id, max_results=max_rows
+      )
+    finally:
+      # DDL and DML statements may create, alter or drop datasets and tables,
+      # possibly in other projects, so the cached metadata of the principal
+      # can no longer be trusted. A failed statement may have partially run.
+      if statement_type != "SELECT":
+        get_default_metadata_cache().invalidate(credentials=credentials)
+    # The row iterator fetches pages lazily, so stopping at the byte budget
+    # also stops downloading further pages.
+    rows = []
+    result_bytes = 0
+    is_truncated = False
+    for row in row_iterator:
+      row_dict = {key: val for key, val in row.items()}
+      if max_bytes is not None:
+        result_bytes += len(json.dumps(row_dict, default=str))
+        if result_bytes > max_bytes:
+          is_truncated = True
+          break
+      rows.append(row_dict)
+      if max_rows is not None and len(rows) >= max_rows:
+        break
     result = {"status": "SUCCESS", "rows": rows}
-    if (
-        MAX_DOWNLOADED_QUERY_RESULT_ROWS is not None
-        and len(rows) == MAX_DOWNLOADED_QUERY_RESULT_ROWS
-    ):
+    if is_truncated or (max_rows is not None and len(rows) == max_rows):
       result["result_is_likely_truncated"] = True
     return result
   except Exception as ex:
@@ -32,7 +32,7 @@ class FunctionTool(BaseTool):
     func: The function to wrap.
   """
 
-  def __init__(self, func: Callable[..., Any]):
+  def __init__(self, func: Callable[..., Any], *, is_read_only: bool = False):
     """Extract metadata from a callable object."""
     name = ''
     doc = ''
@@ -55,7 +55,7 @@ class FunctionTool(BaseTool):
       # For callable objects, try to get docstring from __call__ method
       doc = inspect.cleandoc(func.__call__.__doc__)
 
-    super().__init__(name=name, description=doc)
+    super().__init__(name=name, description=doc, is_read_only=is_read_only)
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
 
@@ -99,17 +99,20 @@ class FunctionTool(BaseTool):
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
       return {'error': error_str}
 
+    if self._is_async_func():
+      return await self.func(**args_to_call)
+    else:
+      return self.func(**args_to_call)
+
+  def _is_async_func(self) -> bool:
+    """Whether calling the function returns a coroutine."""
     # Functions are callable objects, but not all callable objects are functions
     # checking coroutine function is not enough. We also need to check whether
     # Callable's __call__ function is a coroutine funciton
-    if (
-        inspect.iscoroutinefunction(self.func)
-        or hasattr(self.func, '__call__')
+    return inspect.iscoroutinefunction(self.func) or (
+        hasattr(self.func, '__call__')
         and inspect.iscoroutinefunction(self.func.__call__)
-    ):
-      return await self.func(**args_to_call)
-    else:
-      return self.func(**args_to_call)
+    )
 
   # TODO(hangfei): fix call live for function stream.
   async def _call_live(
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import os
 from typing import Any
@@ -30,7 +31,8 @@ from ...tools.base_toolset import BaseToolset
 from ...tools.base_toolset import ToolPredicate
 from ..openapi_tool import OpenAPIToolset
 from .google_api_tool import GoogleApiTool
-from .googleapi_to_openapi_converter import GoogleApiToOpenApiConverter
+from .openapi_spec_cache import get_default_spec_cache
+from .openapi_spec_cache import OpenApiSpecCache
 
 
 class GoogleApiToolset(BaseToolset):
@@ -39,6 +41,10 @@ class GoogleApiToolset(BaseToolset):
   Usually one toolsets will contains tools only related to one Google API, e.g.
   Google Bigquery API toolset will contains tools only related to Google
   Bigquery API, like list dataset tool, list table tool etc.
+
+  The API spec is fetched and converted lazily on the first `get_tools` call,
+  in a worker thread, and is served from `spec_cache` (the process-wide cache
+  by default) so that constructing toolsets does no network or conversion work.
   """
 
   def __init__(
@@ -48,12 +54,15 @@ class GoogleApiToolset(BaseToolset):
       client_id: Optional[str] = None,
       client_secret: Optional[str] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      spec_cache: Optional[OpenApiSpecCache] = None,
   ):
     self.api_name = api_name
     self.api_version = api_version
     self._client_id = client_id
     self._client_secret = client_secret
-    self._openapi_toolset = self._load_toolset_with_oidc_auth()
+    self._spec_cache = spec_cache
+    self._openapi_toolset: Optional[OpenAPIToolset] = None
+    self._load_lock: Optional[asyncio.Lock] = None
     self.tool_filter = tool_filter
 
   @override
@@ -61,7 +70,12 @@ class GoogleApiToolset(BaseToolset):
       self, readonly_context: Optional[ReadonlyContext] = None
   ) -> List[GoogleApiTool]:
     """Get all tools in the toolset."""
-    tools = []
+    if not self._openapi_toolset:
+      if self._load_lock is None:
+        self._load_lock = asyncio.Lock()
+      async with self._load_lock:
+        if not self._openapi_toolset:
+          self._openapi_toolset = await self._load_toolset_with_oidc_auth()
 
     return [
         GoogleApiTool(tool, self._client_id, self._client_secret)
@@ -72,16 +86,17 @@ class GoogleApiToolset(BaseToolset):
   def set_tool_filter(self, tool_filter: Union[ToolPredicate, List[str]]):
     self.tool_filter = tool_filter
 
-  def _load_toolset_with_oidc_auth(self) -> OpenAPIToolset:
-    spec_dict = GoogleApiToOpenApiConverter(
-        self.api_name, self.api_version
-    ).convert()
+  async def _load_toolset_with_oidc_auth(self) -> OpenAPIToolset:
+    spec_cache = self._spec_cache or get_default_spec_cache()
+    spec_dict = await spec_cache.get_spec_async(self.api_name, self.api_version)
     scope = list(
         spec_dict['components']['securitySchemes']['oauth2']['flows'][
             'authorizationCode'
         ]['scopes'].keys()
     )[0]
-    return OpenAPIToolset(
+    # Parsing the spec into tools is CPU-bound, so it also runs in a thread.
+    return await asyncio.to_thread(
+        OpenAPIToolset,
         spec_dict=spec_dict,
         spec_str_type='yaml',
         auth_scheme=OpenIdConnectWithConfig(
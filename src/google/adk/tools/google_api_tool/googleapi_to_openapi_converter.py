@@ -20,6 +20,7 @@ import logging
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 # Google API client
 from googleapiclient.discovery import build
@@ -76,6 +77,13 @@ class GoogleApiToOpenApiConverter:
       logger.error("Error fetching API spec: %s", e)
       raise
 
+  @property
+  def discovery_etag(self) -> Optional[str]:
+    """The ETag of the fetched discovery document, if any."""
+    if not self._google_api_spec:
+      return None
+    return self._google_api_spec.get("etag")
+
   def convert(self) -> Dict[str, Any]:
     """Convert the Google API spec to OpenAPI v3 format.
 
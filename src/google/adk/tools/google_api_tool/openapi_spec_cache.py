@@ -0,0 +1,263 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from .googleapi_to_openapi_converter import GoogleApiToOpenApiConverter
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_CACHE_DIR_ENV_VARIABLE_NAME = "ADK_GOOGLE_API_SPEC_CACHE_DIR"
+_SNAPSHOT_DIR_ENV_VARIABLE_NAME = "ADK_GOOGLE_API_SPEC_SNAPSHOT_DIR"
+_OFFLINE_ENV_VARIABLE_NAME = "ADK_GOOGLE_API_SPEC_OFFLINE"
+
+_DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def _default_cache_dir() -> str:
+  return os.environ.get(
+      _CACHE_DIR_ENV_VARIABLE_NAME,
+      os.path.join(
+          os.path.expanduser("~"), ".cache", "google_adk", "google_api_specs"
+      ),
+  )
+
+
+class OpenApiSpecCache:
+  """Caches OpenAPI specs converted from Google API discovery documents.
+
+  Converted specs are kept in memory for the lifetime of the process and
+  persisted as JSON files under `cache_dir`, keyed by API name and version.
+  Each entry records the discovery document ETag and the time it was fetched:
+
+  * Entries younger than `ttl_seconds` are served without any network call.
+  * Expired entries trigger a discovery fetch. If the ETag is unchanged, the
+    cached spec is reused and only its timestamp is refreshed, which skips the
+    conversion.
+  * If the discovery fetch fails, or offline mode is enabled, a stale cached
+    entry is used, then a snapshot file `<api_name>_<api_version>.json` from
+    `snapshot_dir`.
+
+  No snapshots are bundled with the package, as the converted specs of all
+  Google APIs are large and would go stale with each release. For offline use,
+  copy the cache files written by an online run into a directory and pass it
+  as `snapshot_dir`.
+
+  Loading an API's spec blocks on the network and on the conversion, so async
+  callers use `get_spec_async`.
+  """
+
+  def __init__(
+      self,
+      *,
+      cache_dir: Optional[str] = None,
+      ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+      snapshot_dir: Optional[str] = None,
+      offline: Optional[bool] = None,
+  ):
+    """Initializes the spec cache.
+
+    Args:
+      cache_dir: Directory to persist converted specs in. Defaults to the
+        `ADK_GOOGLE_API_SPEC_CACHE_DIR` environment variable or
+        `~/.cache/google_adk/google_api_specs`. Pass an empty string to keep the
+        cache in memory only.
+      ttl_seconds: How long a cached spec is used before the discovery document
+        is checked for changes.
+      snapshot_dir: Directory with pre-converted specs to fall back to when the
+        discovery service is unreachable. Defaults to the
+        `ADK_GOOGLE_API_SPEC_SNAPSHOT_DIR` environment variable.
+      offline: If True, never fetch discovery documents and only serve cached
+        or snapshot specs. Defaults to the `ADK_GOOGLE_API_SPEC_OFFLINE`
+        environment variable.
+    """
+    self._cache_dir = _default_cache_dir() if cache_dir is None else cache_dir
+    self._ttl_seconds = ttl_seconds
+    self._snapshot_dir = (
+        os.environ.get(_SNAPSHOT_DIR_ENV_VARIABLE_NAME)
+        if snapshot_dir is None
+        else snapshot_dir
+    )
+    if offline is None:
+      offline = os.environ.get(_OFFLINE_ENV_VARIABLE_NAME, "0").lower() in [
+          "true",
+          "1",
+      ]
+    self._offline = offline
+    self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    self._lock = threading.Lock()
+    """Guards `_key_locks`."""
+    self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+    """Serialize the loading of each API's spec, so that concurrent callers
+    fetch and convert it only once while other APIs load in parallel."""
+
+  def get_spec(self, api_name: str, api_version: str) -> Dict[str, Any]:
+    """Returns the OpenAPI spec for the given Google API.
+
+    Args:
+      api_name: The name of the Google API (e.g., "calendar").
+      api_version: The version of the API (e.g., "v3").
+
+    Returns:
+      A copy of the converted OpenAPI v3 spec, safe for the caller to mutate.
+    """
+    with self._get_key_lock(api_name, api_version):
+      entry = self._get_entry(api_name, api_version)
+    return copy.deepcopy(entry["spec"])
+
+  async def get_spec_async(
+      self, api_name: str, api_version: str
+  ) -> Dict[str, Any]:
+    """Runs `get_spec` in a worker thread, without blocking the event loop."""
+    return await asyncio.to_thread(self.get_spec, api_name, api_version)
+
+  def invalidate(self, api_name: str, api_version: str) -> None:
+    """Drops the cached spec for the given API from memory and disk."""
+    with self._get_key_lock(api_name, api_version):
+      self._entries.pop((api_name, api_version), None)
+      path = self._cache_path(api_name, api_version)
+      if path and os.path.exists(path):
+        os.remove(path)
+
+  def _get_key_lock(self, api_name: str, api_version: str) -> threading.Lock:
+    with self._lock:
+      return self._key_locks.setdefault(
+          (api_name, api_version), threading.Lock()
+      )
+
+  def _get_entry(self, api_name: str, api_version: str) -> Dict[str, Any]:
+    key = (api_name, api_version)
+    entry = self._entries.get(key) or self._read_entry(
+        self._cache_path(api_name, api_version)
+    )
+    if entry and (self._offline or self._is_fresh(entry)):
+      self._entries[key] = entry
+      return entry
+
+    if not self._offline:
+      try:
+        entry = self._fetch_entry(api_name, api_version, entry)
+        self._entries[key] = entry
+        self._write_entry(self._cache_path(api_name, api_version), entry)
+        return entry
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        if not entry and not self._snapshot_path(api_name, api_version):
+          raise
+        logger.warning(
+            "Failed to fetch Google API spec for %s %s, falling back to"
+            " cached spec: %s",
+            api_name,
+            api_version,
+            e,
+        )
+
+    entry = entry or self._read_entry(
+        self._snapshot_path(api_name, api_version)
+    )
+    if not entry:
+      raise ValueError(
+          f"No cached or snapshot spec available for {api_name} {api_version}"
+          " in offline mode."
+      )
+    self._entries[key] = entry
+    return entry
+
+  def _fetch_entry(
+      self,
+      api_name: str,
+      api_version: str,
+      stale_entry: Optional[Dict[str, Any]],
+  ) -> Dict[str, Any]:
+    converter = GoogleApiToOpenApiConverter(api_name, api_version)
+    converter.fetch_google_api_spec()
+    etag = converter.discovery_etag
+    if stale_entry and etag and stale_entry.get("etag") == etag:
+      logger.debug(
+          "Discovery document for %s %s is unchanged, reusing cached spec",
+          api_name,
+          api_version,
+      )
+      spec = stale_entry["spec"]
+    else:
+      spec = converter.convert()
+    return {"etag": etag, "fetched_at": time.time(), "spec": spec}
+
+  def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+    return time.time() - entry.get("fetched_at", 0) < self._ttl_seconds
+
+  def _cache_path(self, api_name: str, api_version: str) -> Optional[str]:
+    if not self._cache_dir:
+      return None
+    return os.path.join(self._cache_dir, f"{api_name}_{api_version}.json")
+
+  def _snapshot_path(self, api_name: str, api_version: str) -> Optional[str]:
+    if not self._snapshot_dir:
+      return None
+    path = os.path.join(self._snapshot_dir, f"{api_name}_{api_version}.json")
+    return path if os.path.exists(path) else None
+
+  def _read_entry(self, path: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not path or not os.path.exists(path):
+      return None
+    try:
+      with open(path, "r", encoding="utf-8") as f:
+        entry = json.load(f)
+    except (OSError, ValueError) as e:
+      logger.warning("Ignoring unreadable spec cache file %s: %s", path, e)
+      return None
+    # Snapshots may be plain OpenAPI specs without the cache envelope.
+    if "spec" not in entry:
+      entry = {"etag": None, "fetched_at": 0, "spec": entry}
+    return entry
+
+  def _write_entry(self, path: Optional[str], entry: Dict[str, Any]) -> None:
+    if not path:
+      return
+    tmp_path = None
+    try:
+      os.makedirs(os.path.dirname(path), exist_ok=True)
+      fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+      with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+      os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+      logger.warning("Failed to write spec cache file %s: %s", path, e)
+    finally:
+      # The temporary file is gone once it replaced the cache file.
+      if tmp_path and os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+
+_default_spec_cache: Optional[OpenApiSpecCache] = None
+
+
+def get_default_spec_cache() -> OpenApiSpecCache:
+  """Returns the process-wide spec cache shared by all Google API toolsets."""
+  global _default_spec_cache
+  if _default_spec_cache is None:
+    _default_spec_cache = OpenApiSpecCache()
+  return _default_spec_cache
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import json
 from typing import Any
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import types
@@ -27,15 +28,27 @@ if TYPE_CHECKING:
   from ..models.llm_request import LlmRequest
   from .tool_context import ToolContext
 
+# The Gemini API rejects requests with more inline data than this.
+_DEFAULT_MAX_INLINE_BYTES = 20 * 1024 * 1024
+
 
 class LoadArtifactsTool(BaseTool):
   """A tool that loads the artifacts and adds them to the session."""
 
-  def __init__(self):
+  def __init__(
+      self, *, max_inline_bytes: Optional[int] = _DEFAULT_MAX_INLINE_BYTES
+  ):
+    """Initializes the tool.
+
+    Args:
+      max_inline_bytes: Artifacts with more inline data than this are replaced
+        with a short description in the LLM request. No limit if None.
+    """
     super().__init__(
         name='load_artifacts',
         description='Loads the artifacts and adds them to the session.',
     )
+    self._max_inline_bytes = max_inline_bytes
 
   def _get_declaration(self) -> types.FunctionDeclaration | None:
     return types.FunctionDeclaration(
@@ -76,7 +89,13 @@ class LoadArtifactsTool(BaseTool):
   async def _append_artifacts_to_llm_request(
       self, *, tool_context: ToolContext, llm_request: LlmRequest
   ):
-    artifact_names = await tool_context.list_artifacts()
+    # The manifest caches the artifact list and contents for the invocation,
+    # so they are not fetched again on every LLM step.
+    invocation_context = tool_context._invocation_context
+    artifact_manifest = invocation_context.artifact_manifest
+    artifact_names = await artifact_manifest.list_artifact_keys(
+        invocation_context
+    )
     if not artifact_names:
       return
 
@@ -95,8 +114,10 @@ class LoadArtifactsTool(BaseTool):
       function_response = llm_request.contents[-1].parts[0].function_response
       if function_response and function_response.name == 'load_artifacts':
         artifact_names = function_response.response['artifact_names']
-        for artifact_name in artifact_names:
-          artifact = await tool_context.load_artifact(artifact_name)
+        artifacts = await artifact_manifest.load_artifacts(
+            invocation_context, artifact_names
+        )
+        for artifact_name, artifact in zip(artifact_names, artifacts):
           llm_request.contents.append(
               types.Content(
                   role='user',
@@ -104,10 +125,31 @@ class LoadArtifactsTool(BaseTool):
                       types.Part.from_text(
                           text=f'Artifact {artifact_name} is:'
                       ),
-                      artifact,
+                      self._inline_or_describe(artifact_name, artifact),
                   ],
               )
           )
 
+  def _inline_or_describe(
+      self, artifact_name: str, artifact: types.Part
+  ) -> types.Part:
+    """Replaces artifacts too large to send inline with a description."""
+    if (
+        self._max_inline_bytes is None
+        or not artifact
+        or not artifact.inline_data
+        or not artifact.inline_data.data
+        or len(artifact.inline_data.data) <= self._max_inline_bytes
+    ):
+      return artifact
+    return types.Part.from_text(
+        text=(
+            f'<Artifact {artifact_name} of type'
+            f' {artifact.inline_data.mime_type} and size'
+            f' {len(artifact.inline_data.data)} bytes is too large to be'
+            ' included.>'
+        )
+    )
+
 
 load_artifacts_tool = LoadArtifactsTool()
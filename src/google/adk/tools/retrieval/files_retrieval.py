@@ -16,24 +16,357 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
 
+from llama_index.core import load_index_from_storage
+from llama_index.core import Settings
 from llama_index.core import SimpleDirectoryReader
+from llama_index.core import StorageContext
 from llama_index.core import VectorStoreIndex
+from typing_extensions import override
 
+from ..tool_context import ToolContext
 from .llama_index_retrieval import LlamaIndexRetrieval
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_PERSIST_DIR_ENV_VARIABLE_NAME = "ADK_FILES_RETRIEVAL_INDEX_DIR"
+_MANIFEST_FILE_NAME = "adk_files_manifest.json"
+# Attributes embedding models use for the size of their embeddings.
+_EMBED_DIMENSION_ATTRIBUTES = (
+    "dimensions",
+    "embed_dim",
+    "output_dimensionality",
+)
+
+
+def _default_persist_dir(input_dir: str) -> str:
+  """Returns a cache directory for the index of `input_dir`."""
+  root_dir = os.environ.get(
+      _PERSIST_DIR_ENV_VARIABLE_NAME,
+      os.path.join(
+          os.path.expanduser("~"), ".cache", "google_adk", "files_retrieval"
+      ),
+  )
+  input_dir_digest = hashlib.sha256(
+      os.path.realpath(input_dir).encode("utf-8")
+  ).hexdigest()
+  return os.path.join(root_dir, input_dir_digest[:32])
+
+
+def _embed_model_fingerprint() -> Dict[str, Any]:
+  """Identifies the embedding model that indexes are built with.
+
+  Embeddings of different models, or of one model with different dimensions,
+  can't be compared, so an index persisted with another fingerprint is
+  rebuilt.
+  """
+  embed_model = Settings.embed_model
+  dimensions = None
+  for attribute in _EMBED_DIMENSION_ATTRIBUTES:
+    dimensions = getattr(embed_model, attribute, None)
+    if dimensions is not None:
+      break
+  return {
+      "class_name": embed_model.class_name(),
+      "model_name": embed_model.model_name,
+      "dimensions": dimensions,
+  }
+
+
+def _file_sha256(path: str) -> str:
+  digest = hashlib.sha256()
+  with open(path, "rb") as f:
+    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+      digest.update(chunk)
+  return digest.hexdigest()
+
 
 class FilesRetrieval(LlamaIndexRetrieval):
+  """Retrieves from the files of a directory through a persisted vector index.
+
+  The index is persisted under `persist_dir` together with a manifest of the
+  indexed files' mtimes, sizes and content hashes and of the embedding model.
+  On startup the persisted index is loaded instead of re-embedding the whole
+  directory, and only files that were added, changed or removed since are
+  re-chunked and re-embedded. An index persisted with another embedding model
+  or embedding size is rebuilt.
+
+  `refresh` applies the same incremental update to a working copy of the
+  index and then swaps the retriever, so queries keep being served from the
+  previous index while a refresh is in progress.
+  """
+
+  def __init__(
+      self,
+      *,
+      name: str,
+      description: str,
+      input_dir: str,
+      persist_dir: Optional[str] = None,
+      refresh_interval_seconds: Optional[float] = None,
+  ):
+    """Initializes the files retrieval.
 
-  def __init__(self, *, name: str, description: str, input_dir: str):
+    Args:
+      name: The name of the tool.
+      description: The description of the tool.
+      input_dir: The directory with the files to retrieve from.
+      persist_dir: Directory to persist the index in. Defaults to a directory
+        for `input_dir` under the `ADK_FILES_RETRIEVAL_INDEX_DIR` environment
+        variable or `~/.cache/google_adk/files_retrieval`. Pass an empty
+        string to keep the index in memory only.
+      refresh_interval_seconds: If set, queries trigger a background refresh
+        of the index when the last refresh is older than this interval.
+    """
 
     self.input_dir = input_dir
+    self.persist_dir = (
+        _default_persist_dir(input_dir) if persist_dir is None else persist_dir
+    )
+    self._refresh_interval_seconds = refresh_interval_seconds
+    self._refresh_lock = threading.Lock()
+    self._refresh_task: Optional[asyncio.Task] = None
 
     logger.info("Loading data from %s", input_dir)
-    retriever = VectorStoreIndex.from_documents(
-        SimpleDirectoryReader(input_dir).load_data()
-    ).as_retriever()
-    super().__init__(name=name, description=description, retriever=retriever)
+    self._index, self._manifest = self._load_or_build_index()
+    self._last_refresh_time = time.monotonic()
+    super().__init__(
+        name=name,
+        description=description,
+        retriever=self._index.as_retriever(),
+    )
+
+  @override
+  async def run_async(
+      self, *, args: dict[str, Any], tool_context: ToolContext
+  ) -> Any:
+    if (
+        self._refresh_interval_seconds is not None
+        and time.monotonic() - self._last_refresh_time
+        >= self._refresh_interval_seconds
+        and (self._refresh_task is None or self._refresh_task.done())
+    ):
+      self._refresh_task = asyncio.create_task(self.refresh_async())
+    return await super().run_async(args=args, tool_context=tool_context)
+
+  def refresh(self) -> bool:
+    """Re-indexes the files that changed since the last refresh.
+
+    Returns:
+      True if the index or its manifest was updated.
+    """
+    with self._refresh_lock:
+      self._last_refresh_time = time.monotonic()
+      index = self._load_persisted_index()
+      if index is None:
+        # Without a persisted copy, changes cannot be applied off to the side
+        # of the live index, so the index is rebuilt instead.
+        if not any(self._find_changes(self._manifest)):
+          return False
+        index, manifest = self._build_index()
+      else:
+        manifest = dict(self._manifest)
+        if not self._apply_changes(index, manifest):
+          return False
+        self._persist(index, manifest)
+      self._index, self._manifest = index, manifest
+      self.retriever = index.as_retriever()
+      return True
+
+  async def refresh_async(self) -> bool:
+    """Runs `refresh` in a worker thread, without blocking the event loop."""
+    try:
+      return await asyncio.to_thread(self.refresh)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning("Failed to refresh index of %s: %s", self.input_dir, e)
+      return False
+
+  def _load_or_build_index(self):
+    index = self._load_persisted_index()
+    if index is None:
+      return self._build_index()
+    manifest = self._read_manifest()
+    if self._apply_changes(index, manifest):
+      self._persist(index, manifest)
+    return index, manifest
+
+  def _build_index(self):
+    documents = SimpleDirectoryReader(
+        self.input_dir, filename_as_id=True
+    ).load_data()
+    index = VectorStoreIndex.from_documents(documents)
+    manifest = {}
+    for path in self._list_files():
+      manifest[path] = self._file_entry(path, _file_sha256(path))
+    for document in documents:
+      entry = manifest.get(document.metadata.get("file_path"))
+      if entry is not None:
+        entry["doc_ids"].append(document.doc_id)
+    self._persist(index, manifest)
+    return index, manifest
+
+  def _apply_changes(
+      self, index: VectorStoreIndex, manifest: Dict[str, Dict[str, Any]]
+  ) -> bool:
+    """Updates the index and manifest in place.
+
+    Returns:
+      True if the index or the manifest changed.
+    """
+    changed_paths, removed_paths, touched = self._find_changes(manifest)
+    for path, entry in touched.items():
+      manifest[path] = entry
+    for path in removed_paths + changed_paths:
+      for doc_id in manifest.pop(path, {}).get("doc_ids", []):
+        index.delete_ref_doc(doc_id, delete_from_docstore=True)
+    if changed_paths:
+      logger.info(
+          "Re-indexing %d changed file(s) in %s",
+          len(changed_paths),
+          self.input_dir,
+      )
+      documents = SimpleDirectoryReader(
+          input_files=changed_paths, filename_as_id=True
+      ).load_data()
+      for path in changed_paths:
+        manifest[path] = self._file_entry(path, _file_sha256(path))
+      for document in documents:
+        index.insert(document)
+        entry = manifest.get(document.metadata.get("file_path"))
+        if entry is not None:
+          entry["doc_ids"].append(document.doc_id)
+    return bool(changed_paths or removed_paths or touched)
+
+  def _find_changes(self, manifest: Dict[str, Dict[str, Any]]):
+    """Compares the files on disk against the manifest.
+
+    Returns:
+      The paths whose content changed or that are new, the paths that were
+      removed, and refreshed manifest entries of files that were touched
+      without their content changing.
+    """
+    files = self._list_files()
+    changed_paths = []
+    touched = {}
+    for path in files:
+      entry = manifest.get(path)
+      stat = os.stat(path)
+      if (
+          entry
+          and entry["mtime_ns"] == stat.st_mtime_ns
+          and entry["size"] == stat.st_size
+      ):
+        continue
+      sha256 = _file_sha256(path)
+      if entry and entry["sha256"] == sha256:
+        touched[path] = {
+            **self._file_entry(path, sha256),
+            "doc_ids": entry["doc_ids"],
+        }
+      else:
+        changed_paths.append(path)
+    file_set = set(files)
+    removed_paths = [path for path in manifest if path not in file_set]
+    return changed_paths, removed_paths, touched
+
+  def _list_files(self) -> List[str]:
+    try:
+      reader = SimpleDirectoryReader(self.input_dir)
+    except ValueError:
+      # Raised by the reader when the directory has no files left.
+      return []
+    return [str(path) for path in reader.input_files]
+
+  def _file_entry(self, path: str, sha256: str) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+        "doc_ids": [],
+    }
+
+  def _load_persisted_index(self) -> Optional[VectorStoreIndex]:
+    if not self.persist_dir or not os.path.exists(
+        os.path.join(self.persist_dir, _MANIFEST_FILE_NAME)
+    ):
+      return None
+    try:
+      embed_model = self._read_manifest_file().get("embed_model")
+      if embed_model != _embed_model_fingerprint():
+        logger.info(
+            "Rebuilding index in %s, which was built with embedding model %s",
+            self.persist_dir,
+            embed_model,
+        )
+        return None
+      return load_index_from_storage(
+          StorageContext.from_defaults(persist_dir=self.persist_dir)
+      )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning(
+          "Ignoring unreadable index in %s, rebuilding it: %s",
+          self.persist_dir,
+          e,
+      )
+      return None
+
+  def _read_manifest_file(self) -> Dict[str, Any]:
+    with open(
+        os.path.join(self.persist_dir, _MANIFEST_FILE_NAME), encoding="utf-8"
+    ) as f:
+      return json.load(f)
+
+  def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+    return self._read_manifest_file()["files"]
+
+  def _persist(
+      self, index: VectorStoreIndex, manifest: Dict[str, Dict[str, Any]]
+  ) -> None:
+    if not self.persist_dir:
+      return
+    manifest_path = os.path.join(self.persist_dir, _MANIFEST_FILE_NAME)
+    tmp_dir = None
+    try:
+      os.makedirs(self.persist_dir, exist_ok=True)
+      # Everything is written to temporary files first, so that a failure
+      # while writing leaves the persisted index as it was.
+      tmp_dir = tempfile.mkdtemp(dir=self.persist_dir, suffix=".tmp")
+      index.storage_context.persist(persist_dir=tmp_dir)
+      with open(
+          os.path.join(tmp_dir, _MANIFEST_FILE_NAME), "w", encoding="utf-8"
+      ) as f:
+        json.dump(
+            {"files": manifest, "embed_model": _embed_model_fingerprint()}, f
+        )
+      # The manifest marks a usable index, so it is removed before the store
+      # files are replaced and written back last. If the process dies in
+      # between, the index is rebuilt rather than loaded with a manifest that
+      # doesn't match it.
+      if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+      for file_name in os.listdir(tmp_dir):
+        if file_name != _MANIFEST_FILE_NAME:
+          os.replace(
+              os.path.join(tmp_dir, file_name),
+              os.path.join(self.persist_dir, file_name),
+          )
+      os.replace(os.path.join(tmp_dir, _MANIFEST_FILE_NAME), manifest_path)
+    except OSError as e:
+      logger.warning("Failed to persist index to %s: %s", self.persist_dir, e)
+    finally:
+      if tmp_dir:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
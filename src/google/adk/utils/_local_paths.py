@@ -0,0 +1,51 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for storing data under a root directory by caller-given names."""
+
+from __future__ import annotations
+
+import os
+from urllib.parse import quote
+
+
+def encode_path_component(name: str) -> str:
+  """Percent-encodes a name for use as a single path component.
+
+  Raises:
+    ValueError: If the name is empty, "." or "..", which would not name a
+      child of the directory it is joined to.
+  """
+  if name in ("", ".", ".."):
+    raise ValueError(f"Invalid name for a path component: {name!r}")
+  return quote(name, safe="")
+
+
+def join_under_root(root_dir: str, *components: str) -> str:
+  """Joins path components to a root directory, checking the result.
+
+  The components are used as given, so callers percent-encode names first.
+
+  Raises:
+    ValueError: If the resolved path, following any symbolic links, is not
+      inside the root directory.
+  """
+  for component in components:
+    if component in ("", ".", "..") or os.sep in component:
+      raise ValueError(f"Invalid path component: {component!r}")
+  path = os.path.join(root_dir, *components)
+  root = os.path.realpath(root_dir)
+  if os.path.commonpath([root, os.path.realpath(path)]) != root:
+    raise ValueError(f"Path {path!r} is outside of {root_dir!r}")
+  return path
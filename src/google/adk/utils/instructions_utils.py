@@ -83,11 +83,8 @@ async def inject_session_state(
       var_name = var_name.removeprefix('artifact.')
       if invocation_context.artifact_service is None:
         raise ValueError('Artifact service is not initialized.')
-      artifact = await invocation_context.artifact_service.load_artifact(
-          app_name=invocation_context.session.app_name,
-          user_id=invocation_context.session.user_id,
-          session_id=invocation_context.session.id,
-          filename=var_name,
+      artifact = await invocation_context.artifact_manifest.load_artifact(
+          invocation_context, var_name
       )
       if not var_name:
         raise KeyError(f'Artifact {var_name} not found.')
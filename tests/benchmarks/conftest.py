@@ -0,0 +1,63 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline benchmarks, built on pytest-benchmark and deterministic fakes.
+
+Run them, and save the results, with:
+
+  pytest tests/benchmarks --benchmark-json=benchmark.json
+
+Then write a baseline, or compare against one, with:
+
+  python -m tests.benchmarks.report baseline benchmark.json
+  python -m tests.benchmarks.report compare benchmark.json
+
+The benchmarks need no network or credentials. They are not part of the
+default `pytest` run, so pass `tests/benchmarks` explicitly.
+
+To regenerate `baseline.json`, for example after an intended performance
+change or when moving CI to a different machine type, run the benchmarks on
+an otherwise idle machine of the type CI uses, write the baseline from that
+run and commit it:
+
+  pytest tests/benchmarks --benchmark-json=benchmark.json
+  python -m tests.benchmarks.report baseline benchmark.json
+
+The baseline records the machine info, since timings from different machines
+are not comparable.
+"""
+
+import asyncio
+from typing import Awaitable
+from typing import Callable
+from typing import TypeVar
+
+import pytest
+
+_T = TypeVar('_T')
+
+
+@pytest.fixture
+def run_async():
+  """Runs coroutines on a single event loop shared across rounds.
+
+  Reusing the loop keeps its setup cost out of the measurements.
+  """
+  loop = asyncio.new_event_loop()
+
+  def run(coroutine_function: Callable[[], Awaitable[_T]]) -> _T:
+    return loop.run_until_complete(coroutine_function())
+
+  yield run
+  loop.close()
@@ -0,0 +1,173 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deterministic fakes for the offline benchmarks."""
+
+from __future__ import annotations
+
+from typing import AsyncGenerator
+
+from google.adk.events.event import Event
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from typing_extensions import override
+
+_ANSWER = 'The answer is 42. ' * 8
+
+
+class FakeLlm(BaseLlm):
+  """An LLM that answers instantly and always the same way.
+
+  If the request declares tools and does not end with function responses, it
+  calls every tool once with `query="benchmark"`. Otherwise it answers with a
+  fixed text, in `stream_chunks` partial chunks when streaming.
+  """
+
+  model: str = 'fake-llm'
+  stream_chunks: int = 4
+
+  @staticmethod
+  @override
+  def supported_models() -> list[str]:
+    return ['fake-llm']
+
+  @override
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    usage_metadata = types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=100,
+        candidates_token_count=20,
+        total_token_count=120,
+    )
+    last_content = llm_request.contents[-1] if llm_request.contents else None
+    answered_tools = last_content is not None and any(
+        part.function_response for part in last_content.parts or []
+    )
+    if llm_request.tools_dict and not answered_tools:
+      yield LlmResponse(
+          content=types.Content(
+              role='model',
+              parts=[
+                  types.Part.from_function_call(
+                      name=name, args={'query': 'benchmark'}
+                  )
+                  for name in llm_request.tools_dict
+              ],
+          ),
+          usage_metadata=usage_metadata,
+      )
+      return
+
+    if stream:
+      chunk_size = len(_ANSWER) // self.stream_chunks + 1
+      for i in range(0, len(_ANSWER), chunk_size):
+        yield LlmResponse(
+            content=types.Content(
+                role='model',
+                parts=[types.Part.from_text(text=_ANSWER[i : i + chunk_size])],
+            ),
+            partial=True,
+        )
+    yield LlmResponse(
+        content=types.Content(
+            role='model', parts=[types.Part.from_text(text=_ANSWER)]
+        ),
+        usage_metadata=usage_metadata,
+    )
+
+
+def lookup(query: str) -> dict[str, str]:
+  """Looks up a record.
+
+  Args:
+    query: What to look up.
+
+  Returns:
+    The record found.
+  """
+  return {'query': query, 'record': 'found'}
+
+
+def summarize(query: str, max_words: int = 20) -> str:
+  """Summarizes a text.
+
+  Args:
+    query: The text to summarize.
+    max_words: The maximum number of words of the summary.
+
+  Returns:
+    The summary.
+  """
+  return ' '.join(query.split()[:max_words])
+
+
+def make_conversation(num_events: int, author: str = 'agent') -> list[Event]:
+  """Builds a session history that cycles through the common event kinds.
+
+  The cycle is a user message, a function call, its function response and a
+  model text answer.
+  """
+  events = []
+  for i in range(num_events):
+    kind = i % 4
+    if kind == 0:
+      event = Event(
+          author='user',
+          content=types.Content(
+              role='user', parts=[types.Part.from_text(text=f'Question {i}')]
+          ),
+      )
+    elif kind == 1:
+      event = Event(
+          author=author,
+          content=types.Content(
+              role='model',
+              parts=[
+                  types.Part(
+                      function_call=types.FunctionCall(
+                          id=f'call-{i}', name='lookup', args={'query': str(i)}
+                      )
+                  )
+              ],
+          ),
+      )
+    elif kind == 2:
+      event = Event(
+          author=author,
+          content=types.Content(
+              role='user',
+              parts=[
+                  types.Part(
+                      function_response=types.FunctionResponse(
+                          id=f'call-{i - 1}',
+                          name='lookup',
+                          response=lookup(str(i - 1)),
+                      )
+                  )
+              ],
+          ),
+      )
+    else:
+      event = Event(
+          author=author,
+          content=types.Content(
+              role='model', parts=[types.Part.from_text(text=_ANSWER)]
+          ),
+      )
+    event.invocation_id = f'invocation-{i // 4}'
+    events.append(event)
+  return events
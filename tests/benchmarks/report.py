@@ -0,0 +1,170 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Writes benchmark baselines and compares benchmark runs against them.
+
+Both commands read the JSON written by `pytest --benchmark-json`:
+
+  python -m tests.benchmarks.report baseline benchmark.json
+  python -m tests.benchmarks.report compare benchmark.json --threshold 0.2
+
+`compare` prints a Markdown report and exits with status 1 if a benchmark's
+median regressed by more than the threshold, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Any
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def _load_results(path: str) -> dict[str, dict[str, float]]:
+  """Loads the statistics of a `--benchmark-json` file, keyed by test id."""
+  with open(path, encoding='utf-8') as f:
+    report = json.load(f)
+  return {
+      benchmark['fullname']: {
+          'median': benchmark['stats']['median'],
+          'mean': benchmark['stats']['mean'],
+          'stddev': benchmark['stats']['stddev'],
+          'rounds': benchmark['stats']['rounds'],
+      }
+      for benchmark in report['benchmarks']
+  }
+
+
+def write_baseline(results_path: str, baseline_path: str) -> None:
+  """Writes the statistics of a benchmark run as the baseline."""
+  with open(results_path, encoding='utf-8') as f:
+    machine_info = json.load(f).get('machine_info', {})
+  baseline = {
+      'machine_info': {
+          key: machine_info.get(key)
+          for key in ['python_implementation', 'python_version', 'machine']
+      },
+      'benchmarks': _load_results(results_path),
+  }
+  with open(baseline_path, 'w', encoding='utf-8') as f:
+    json.dump(baseline, f, indent=2, sort_keys=True)
+    f.write('\n')
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    results: dict[str, dict[str, float]],
+    threshold: float,
+) -> tuple[list[dict[str, Any]], bool]:
+  """Compares the medians of a benchmark run against the baseline.
+
+  Args:
+    baseline: The baseline statistics, keyed by test id.
+    results: The statistics of the run, keyed by test id.
+    threshold: The relative change of the median above which a benchmark
+      counts as regressed, or below the negative of which as improved.
+
+  Returns:
+    The rows of the report, and whether any benchmark regressed.
+  """
+  rows = []
+  regressed = False
+  for name in sorted(baseline.keys() | results.keys()):
+    before = baseline.get(name, {}).get('median')
+    after = results.get(name, {}).get('median')
+    change = None
+    if before is None:
+      status = 'new'
+    elif after is None:
+      status = 'missing'
+    else:
+      change = after / before - 1
+      if change > threshold:
+        status = 'regressed'
+        regressed = True
+      elif change < -threshold:
+        status = 'improved'
+      else:
+        status = 'unchanged'
+    rows.append({
+        'name': name,
+        'before': before,
+        'after': after,
+        'change': change,
+        'status': status,
+    })
+  return rows, regressed
+
+
+def _format_seconds(value: float | None) -> str:
+  if value is None:
+    return '-'
+  if value >= 1:
+    return f'{value:.2f} s'
+  if value >= 1e-3:
+    return f'{value * 1e3:.2f} ms'
+  return f'{value * 1e6:.1f} us'
+
+
+def format_report(rows: list[dict[str, Any]]) -> str:
+  """Formats the rows of a comparison as a Markdown table."""
+  lines = [
+      '| Benchmark | Baseline median | Median | Change | Status |',
+      '| --- | ---: | ---: | ---: | --- |',
+  ]
+  for row in rows:
+    change = '-' if row['change'] is None else f'{row["change"]:+.1%}'
+    lines.append(
+        f'| {row["name"]} | {_format_seconds(row["before"])} |'
+        f' {_format_seconds(row["after"])} | {change} | {row["status"]} |'
+    )
+  return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+  parser = argparse.ArgumentParser(description=__doc__)
+  subparsers = parser.add_subparsers(dest='command', required=True)
+
+  baseline_parser = subparsers.add_parser(
+      'baseline', help='Write the results of a run as the baseline.'
+  )
+  baseline_parser.add_argument('results', help='A --benchmark-json file.')
+  baseline_parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH)
+
+  compare_parser = subparsers.add_parser(
+      'compare', help='Compare the results of a run against the baseline.'
+  )
+  compare_parser.add_argument('results', help='A --benchmark-json file.')
+  compare_parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH)
+  compare_parser.add_argument('--threshold', type=float, default=0.2)
+
+  args = parser.parse_args(argv)
+  if args.command == 'baseline':
+    write_baseline(args.results, args.baseline)
+    return 0
+
+  with open(args.baseline, encoding='utf-8') as f:
+    baseline = json.load(f)['benchmarks']
+  rows, regressed = compare(
+      baseline, _load_results(args.results), args.threshold
+  )
+  print(format_report(rows))
+  return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,90 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the converters between ADK events and A2A messages."""
+
+import sys
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+if sys.version_info < (3, 10):
+  pytest.skip('A2A requires Python 3.10+', allow_module_level=True)
+
+from google.adk.a2a.converters.event_converter import convert_a2a_message_to_event
+from google.adk.a2a.converters.event_converter import convert_event_to_a2a_events
+from google.adk.a2a.converters.event_converter import convert_event_to_a2a_message
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+
+from .fakes import make_conversation
+
+
+@pytest.fixture(autouse=True)
+def allow_wip_features(monkeypatch):
+  # The A2A converters are still marked as work in progress.
+  monkeypatch.setenv('ADK_ALLOW_WIP_FEATURES', 'true')
+
+
+@pytest.fixture
+def invocation_context(run_async) -> InvocationContext:
+  session_service = InMemorySessionService()
+  session = run_async(
+      lambda: session_service.create_session(
+          app_name='benchmark', user_id='user'
+      )
+  )
+  return InvocationContext(
+      invocation_id='invocation',
+      agent=LlmAgent(name='agent'),
+      session=session,
+      session_service=session_service,
+  )
+
+
+def test_convert_event_to_a2a_events(benchmark, invocation_context):
+  events = make_conversation(4)
+
+  def convert():
+    return [
+        a2a_event
+        for event in events
+        for a2a_event in convert_event_to_a2a_events(
+            event, invocation_context, task_id='task', context_id='context'
+        )
+    ]
+
+  a2a_events = benchmark(convert)
+
+  assert a2a_events
+
+
+def test_a2a_message_round_trip(benchmark, invocation_context):
+  events = make_conversation(4)
+
+  def round_trip():
+    return [
+        convert_a2a_message_to_event(
+            convert_event_to_a2a_message(event, invocation_context),
+            author=event.author,
+            invocation_context=invocation_context,
+        )
+        for event in events
+    ]
+
+  converted = benchmark(round_trip)
+
+  assert len(converted) == len(events)
@@ -0,0 +1,104 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the overhead of workflow agents and invocation contexts."""
+
+from typing import AsyncGenerator
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.loop_agent import LoopAgent
+from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.events import Event
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+import pytest
+from typing_extensions import override
+
+pytest.importorskip('pytest_benchmark')
+
+
+class _NoopAgent(BaseAgent):
+  """Yields a single empty event, so that only the agent overhead counts."""
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    yield Event(
+        invocation_id=ctx.invocation_id, author=self.name, branch=ctx.branch
+    )
+
+
+def _build_tree(depth: int, width: int, prefix: str = 'agent') -> BaseAgent:
+  """Builds a tree cycling through sequential, loop and parallel agents."""
+  if depth == 0:
+    return _NoopAgent(name=prefix)
+  sub_agents = [
+      _build_tree(depth - 1, width, f'{prefix}_{i}') for i in range(width)
+  ]
+  kind = depth % 3
+  if kind == 0:
+    return SequentialAgent(name=prefix, sub_agents=sub_agents)
+  if kind == 1:
+    return LoopAgent(name=prefix, max_iterations=2, sub_agents=sub_agents)
+  return ParallelAgent(name=prefix, sub_agents=sub_agents)
+
+
+def _new_invocation_context(agent: BaseAgent) -> InvocationContext:
+  return InvocationContext(
+      invocation_id='invocation',
+      agent=agent,
+      session=Session(id='session', app_name='app', user_id='user'),
+      session_service=InMemorySessionService(),
+  )
+
+
+def test_invocation_context_fork(benchmark):
+  ctx = _new_invocation_context(_NoopAgent(name='parent'))
+  agent = _NoopAgent(name='child')
+
+  forked = benchmark(ctx.fork, agent=agent, branch='parent.child')
+
+  assert forked.agent is agent
+
+
+def test_invocation_context_model_copy(benchmark):
+  """The pydantic copy that forks replace, for reference."""
+  ctx = _new_invocation_context(_NoopAgent(name='parent'))
+  agent = _NoopAgent(name='child')
+
+  copied = benchmark(
+      ctx.model_copy, update={'agent': agent, 'branch': 'parent.child'}
+  )
+
+  assert copied.agent is agent
+
+
+@pytest.mark.parametrize(
+    'depth,width', [(3, 2), (3, 4), (5, 2)], ids=['3x2', '3x4', '5x2']
+)
+def test_nested_workflow_agents(benchmark, run_async, depth, width):
+  root_agent = _build_tree(depth, width)
+
+  async def run():
+    ctx = _new_invocation_context(root_agent)
+    return [event async for event in root_agent.run_async(ctx)]
+
+  events = benchmark(lambda: run_async(run))
+
+  # Loop agents run their sub-agents twice.
+  num_loops = sum(1 for level in range(1, depth + 1) if level % 3 == 1)
+  assert len(events) == width**depth * 2**num_loops
@@ -0,0 +1,31 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of building the contents of LLM requests from session events."""
+
+from google.adk.flows.llm_flows.contents import _get_contents
+import pytest
+
+from .fakes import make_conversation
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('num_events', [10, 100, 1000])
+def test_get_contents(benchmark, num_events):
+  events = make_conversation(num_events)
+
+  contents = benchmark(_get_contents, None, events, 'agent')
+
+  assert len(contents) == num_events
@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of SSE streaming through the FastAPI server."""
+
+from unittest import mock
+
+from fastapi.testclient import TestClient
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.cli.fast_api import get_fast_api_app
+import pytest
+
+from .fakes import FakeLlm
+from .fakes import lookup
+
+pytest.importorskip('pytest_benchmark')
+
+_APP_NAME = 'benchmark_app'
+_USER_ID = 'user'
+
+
+@pytest.fixture
+def client(tmp_path):
+  agent_loader = mock.MagicMock()
+  agent_loader.load_agent.return_value = LlmAgent(
+      name='agent', model=FakeLlm(stream_chunks=8), tools=[lookup]
+  )
+  with mock.patch(
+      'google.adk.cli.fast_api.AgentLoader', return_value=agent_loader
+  ):
+    app = get_fast_api_app(agents_dir=str(tmp_path), web=False)
+  with TestClient(app) as client:
+    yield client
+
+
+@pytest.mark.parametrize('streaming', [False, True], ids=['events', 'chunks'])
+def test_run_sse(benchmark, client, streaming):
+  def create_session():
+    response = client.post(f'/apps/{_APP_NAME}/users/{_USER_ID}/sessions')
+    return (response.json()['id'],), {}
+
+  def run_sse(session_id: str) -> list[str]:
+    response = client.post(
+        '/run_sse',
+        json={
+            'app_name': _APP_NAME,
+            'user_id': _USER_ID,
+            'session_id': session_id,
+            'new_message': {'role': 'user', 'parts': [{'text': 'Hello'}]},
+            'streaming': streaming,
+        },
+    )
+    return [line for line in response.iter_lines() if line]
+
+  lines = benchmark.pedantic(run_sse, setup=create_session, rounds=50)
+
+  # The function call, its response and the answer, plus the answer's partial
+  # chunks when streaming.
+  assert len(lines) == (11 if streaming else 3)
@@ -0,0 +1,72 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of building function declarations for `FunctionTool`."""
+
+from typing import Optional
+
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+import pydantic
+import pytest
+
+from .fakes import lookup
+
+pytest.importorskip('pytest_benchmark')
+
+
+class Address(pydantic.BaseModel):
+  street: str
+  city: str
+  postal_code: Optional[str] = None
+
+
+class Customer(pydantic.BaseModel):
+  name: str
+  email: str
+  addresses: list[Address]
+  tags: list[str] = []
+
+
+def update_customer(
+    customer_id: str,
+    customer: Customer,
+    notify: bool = False,
+    reasons: Optional[list[str]] = None,
+    tool_context: Optional[ToolContext] = None,
+) -> dict[str, str]:
+  """Updates a customer record.
+
+  Args:
+    customer_id: The id of the customer to update.
+    customer: The new customer record.
+    notify: Whether to notify the customer.
+    reasons: Why the record is updated.
+    tool_context: The tool context.
+
+  Returns:
+    The status of the update.
+  """
+  return {'status': 'ok'}
+
+
+@pytest.mark.parametrize(
+    'function', [lookup, update_customer], ids=['simple', 'nested_model']
+)
+def test_function_tool_declaration(benchmark, function):
+  tool = FunctionTool(function)
+
+  declaration = benchmark(tool._get_declaration)
+
+  assert declaration.name == function.__name__
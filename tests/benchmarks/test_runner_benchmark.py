@@ -0,0 +1,94 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of end-to-end agent runs through `Runner.run_async`."""
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+import pytest
+
+from .fakes import FakeLlm
+from .fakes import lookup
+from .fakes import summarize
+
+pytest.importorskip('pytest_benchmark')
+
+_USER_ID = 'user'
+_NEW_MESSAGE = types.Content(
+    role='user', parts=[types.Part.from_text(text='Tell me the answer.')]
+)
+
+
+def _benchmark_run(benchmark, run_async, runner: InMemoryRunner) -> list:
+  async def create_session():
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id=_USER_ID
+    )
+    return (session.id,), {}
+
+  async def run(session_id: str):
+    return [
+        event
+        async for event in runner.run_async(
+            user_id=_USER_ID, session_id=session_id, new_message=_NEW_MESSAGE
+        )
+    ]
+
+  return benchmark.pedantic(
+      lambda session_id: run_async(lambda: run(session_id)),
+      setup=lambda: run_async(create_session),
+      rounds=100,
+  )
+
+
+def test_run_async_text_answer(benchmark, run_async):
+  runner = InMemoryRunner(LlmAgent(name='agent', model=FakeLlm()))
+
+  events = _benchmark_run(benchmark, run_async, runner)
+
+  assert len(events) == 1
+
+
+def test_run_async_with_tool_calls(benchmark, run_async):
+  runner = InMemoryRunner(
+      LlmAgent(
+          name='agent',
+          model=FakeLlm(),
+          instruction='Answer with the help of tools.',
+          tools=[lookup, summarize],
+      )
+  )
+
+  events = _benchmark_run(benchmark, run_async, runner)
+
+  assert len(events) == 3
+
+
+@pytest.mark.parametrize('num_branches', [2, 8, 32])
+def test_parallel_agent_fan_out(benchmark, run_async, num_branches):
+  runner = InMemoryRunner(
+      ParallelAgent(
+          name='parallel',
+          sub_agents=[
+              LlmAgent(name=f'branch_{i}', model=FakeLlm())
+              for i in range(num_branches)
+          ],
+      )
+  )
+
+  events = _benchmark_run(benchmark, run_async, runner)
+
+  assert len(events) == num_branches
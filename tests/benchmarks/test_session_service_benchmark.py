@@ -0,0 +1,86 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the get and append operations of the session services.
+
+The Vertex AI session service needs a live backend and is not covered.
+"""
+
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.adk.sessions.database_session_service import DatabaseSessionService
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+import pytest
+
+from .fakes import make_conversation
+
+pytest.importorskip('pytest_benchmark')
+
+_APP_NAME = 'benchmark'
+_USER_ID = 'user'
+_NUM_EVENTS = 100
+
+
+@pytest.fixture(params=['in_memory', 'database'])
+def session_service(request, tmp_path) -> BaseSessionService:
+  if request.param == 'in_memory':
+    return InMemorySessionService()
+  return DatabaseSessionService(f'sqlite:///{tmp_path / "sessions.db"}')
+
+
+async def _create_session_with_history(session_service: BaseSessionService):
+  session = await session_service.create_session(
+      app_name=_APP_NAME, user_id=_USER_ID, state={'counter': 0}
+  )
+  for event in make_conversation(_NUM_EVENTS):
+    await session_service.append_event(session, event)
+  return session
+
+
+def test_get_session(benchmark, run_async, session_service):
+  session = run_async(lambda: _create_session_with_history(session_service))
+
+  fetched = benchmark(
+      lambda: run_async(
+          lambda: session_service.get_session(
+              app_name=_APP_NAME, user_id=_USER_ID, session_id=session.id
+          )
+      )
+  )
+
+  assert len(fetched.events) == _NUM_EVENTS
+
+
+def test_append_event(benchmark, run_async, session_service):
+  session = run_async(
+      lambda: session_service.create_session(
+          app_name=_APP_NAME, user_id=_USER_ID
+      )
+  )
+
+  def append_event():
+    event = Event(
+        author='agent',
+        content=types.Content(
+            role='model', parts=[types.Part.from_text(text='An answer.')]
+        ),
+        actions=EventActions(state_delta={'counter': 1}),
+    )
+    return run_async(lambda: session_service.append_event(session, event))
+
+  event = benchmark(append_event)
+
+  assert event.content.parts[0].text == 'An answer.'
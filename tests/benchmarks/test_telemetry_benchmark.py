@@ -0,0 +1,132 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the per-step telemetry overhead at each telemetry level.
+
+A step traces one LLM call and one tool call, as an LLM flow does for a
+function-calling turn.
+"""
+
+from google.adk import telemetry
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events.event import Event
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+import pytest
+
+from .fakes import lookup
+
+pytest.importorskip('pytest_benchmark')
+
+_HISTORY_LENGTH = 20
+
+
+@pytest.fixture
+def configure_telemetry(monkeypatch):
+  def configure(level: telemetry.TelemetryLevel, sampled: bool) -> None:
+    provider = (
+        TracerProvider() if sampled else TracerProvider(sampler=ALWAYS_OFF)
+    )
+    monkeypatch.setattr(
+        telemetry, 'tracer', provider.get_tracer('gcp.vertex.agent')
+    )
+    telemetry.set_telemetry_level(level)
+
+  yield configure
+  telemetry.set_telemetry_level(telemetry.TelemetryLevel.FULL)
+
+
+@pytest.mark.parametrize(
+    ('level', 'sampled'),
+    [
+        (telemetry.TelemetryLevel.FULL, True),
+        (telemetry.TelemetryLevel.METADATA, True),
+        (telemetry.TelemetryLevel.OFF, True),
+        (telemetry.TelemetryLevel.FULL, False),
+    ],
+    ids=['full', 'metadata', 'off', 'full_not_sampled'],
+)
+def test_trace_llm_and_tool_call(
+    benchmark, run_async, configure_telemetry, level, sampled
+):
+  async def create_invocation_context() -> InvocationContext:
+    session_service = InMemorySessionService()
+    session = await session_service.create_session(
+        app_name='benchmark', user_id='user'
+    )
+    return InvocationContext(
+        invocation_id='invocation',
+        agent=LlmAgent(name='agent'),
+        session=session,
+        session_service=session_service,
+    )
+
+  invocation_context = run_async(create_invocation_context)
+  llm_request = LlmRequest(
+      model='gemini-2.0-flash',
+      contents=[
+          types.Content(
+              role='user' if i % 2 == 0 else 'model',
+              parts=[types.Part.from_text(text=f'Message {i}. ' * 20)],
+          )
+          for i in range(_HISTORY_LENGTH)
+      ],
+      config=types.GenerateContentConfig(system_instruction='Be helpful.'),
+  )
+  llm_response = LlmResponse(
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part.from_function_call(
+                  name='lookup', args={'query': 'benchmark'}
+              )
+          ],
+      ),
+      usage_metadata=types.GenerateContentResponseUsageMetadata(
+          prompt_token_count=1000, total_token_count=1010
+      ),
+  )
+  tool = FunctionTool(lookup)
+  function_response_event = Event(
+      author='agent',
+      content=types.Content(
+          role='user',
+          parts=[
+              types.Part.from_function_response(
+                  name='lookup', response={'result': 'benchmark'}
+              )
+          ],
+      ),
+  )
+  configure_telemetry(level, sampled)
+
+  def step():
+    with telemetry.tracer.start_as_current_span('call_llm'):
+      telemetry.trace_call_llm(
+          invocation_context, 'event', llm_request, llm_response
+      )
+    with telemetry.tracer.start_as_current_span('execute_tool'):
+      telemetry.trace_tool_call(
+          tool, {'query': 'benchmark'}, function_response_event
+      )
+
+  benchmark(step)
+
+  assert telemetry.get_telemetry_level() is level
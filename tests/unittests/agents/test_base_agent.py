@@ -717,6 +717,81 @@ def test_find_sub_agent(request: pytest.FixtureRequest):
   assert parent.find_sub_agent('not_exist') is None
 
 
+def test_find_agent_after_tree_changes(request: pytest.FixtureRequest):
+  grand_sub_agent = _TestingAgent(
+      name=f'{request.function.__name__}_grand_sub_agent'
+  )
+  sub_agent_1 = _TestingAgent(
+      name=f'{request.function.__name__}_sub_agent_1',
+      sub_agents=[grand_sub_agent],
+  )
+  sub_agent_2 = _TestingAgent(name=f'{request.function.__name__}_sub_agent_2')
+  parent = _TestingAgent(
+      name=f'{request.function.__name__}_parent',
+      sub_agents=[sub_agent_1],
+  )
+  assert parent.find_agent(grand_sub_agent.name) is grand_sub_agent
+
+  sub_agent_2.parent_agent = parent
+  parent.sub_agents = [sub_agent_1, sub_agent_2]
+  grand_sub_agent.name = f'{request.function.__name__}_renamed'
+
+  assert parent.find_agent(sub_agent_2.name) is sub_agent_2
+  assert parent.find_agent(grand_sub_agent.name) is grand_sub_agent
+  assert parent.find_agent(f'{request.function.__name__}_grand_sub_agent') is (
+      None
+  )
+
+
+def test_find_agent_after_in_place_changes(request: pytest.FixtureRequest):
+  sub_agent_1 = _TestingAgent(name=f'{request.function.__name__}_sub_agent_1')
+  sub_agent_2 = _TestingAgent(name=f'{request.function.__name__}_sub_agent_2')
+  grand_sub_agent = _TestingAgent(
+      name=f'{request.function.__name__}_grand_sub_agent'
+  )
+  parent = _TestingAgent(
+      name=f'{request.function.__name__}_parent',
+      sub_agents=[sub_agent_1],
+  )
+  assert parent.find_agent(sub_agent_2.name) is None
+
+  parent.sub_agents.append(sub_agent_2)
+  sub_agent_1.sub_agents += [grand_sub_agent]
+  assert parent.find_agent(sub_agent_2.name) is sub_agent_2
+  assert sub_agent_1.find_agent(grand_sub_agent.name) is grand_sub_agent
+  assert sub_agent_2.find_agent(grand_sub_agent.name) is None
+
+  parent.sub_agents.remove(sub_agent_1)
+  assert parent.find_agent(sub_agent_1.name) is None
+  assert parent.find_agent(grand_sub_agent.name) is None
+
+  copied_parent = parent.model_copy(deep=True)
+  copied_parent.find_agent(sub_agent_2.name)
+  copied_parent.sub_agents.append(sub_agent_1)
+  assert copied_parent.find_agent(sub_agent_1.name) is sub_agent_1
+
+
+def test_find_agent_with_duplicate_names(request: pytest.FixtureRequest):
+  name = f'{request.function.__name__}_duplicate'
+  grand_sub_agent_1 = _TestingAgent(name=name)
+  grand_sub_agent_2 = _TestingAgent(name=name)
+  sub_agent_1 = _TestingAgent(
+      name=f'{request.function.__name__}_sub_agent_1',
+      sub_agents=[grand_sub_agent_1],
+  )
+  sub_agent_2 = _TestingAgent(
+      name=f'{request.function.__name__}_sub_agent_2',
+      sub_agents=[grand_sub_agent_2],
+  )
+  parent = _TestingAgent(
+      name=f'{request.function.__name__}_parent',
+      sub_agents=[sub_agent_1, sub_agent_2],
+  )
+
+  assert parent.find_agent(name) is grand_sub_agent_1
+  assert sub_agent_2.find_agent(name) is grand_sub_agent_2
+
+
 def test_root_agent(request: pytest.FixtureRequest):
   grand_sub_agent_1 = _TestingAgent(
       name=f'{request.function.__name__}__grand_sub_agent_1'
@@ -0,0 +1,86 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Testings for the InvocationContext."""
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.run_config import RunConfig
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+from google.genai import types
+
+
+def _new_invocation_context() -> InvocationContext:
+  return InvocationContext(
+      invocation_id='invocation_id',
+      agent=LlmAgent(name='parent_agent'),
+      branch='parent_agent',
+      session=Session(id='session_id', app_name='app', user_id='user'),
+      session_service=InMemorySessionService(),
+      run_config=RunConfig(max_llm_calls=3),
+  )
+
+
+def test_fork():
+  ctx = _new_invocation_context()
+  agent = LlmAgent(name='child_agent')
+
+  forked = ctx.fork(agent=agent, branch='parent_agent.child_agent')
+
+  assert forked == ctx.model_copy(
+      update={'agent': agent, 'branch': 'parent_agent.child_agent'}
+  )
+  assert forked.agent is agent
+  assert forked.branch == 'parent_agent.child_agent'
+  assert forked.session is ctx.session
+  assert forked.artifact_manifest is ctx.artifact_manifest
+  assert ctx.agent.name == 'parent_agent'
+  assert ctx.branch == 'parent_agent'
+
+
+def test_fork_is_independent_of_parent():
+  ctx = _new_invocation_context()
+
+  forked = ctx.fork(agent=LlmAgent(name='child_agent'))
+  forked.end_invocation = True
+
+  assert not ctx.end_invocation
+
+
+def test_fork_shares_llm_call_count():
+  ctx = _new_invocation_context()
+  forked = ctx.fork(agent=LlmAgent(name='child_agent'))
+
+  ctx.increment_llm_call_count()
+  forked.increment_llm_call_count()
+
+  assert ctx._invocation_cost_manager._number_of_llm_calls == 2
+
+
+def test_record_token_usage():
+  ctx = _new_invocation_context()
+  forked = ctx.fork(agent=LlmAgent(name='child_agent'))
+
+  ctx.record_token_usage(
+      types.GenerateContentResponseUsageMetadata(
+          prompt_token_count=10, candidates_token_count=5
+      )
+  )
+  forked.record_token_usage(
+      types.GenerateContentResponseUsageMetadata(prompt_token_count=7)
+  )
+
+  assert ctx.token_count == 22
+  assert forked.token_count == 22
@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
 from unittest.mock import MagicMock
 
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.langgraph_agent import LangGraphAgent
+from google.adk.agents.langgraph_agent import LangGraphExecutionMode
 from google.adk.events import Event
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 from langchain_core.messages import AIMessage
 from langchain_core.messages import HumanMessage
 from langchain_core.messages import SystemMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import MessagesState
+from langgraph.graph import StateGraph
 from langgraph.graph.graph import CompiledGraph
 import pytest
 
@@ -166,9 +173,10 @@ async def test_langgraph_agent(
   mock_parent_context.session = mock_session
   mock_parent_context.branch = "parent_agent"
   mock_parent_context.end_invocation = False
+  mock_parent_context.token_limit_exceeded = False
   mock_session.events = events_list
   mock_parent_context.invocation_id = "test_invocation_id"
-  mock_parent_context.model_copy.return_value = mock_parent_context
+  mock_parent_context.fork.return_value = mock_parent_context
 
   weather_agent = LangGraphAgent(
       name="weather_agent",
@@ -189,3 +197,101 @@ async def test_langgraph_agent(
       {"messages": expected_messages},
       {"configurable": {"thread_id": mock_session.id}},
   )
+
+
+def _draft_node(state: MessagesState):
+  return {"messages": [AIMessage(content="draft response")]}
+
+
+def _slow_final_node(state: MessagesState):
+  time.sleep(0.2)
+  return {"messages": [AIMessage(content="test response")]}
+
+
+def _build_graph() -> CompiledGraph:
+  builder = StateGraph(MessagesState)
+  builder.add_node("draft", _draft_node)
+  builder.add_node("final", _slow_final_node)
+  builder.add_edge("__start__", "draft")
+  builder.add_edge("draft", "final")
+  return builder.compile(checkpointer=MemorySaver())
+
+
+async def _create_invocation_context(agent: LangGraphAgent):
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name="test_app", user_id="test_user"
+  )
+  session.events.append(
+      Event(
+          invocation_id="test_invocation_id",
+          author="user",
+          content=types.Content(
+              role="user", parts=[types.Part.from_text(text="user prompt")]
+          ),
+      )
+  )
+  return InvocationContext(
+      invocation_id="test_invocation_id",
+      agent=agent,
+      session=session,
+      session_service=session_service,
+  )
+
+
+async def _run_counting_ticks(agent: LangGraphAgent):
+  """Runs the agent, counting how often the event loop got to run meanwhile."""
+  ctx = await _create_invocation_context(agent)
+  ticks = 0
+
+  async def tick():
+    nonlocal ticks
+    while True:
+      await asyncio.sleep(0.01)
+      ticks += 1
+
+  ticker = asyncio.create_task(tick())
+  try:
+    events = [event async for event in agent.run_async(ctx)]
+  finally:
+    ticker.cancel()
+  return events, ticks
+
+
+@pytest.mark.asyncio
+async def test_langgraph_agent_stream():
+  agent = LangGraphAgent(
+      name="weather_agent",
+      graph=_build_graph(),
+      execution_mode=LangGraphExecutionMode.STREAM,
+  )
+
+  events, ticks = await _run_counting_ticks(agent)
+
+  assert [
+      (e.partial, e.custom_metadata, e.content.parts[0].text) for e in events
+  ] == [
+      (True, {"langgraph_node": "draft"}, "draft response"),
+      (None, None, "test response"),
+  ]
+  # The final message is not streamed on top of the final response.
+  assert events[-1].is_final_response()
+  assert ticks > 0
+
+
+@pytest.mark.parametrize(
+    "execution_mode",
+    [LangGraphExecutionMode.ASYNC, LangGraphExecutionMode.THREAD],
+)
+@pytest.mark.asyncio
+async def test_langgraph_agent_keeps_event_loop_free(execution_mode):
+  agent = LangGraphAgent(
+      name="weather_agent",
+      graph=_build_graph(),
+      execution_mode=execution_mode,
+  )
+
+  events, ticks = await _run_counting_ticks(agent)
+
+  assert [e.content.parts[0].text for e in events] == ["test response"]
+  assert ticks > 0
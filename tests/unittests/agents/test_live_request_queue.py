@@ -54,3 +54,33 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue():
+  queue = LiveRequestQueue(maxsize=1)
+  content = types.Content(role="user", parts=[types.Part(text="hi")])
+
+  queue.send_content(content)
+  assert queue.full()
+
+  # Sends never fail, even past maxsize.
+  queue.send_content(content)
+  queue.close()
+
+  assert await queue.get() == LiveRequest(content=content)
+  assert await queue.get() == LiveRequest(content=content)
+  assert await queue.get() == LiveRequest(close=True)
+  assert queue.empty()
+  assert not queue.full()
+
+
+@pytest.mark.asyncio
+async def test_closed():
+  queue = LiveRequestQueue()
+  assert not queue.closed
+
+  queue.send(LiveRequest(close=True))
+
+  assert queue.closed
+  assert not queue.empty()
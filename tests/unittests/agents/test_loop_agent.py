@@ -14,18 +14,29 @@
 
 """Testings for the SequentialAgent."""
 
+import asyncio
 from typing import AsyncGenerator
+from typing import Optional
 
+from google.adk import metrics
+from google.adk.agents import loop_agent as loop_agent_module
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.loop_agent import LoopAgent
 from google.adk.events import Event
 from google.adk.events import EventActions
+from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 import pytest
 from typing_extensions import override
 
+from .. import testing_utils
+
 
 class _TestingAgent(BaseAgent):
 
@@ -134,3 +145,250 @@ async def test_run_async_with_escalate_action(request: pytest.FixtureRequest):
   assert events[1].content.parts[0].text == (
       f'Hello, async {escalating_agent.name}!'
   )
+
+
+class _LiveTurnAgent(BaseAgent):
+  """Answers a single live request per run, ending on close."""
+
+  @override
+  async def _run_live_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    live_request = await ctx.live_request_queue.get()
+    if live_request.close:
+      return
+    yield Event(
+        author=self.name,
+        invocation_id=ctx.invocation_id,
+        content=types.Content(
+            parts=[
+                types.Part(
+                    text=f'{self.name}: {live_request.content.parts[0].text}'
+                )
+            ]
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_live_until_queue_closed(request: pytest.FixtureRequest):
+  agent_1 = _LiveTurnAgent(name='agent_1')
+  agent_2 = _LiveTurnAgent(name='agent_2')
+  loop_agent = LoopAgent(name='loop_agent', sub_agents=[agent_1, agent_2])
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+  parent_ctx.live_request_queue = LiveRequestQueue()
+  for text in ['x', 'y', 'z']:
+    parent_ctx.live_request_queue.send_content(
+        types.Content(role='user', parts=[types.Part(text=text)])
+    )
+  parent_ctx.live_request_queue.close()
+
+  events = [e async for e in loop_agent.run_live(parent_ctx)]
+
+  assert [e.content.parts[0].text for e in events] == [
+      'agent_1: x',
+      'agent_2: y',
+      'agent_1: z',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_run_live_max_iterations(request: pytest.FixtureRequest):
+  agent = _TestingAgent(name=f'{request.function.__name__}_test_agent')
+  loop_agent = LoopAgent(
+      name=f'{request.function.__name__}_test_loop_agent',
+      max_iterations=2,
+      sub_agents=[agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+
+  events = [e async for e in loop_agent.run_live(parent_ctx)]
+
+  assert [e.content.parts[0].text for e in events] == [
+      f'Hello, live {agent.name}!'
+  ] * 2
+
+
+class _Clock:
+  """A clock that only advances when told to."""
+
+  def __init__(self):
+    self.now = 0.0
+
+  def monotonic(self) -> float:
+    return self.now
+
+
+class _IterationAgent(BaseAgent):
+  """Counts its runs, optionally using budget, time or a state key."""
+
+  runs: int = 0
+  draft_after_runs: int = 0
+  llm_calls_per_run: int = 0
+  tokens_per_run: int = 0
+  clock: Optional[_Clock] = None
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    self.runs += 1
+    if self.draft_after_runs:
+      ctx.session.state['draft'] = {
+          'text': 'draft',
+          'revision': min(self.runs, self.draft_after_runs),
+      }
+    for _ in range(self.llm_calls_per_run):
+      ctx.increment_llm_call_count()
+    if self.tokens_per_run:
+      ctx.record_token_usage(
+          types.GenerateContentResponseUsageMetadata(
+              prompt_token_count=self.tokens_per_run, candidates_token_count=0
+          )
+      )
+    if self.clock:
+      self.clock.now += 1.0
+    yield Event(author=self.name, invocation_id=ctx.invocation_id)
+
+
+@pytest.mark.asyncio
+async def test_run_async_until_converged(request: pytest.FixtureRequest):
+  agent = _IterationAgent(name='agent', draft_after_runs=3)
+  loop_agent = LoopAgent(
+      name='loop_agent',
+      max_iterations=10,
+      convergence_keys=['draft'],
+      sub_agents=[agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+
+  events = [e async for e in loop_agent.run_async(parent_ctx)]
+
+  # The fourth iteration leaves the draft of the third unchanged.
+  assert len(events) == 4
+  assert agent.runs == 4
+
+
+@pytest.mark.asyncio
+async def test_run_async_max_llm_calls(request: pytest.FixtureRequest):
+  agent = _IterationAgent(name='agent', llm_calls_per_run=2)
+  loop_agent = LoopAgent(name='loop_agent', max_llm_calls=5, sub_agents=[agent])
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+  # Calls made before the loop started don't count.
+  parent_ctx.increment_llm_call_count()
+
+  events = [e async for e in loop_agent.run_async(parent_ctx)]
+
+  assert len(events) == 3
+  assert parent_ctx.llm_call_count == 7
+
+
+@pytest.mark.asyncio
+async def test_run_async_max_tokens(request: pytest.FixtureRequest):
+  agent = _IterationAgent(name='agent', tokens_per_run=40)
+  loop_agent = LoopAgent(name='loop_agent', max_tokens=100, sub_agents=[agent])
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+
+  events = [e async for e in loop_agent.run_async(parent_ctx)]
+
+  assert len(events) == 3
+  assert parent_ctx.token_count == 120
+
+
+@pytest.mark.asyncio
+async def test_run_async_max_duration(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+  clock = _Clock()
+  monkeypatch.setattr(loop_agent_module.time, 'monotonic', clock.monotonic)
+  agent = _IterationAgent(name='agent', clock=clock)
+  loop_agent = LoopAgent(
+      name='loop_agent', max_duration=2.5, sub_agents=[agent]
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+
+  events = [e async for e in loop_agent.run_async(parent_ctx)]
+
+  assert len(events) == 3
+
+
+def test_max_tokens_counts_llm_agent_usage():
+  usage_metadata = types.GenerateContentResponseUsageMetadata(
+      prompt_token_count=10, candidates_token_count=5
+  )
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          LlmResponse(
+              content=testing_utils.ModelContent([types.Part(text=text)]),
+              usage_metadata=usage_metadata,
+          )
+          for text in ['response1', 'response2', 'response3']
+      ]
+  )
+  loop_agent = LoopAgent(
+      name='loop_agent',
+      max_tokens=25,
+      sub_agents=[LlmAgent(name='llm_agent', model=mock_model)],
+  )
+  runner = testing_utils.InMemoryRunner(loop_agent)
+
+  assert testing_utils.simplify_events(runner.run('test')) == [
+      ('llm_agent', 'response1'),
+      ('llm_agent', 'response2'),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_iteration_metrics_exclude_consumer_time(
+    request: pytest.FixtureRequest,
+):
+  reader = InMemoryMetricReader()
+  metrics.set_meter_provider(MeterProvider(metric_readers=[reader]))
+  agent = _TestingAgent(name=f'{request.function.__name__}_test_agent')
+  loop_agent = LoopAgent(
+      name=f'{request.function.__name__}_test_loop_agent',
+      max_iterations=3,
+      sub_agents=[agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, loop_agent
+  )
+
+  try:
+    events = loop_agent.run_async(parent_ctx)
+    async for _ in events:
+      await asyncio.sleep(0.05)
+      break
+    # Stop the loop while the caller holds an event of the first iteration.
+    await events.aclose()
+    async for _ in loop_agent.run_async(parent_ctx):
+      await asyncio.sleep(0.05)
+
+    data_points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+      for scope_metrics in resource_metrics.scope_metrics:
+        for metric in scope_metrics.metrics:
+          for data_point in metric.data.data_points:
+            if (
+                data_point.attributes.get('adk.phase')
+                == metrics.PHASE_LOOP_ITERATION
+            ):
+              data_points[metric.name] = data_point
+  finally:
+    metrics.set_meter_provider(None)
+
+  assert data_points['adk.phase.duration'].count == 4
+  assert data_points['adk.phase.duration'].sum < 0.05
+  assert 'adk.phase.errors' not in data_points
@@ -0,0 +1,300 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Testings for the MapAgent and MapReduceAgent."""
+
+import asyncio
+from typing import Any
+from typing import AsyncGenerator
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.map_agent import MapAgent
+from google.adk.agents.map_agent import MapReduceAgent
+from google.adk.events import Event
+from google.adk.events import EventActions
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+import pytest
+from typing_extensions import override
+
+
+class _Tracker:
+  """Records how many runs are active at once."""
+
+  def __init__(self):
+    self.active = 0
+    self.max_active = 0
+
+
+class _UppercaseAgent(BaseAgent):
+  """Responds with its item in upper case."""
+
+  tracker: _Tracker
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    self.tracker.active += 1
+    self.tracker.max_active = max(self.tracker.max_active, self.tracker.active)
+    try:
+      await asyncio.sleep(0.01)
+      yield Event(
+          author=self.name,
+          branch=ctx.branch,
+          invocation_id=ctx.invocation_id,
+          content=types.Content(
+              parts=[types.Part(text=str(ctx.session.state['item']).upper())]
+          ),
+      )
+    finally:
+      self.tracker.active -= 1
+
+
+async def _create_parent_invocation_context(
+    test_name: str, agent: BaseAgent, state: dict[str, Any]
+) -> InvocationContext:
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='test_app', user_id='test_user', state=state
+  )
+  return InvocationContext(
+      invocation_id=f'{test_name}_invocation_id',
+      agent=agent,
+      session=session,
+      session_service=session_service,
+  )
+
+
+@pytest.mark.asyncio
+async def test_run_async(request: pytest.FixtureRequest):
+  sub_agent = _UppercaseAgent(name='sub_agent', tracker=_Tracker())
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      output_key='summary',
+      sub_agents=[sub_agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {'docs': ['a', 'b', 'c']}
+  )
+
+  events = [e async for e in map_agent.run_async(parent_ctx)]
+
+  assert {e.branch: e.actions.state_delta for e in events} == {
+      'map_agent.sub_agent[0]': {'summary_0': 'A'},
+      'map_agent.sub_agent[1]': {'summary_1': 'B'},
+      'map_agent.sub_agent[2]': {'summary_2': 'C'},
+  }
+  assert sub_agent.tracker.max_active == 3
+  # Items are only visible to their own run.
+  assert 'item' not in parent_ctx.session.state
+
+
+class _TwoStepAgent(BaseAgent):
+  """Writes its item to the state, then responds with what it reads back."""
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    yield Event(
+        author=self.name,
+        branch=ctx.branch,
+        invocation_id=ctx.invocation_id,
+        actions=EventActions(state_delta={'seen': ctx.session.state['item']}),
+    )
+    await asyncio.sleep(0.01)
+    yield Event(
+        author=self.name,
+        branch=ctx.branch,
+        invocation_id=ctx.invocation_id,
+        content=types.Content(
+            parts=[types.Part(text=str(ctx.session.state['seen']))]
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_async_sees_own_writes_only(request: pytest.FixtureRequest):
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      output_key='summary',
+      sub_agents=[_TwoStepAgent(name='sub_agent')],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {'docs': ['a', 'b', 'c']}
+  )
+  batch_ctx = map_agent._create_batch_ctx(parent_ctx, 0, 'a')
+  assert type(batch_ctx.session.state) is dict
+
+  events = [e async for e in map_agent.run_async(parent_ctx)]
+
+  assert sorted(e.content.parts[0].text for e in events if e.content) == [
+      'a',
+      'b',
+      'c',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_run_async_max_concurrency(request: pytest.FixtureRequest):
+  sub_agent = _UppercaseAgent(name='sub_agent', tracker=_Tracker())
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      max_concurrency=2,
+      sub_agents=[sub_agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {'docs': list('abcde')}
+  )
+
+  events = [e async for e in map_agent.run_async(parent_ctx)]
+
+  assert sorted(e.content.parts[0].text for e in events) == list('ABCDE')
+  assert sub_agent.tracker.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_run_async_batch_size(request: pytest.FixtureRequest):
+  sub_agent = _UppercaseAgent(name='sub_agent', tracker=_Tracker())
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      output_key='summary',
+      batch_size=2,
+      sub_agents=[sub_agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {'docs': ['a', 'b', 'c']}
+  )
+
+  events = [e async for e in map_agent.run_async(parent_ctx)]
+
+  assert {e.branch: e.actions.state_delta for e in events} == {
+      'map_agent.sub_agent[0]': {'summary_0': "['A', 'B']"},
+      'map_agent.sub_agent[1]': {'summary_1': "['C']"},
+  }
+
+
+@pytest.mark.asyncio
+async def test_run_async_no_items(request: pytest.FixtureRequest):
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      sub_agents=[_UppercaseAgent(name='sub_agent', tracker=_Tracker())],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {}
+  )
+
+  assert [e async for e in map_agent.run_async(parent_ctx)] == []
+
+
+@pytest.mark.asyncio
+async def test_run_async_items_not_a_list(request: pytest.FixtureRequest):
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      sub_agents=[_UppercaseAgent(name='sub_agent', tracker=_Tracker())],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {'docs': 'abc'}
+  )
+
+  with pytest.raises(ValueError, match='must hold a list'):
+    [e async for e in map_agent.run_async(parent_ctx)]
+
+
+def test_requires_one_sub_agent():
+  with pytest.raises(ValueError, match='exactly one sub-agent'):
+    MapAgent(name='map_agent', items_key='docs')
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_reduces_as_runs_finish(
+    request: pytest.FixtureRequest,
+):
+  sub_agent = _UppercaseAgent(name='sub_agent', tracker=_Tracker())
+  reduced_with_active_runs = []
+
+  async def reducer(reduced: list[str], output: str) -> list[str]:
+    reduced_with_active_runs.append(sub_agent.tracker.active)
+    return sorted(reduced + [output])
+
+  map_reduce_agent = MapReduceAgent(
+      name='map_reduce_agent',
+      items_key='docs',
+      max_concurrency=2,
+      reducer=reducer,
+      initial_value=[],
+      reduce_output_key='summaries',
+      sub_agents=[sub_agent],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_reduce_agent, {'docs': list('abcd')}
+  )
+
+  events = [e async for e in map_reduce_agent.run_async(parent_ctx)]
+
+  assert events[-1].author == 'map_reduce_agent'
+  assert events[-1].actions.state_delta == {'summaries': list('ABCD')}
+  # The first outputs were reduced while other runs were still going.
+  assert reduced_with_active_runs[0] > 0
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_starts_from_fresh_initial_value(
+    request: pytest.FixtureRequest,
+):
+  def reducer(reduced: list[str], output: str) -> list[str]:
+    reduced.append(output)
+    return reduced
+
+  map_reduce_agent = MapReduceAgent(
+      name='map_reduce_agent',
+      items_key='docs',
+      max_concurrency=1,
+      reducer=reducer,
+      initial_value=[],
+      reduce_output_key='summaries',
+      sub_agents=[_UppercaseAgent(name='sub_agent', tracker=_Tracker())],
+  )
+
+  for _ in range(2):
+    parent_ctx = await _create_parent_invocation_context(
+        request.function.__name__, map_reduce_agent, {'docs': list('ab')}
+    )
+    events = [e async for e in map_reduce_agent.run_async(parent_ctx)]
+    assert events[-1].actions.state_delta == {'summaries': list('AB')}
+
+  assert map_reduce_agent.initial_value == []
+
+
+@pytest.mark.asyncio
+async def test_run_live_is_not_supported(request: pytest.FixtureRequest):
+  map_agent = MapAgent(
+      name='map_agent',
+      items_key='docs',
+      sub_agents=[_UppercaseAgent(name='sub_agent', tracker=_Tracker())],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, map_agent, {'docs': ['a']}
+  )
+
+  with pytest.raises(NotImplementedError):
+    [e async for e in map_agent.run_live(parent_ctx)]
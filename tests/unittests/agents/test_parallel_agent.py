@@ -19,7 +19,12 @@ from typing import AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.live_request_queue import LiveRequest
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.parallel_agent import _LiveRequestBroadcaster
+from google.adk.agents.parallel_agent import _merge_agent_run
 from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.parallel_agent import ParallelMode
 from google.adk.agents.sequential_agent import SequentialAgent
 from google.adk.events import Event
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
@@ -135,3 +140,308 @@ async def test_run_async_branches(request: pytest.FixtureRequest):
   # Sub-agents should have different branches.
   assert events[2].branch != events[1].branch
   assert events[2].branch != events[0].branch
+
+
+class _Tracker:
+  """Tracks which agents run at once and which were cancelled."""
+
+  def __init__(self):
+    self.running: list[str] = []
+    self.max_running = 0
+    self.cancelled: list[str] = []
+
+
+class _TrackingAgent(BaseAgent):
+
+  tracker: _Tracker
+  delay: float = 0
+  fail: bool = False
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    self.tracker.running.append(self.name)
+    self.tracker.max_running = max(
+        self.tracker.max_running, len(self.tracker.running)
+    )
+    try:
+      await asyncio.sleep(self.delay)
+      if self.fail:
+        raise ValueError(f'{self.name} failed')
+      yield Event(
+          author=self.name,
+          branch=ctx.branch,
+          invocation_id=ctx.invocation_id,
+      )
+    except asyncio.CancelledError:
+      self.tracker.cancelled.append(self.name)
+      raise
+    finally:
+      self.tracker.running.remove(self.name)
+
+
+def _tracking_agents(
+    delays: list[float], fail: frozenset[int] = frozenset()
+) -> tuple[list[_TrackingAgent], _Tracker]:
+  tracker = _Tracker()
+  agents = [
+      _TrackingAgent(
+          name=f'agent_{i}', tracker=tracker, delay=delay, fail=i in fail
+      )
+      for i, delay in enumerate(delays)
+  ]
+  return agents, tracker
+
+
+@pytest.mark.asyncio
+async def test_run_async_max_concurrency(request: pytest.FixtureRequest):
+  agents, tracker = _tracking_agents([0.01] * 6)
+  parallel_agent = ParallelAgent(
+      name='parallel_agent', sub_agents=agents, max_concurrency=2
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  events = [e async for e in parallel_agent.run_async(parent_ctx)]
+
+  assert sorted(e.author for e in events) == [a.name for a in agents]
+  assert tracker.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_run_async_race_cancels_remaining_agents(
+    request: pytest.FixtureRequest,
+):
+  agents, tracker = _tracking_agents([1, 0, 1])
+  parallel_agent = ParallelAgent(
+      name='parallel_agent', sub_agents=agents, mode=ParallelMode.RACE
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  events = [e async for e in parallel_agent.run_async(parent_ctx)]
+
+  assert [e.author for e in events] == ['agent_1']
+  assert sorted(tracker.cancelled) == ['agent_0', 'agent_2']
+
+
+@pytest.mark.asyncio
+async def test_run_async_race_tolerates_failures_without_fail_fast(
+    request: pytest.FixtureRequest,
+):
+  agents, _ = _tracking_agents([0, 0.05], fail={0})
+  parallel_agent = ParallelAgent(
+      name='parallel_agent',
+      sub_agents=agents,
+      mode=ParallelMode.RACE,
+      fail_fast=False,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  events = [e async for e in parallel_agent.run_async(parent_ctx)]
+
+  assert [e.author for e in events] == ['agent_1']
+
+
+@pytest.mark.asyncio
+async def test_run_async_fail_fast_cancels_remaining_agents(
+    request: pytest.FixtureRequest,
+):
+  agents, tracker = _tracking_agents([1, 0], fail={1})
+  parallel_agent = ParallelAgent(name='parallel_agent', sub_agents=agents)
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+
+  with pytest.raises(ValueError, match='agent_1 failed'):
+    async for _ in parallel_agent.run_async(parent_ctx):
+      pass
+
+  assert tracker.cancelled == ['agent_0']
+
+
+@pytest.mark.asyncio
+async def test_run_async_without_fail_fast_runs_remaining_agents(
+    request: pytest.FixtureRequest,
+):
+  agents, tracker = _tracking_agents([0.05, 0], fail={1})
+  parallel_agent = ParallelAgent(
+      name='parallel_agent', sub_agents=agents, fail_fast=False
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  events = []
+
+  with pytest.raises(ValueError, match='agent_1 failed'):
+    async for event in parallel_agent.run_async(parent_ctx):
+      events.append(event)
+
+  assert [e.author for e in events] == ['agent_0']
+  assert not tracker.cancelled
+
+
+@pytest.mark.asyncio
+async def test_merge_agent_run_closing_early_cancels_agents(
+    request: pytest.FixtureRequest,
+):
+  agents, tracker = _tracking_agents([0, 1])
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, agents[0]
+  )
+
+  merged_run = _merge_agent_run(
+      [agent.run_async(parent_ctx) for agent in agents]
+  )
+  event = await merged_run.__anext__()
+  await merged_run.aclose()
+
+  assert event.author == 'agent_0'
+  assert tracker.cancelled == ['agent_1']
+
+
+class _LiveEchoAgent(BaseAgent):
+  """Echoes the content of live requests until the queue is closed."""
+
+  @override
+  async def _run_live_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    while True:
+      live_request = await ctx.live_request_queue.get()
+      if live_request.close:
+        return
+      yield Event(
+          author=self.name,
+          branch=ctx.branch,
+          invocation_id=ctx.invocation_id,
+          content=types.Content(
+              parts=[
+                  types.Part(
+                      text=f'{self.name}: {live_request.content.parts[0].text}'
+                  )
+              ]
+          ),
+      )
+
+
+@pytest.mark.asyncio
+async def test_run_live_broadcasts_live_requests(
+    request: pytest.FixtureRequest,
+):
+  agents = [_LiveEchoAgent(name='agent_1'), _LiveEchoAgent(name='agent_2')]
+  parallel_agent = ParallelAgent(name='parallel_agent', sub_agents=agents)
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  parent_ctx.live_request_queue = LiveRequestQueue()
+  for text in ['a', 'b']:
+    parent_ctx.live_request_queue.send_content(
+        types.Content(role='user', parts=[types.Part(text=text)])
+    )
+  parent_ctx.live_request_queue.close()
+
+  events = [e async for e in parallel_agent.run_live(parent_ctx)]
+
+  for agent in agents:
+    assert [
+        e.content.parts[0].text for e in events if e.author == agent.name
+    ] == [f'{agent.name}: a', f'{agent.name}: b']
+    assert {e.branch for e in events if e.author == agent.name} == {
+        f'{parallel_agent.name}.{agent.name}'
+    }
+
+
+class _LiveSendBackAgent(BaseAgent):
+  """Sends requests back into its own queue, as the LLM flow does with
+  function responses, and finishes after the first request."""
+
+  @override
+  async def _run_live_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    await ctx.live_request_queue.get()
+    for text in ['x', 'y']:
+      ctx.live_request_queue.send_content(
+          types.Content(role='user', parts=[types.Part(text=text)])
+      )
+    yield Event(
+        author=self.name,
+        branch=ctx.branch,
+        invocation_id=ctx.invocation_id,
+        content=types.Content(parts=[types.Part(text=f'{self.name}: done')]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_live_finished_branch_does_not_stall_others(
+    request: pytest.FixtureRequest,
+):
+  parallel_agent = ParallelAgent(
+      name='parallel_agent',
+      max_pending_live_requests=1,
+      sub_agents=[
+          _LiveEchoAgent(name='agent_1'),
+          _LiveSendBackAgent(name='agent_2'),
+      ],
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  parent_ctx.live_request_queue = LiveRequestQueue()
+  for text in ['a', 'b', 'c']:
+    parent_ctx.live_request_queue.send_content(
+        types.Content(role='user', parts=[types.Part(text=text)])
+    )
+  parent_ctx.live_request_queue.close()
+
+  events = await asyncio.wait_for(
+      _collect(parallel_agent.run_live(parent_ctx)), timeout=5
+  )
+
+  assert sorted(e.content.parts[0].text for e in events) == [
+      'agent_1: a',
+      'agent_1: b',
+      'agent_1: c',
+      'agent_2: done',
+  ]
+
+
+async def _collect(agen: AsyncGenerator[Event, None]) -> list[Event]:
+  return [e async for e in agen]
+
+
+@pytest.mark.asyncio
+async def test_live_request_broadcaster_drops_blobs_for_lagging_branches():
+  source = LiveRequestQueue()
+  blob_1 = types.Blob(data=b'1', mime_type='audio/pcm')
+  blob_2 = types.Blob(data=b'2', mime_type='audio/pcm')
+  content = types.Content(role='user', parts=[types.Part(text='hi')])
+  source.send_realtime(blob_1)
+  source.send_realtime(blob_2)
+  source.send_content(content)
+  source.close()
+  broadcaster = _LiveRequestBroadcaster(source, num_branches=2, max_pending=1)
+  broadcast_task = asyncio.create_task(broadcaster.run())
+  # Lets the broadcaster fill the branch queues before they are read.
+  await asyncio.sleep(0.01)
+
+  received = [[], []]
+  while not all(r and r[-1].close for r in received):
+    for queue, requests in zip(broadcaster.queues, received):
+      if not (requests and requests[-1].close):
+        requests.append(await queue.get())
+  await broadcast_task
+
+  for requests in received:
+    assert requests == [
+        LiveRequest(blob=blob_1),
+        LiveRequest(content=content),
+        LiveRequest(close=True),
+    ]
+  assert broadcaster.dropped_blob_counts == [1, 1]
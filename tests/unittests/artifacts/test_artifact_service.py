@@ -14,13 +14,16 @@
 
 """Tests for the artifact service."""
 
+import asyncio
 import enum
+import threading
 from typing import Optional
 from typing import Union
 from unittest import mock
 
 from google.adk.artifacts import GcsArtifactService
 from google.adk.artifacts import InMemoryArtifactService
+from google.api_core import exceptions
 from google.genai import types
 import pytest
 
@@ -49,41 +52,72 @@ class MockBlob:
     self.name = name
     self.content: Optional[bytes] = None
     self.content_type: Optional[str] = None
+    self._last_generation = 0
+
+  @property
+  def generation(self) -> int:
+    """The generation of the content, or 0 if there is none."""
+    return self._last_generation if self.content is not None else 0
+
+  def _check_generation(self, if_generation_match: Optional[int]) -> None:
+    if if_generation_match is not None and if_generation_match != (
+        self.generation
+    ):
+      raise exceptions.PreconditionFailed("Generation does not match")
 
   def upload_from_string(
-      self, data: Union[str, bytes], content_type: Optional[str] = None
+      self,
+      data: Union[str, bytes],
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
   ) -> None:
     """Mocks uploading data to the blob (from a string or bytes).
 
     Args:
         data: The data to upload (string or bytes).
         content_type:  The content type of the data (optional).
+        if_generation_match: If set, the upload fails unless it is the
+          generation of the blob, 0 if it doesn't exist.
     """
+    self._check_generation(if_generation_match)
     if isinstance(data, str):
       self.content = data.encode("utf-8")
     elif isinstance(data, bytes):
       self.content = data
     else:
       raise TypeError("data must be str or bytes")
+    self._last_generation += 1
 
     if content_type:
       self.content_type = content_type
 
-  def download_as_bytes(self) -> bytes:
+  def download_as_bytes(
+      self, if_generation_match: Optional[int] = None
+  ) -> bytes:
     """Mocks downloading the blob's content as bytes.
 
+    Args:
+        if_generation_match: If set, the download fails unless it is the
+          generation of the blob.
+
     Returns:
         bytes: The content of the blob as bytes.
 
     Raises:
         Exception: If the blob doesn't exist (hasn't been uploaded to).
     """
+    self._check_generation(if_generation_match)
     if self.content is None:
       return b""
     return self.content
 
-  def delete(self) -> None:
+  def exists(self) -> bool:
+    """Mocks checking whether the blob exists."""
+    return self.content is not None
+
+  def delete(self, if_generation_match: Optional[int] = None) -> None:
     """Mocks deleting a blob."""
+    self._check_generation(if_generation_match)
     self.content = None
     self.content_type = None
 
@@ -113,6 +147,11 @@ class MockBucket:
       self.blobs[blob_name] = MockBlob(blob_name)
     return self.blobs[blob_name]
 
+  def get_blob(self, blob_name: str) -> Optional[MockBlob]:
+    """Mocks getting an existing Blob object, or None if it doesn't exist."""
+    blob = self.blobs.get(blob_name)
+    return blob if blob and blob.content is not None else None
+
 
 class MockClient:
   """Mocks the GCS Client."""
@@ -128,12 +167,12 @@ class MockClient:
     return self.buckets[bucket_name]
 
   def list_blobs(self, bucket: MockBucket, prefix: Optional[str] = None):
-    """Mocks listing blobs in a bucket, optionally with a prefix."""
-    if prefix:
-      return [
-          blob for name, blob in bucket.blobs.items() if name.startswith(prefix)
-      ]
-    return list(bucket.blobs.values())
+    """Mocks listing the existing blobs in a bucket, optionally with a prefix."""
+    return [
+        blob
+        for name, blob in bucket.blobs.items()
+        if blob.content is not None and name.startswith(prefix or "")
+    ]
 
 
 def mock_gcs_artifact_service():
@@ -278,3 +317,190 @@ async def test_list_versions(service_type):
   )
 
   assert response_versions == list(range(3))
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_uses_cached_latest_version():
+  """Tests that saves only list versions once per artifact."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  kwargs = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+
+  with mock.patch.object(
+      artifact_service.storage_client,
+      "list_blobs",
+      wraps=artifact_service.storage_client.list_blobs,
+  ) as list_blobs:
+    versions = [
+        await artifact_service.save_artifact(**kwargs, artifact=artifact)
+        for _ in range(3)
+    ]
+    loaded = await artifact_service.load_artifact(**kwargs)
+
+  assert versions == [0, 1, 2]
+  assert loaded == artifact
+  assert list_blobs.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_retries_when_version_written_elsewhere():
+  """Tests that a stale cached version does not overwrite another save."""
+  artifact_service = mock_gcs_artifact_service()
+  other_service = mock_gcs_artifact_service()
+  other_service.bucket = artifact_service.bucket
+  other_service.storage_client = artifact_service.storage_client
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  kwargs = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+
+  assert await artifact_service.save_artifact(**kwargs, artifact=artifact) == 0
+  assert await other_service.save_artifact(**kwargs, artifact=artifact) == 1
+  assert await artifact_service.save_artifact(**kwargs, artifact=artifact) == 2
+
+
+@pytest.mark.asyncio
+async def test_gcs_concurrent_saves_get_distinct_versions():
+  """Tests that concurrent saves of one artifact get distinct versions."""
+  artifact_service = mock_gcs_artifact_service()
+  kwargs = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+
+  versions = await asyncio.gather(*[
+      artifact_service.save_artifact(
+          **kwargs,
+          artifact=types.Part.from_bytes(
+              data=bytes([i]), mime_type="text/plain"
+          ),
+      )
+      for i in range(5)
+  ])
+  await artifact_service.delete_artifact(**kwargs)
+
+  assert sorted(versions) == list(range(5))
+  assert not await artifact_service.list_versions(**kwargs)
+  assert not await artifact_service.load_artifact(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_gcs_load_during_save_returns_previous_version():
+  """Tests that a version being uploaded is not loaded as the latest one."""
+  artifact_service = mock_gcs_artifact_service()
+  first = types.Part.from_bytes(data=b"first", mime_type="text/plain")
+  second = types.Part.from_bytes(data=b"second", mime_type="text/plain")
+  kwargs = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  await artifact_service.save_artifact(**kwargs, artifact=first)
+  uploading = threading.Event()
+  release = threading.Event()
+  upload_from_string = MockBlob.upload_from_string
+
+  def slow_upload_from_string(blob, *args, **kwargs):
+    uploading.set()
+    release.wait()
+    upload_from_string(blob, *args, **kwargs)
+
+  with mock.patch.object(
+      MockBlob, "upload_from_string", slow_upload_from_string
+  ):
+    save = asyncio.create_task(
+        artifact_service.save_artifact(**kwargs, artifact=second)
+    )
+    await asyncio.to_thread(uploading.wait)
+    loaded_during_save = await artifact_service.load_artifact(**kwargs)
+    release.set()
+    assert await save == 1
+
+  assert loaded_during_save == first
+  assert await artifact_service.load_artifact(**kwargs) == second
+
+
+@pytest.mark.asyncio
+async def test_gcs_failed_save_is_not_cached():
+  """Tests that a failed upload does not leave its version cached."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  kwargs = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  await artifact_service.save_artifact(**kwargs, artifact=artifact)
+
+  with mock.patch.object(
+      MockBlob,
+      "upload_from_string",
+      side_effect=exceptions.ServiceUnavailable("unavailable"),
+  ):
+    with pytest.raises(exceptions.ServiceUnavailable):
+      await artifact_service.save_artifact(**kwargs, artifact=artifact)
+
+  assert await artifact_service.load_artifact(**kwargs) == artifact
+  assert await artifact_service.save_artifact(**kwargs, artifact=artifact) == 1
+
+
+@pytest.mark.asyncio
+async def test_gcs_close_shuts_down_thread_pool():
+  """Tests that the service cannot be used after it is closed."""
+  artifact_service = mock_gcs_artifact_service()
+
+  artifact_service.close()
+
+  with pytest.raises(RuntimeError):
+    await artifact_service.list_artifact_keys(
+        app_name="app0", user_id="user0", session_id="123"
+    )
+
+
+@pytest.mark.asyncio
+async def test_gcs_load_after_latest_version_deleted_elsewhere():
+  """Tests that a cached latest version deleted elsewhere is listed again."""
+  artifact_service = mock_gcs_artifact_service()
+  first = types.Part.from_bytes(data=b"first", mime_type="text/plain")
+  second = types.Part.from_bytes(data=b"second", mime_type="text/plain")
+  kwargs = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  await artifact_service.save_artifact(**kwargs, artifact=first)
+  await artifact_service.save_artifact(**kwargs, artifact=second)
+  download_as_bytes = MockBlob.download_as_bytes
+
+  def download_existing_as_bytes(blob):
+    if blob.content is None:
+      raise exceptions.NotFound("No such object")
+    return download_as_bytes(blob)
+
+  with mock.patch.object(
+      MockBlob, "download_as_bytes", download_existing_as_bytes
+  ):
+    artifact_service.bucket.blob("app0/user0/123/file/1").delete()
+    assert await artifact_service.load_artifact(**kwargs) == first
+
+    artifact_service.bucket.blob("app0/user0/123/file/0").delete()
+    assert await artifact_service.load_artifact(**kwargs) is None
+
+
+@pytest.mark.asyncio
+async def test_gcs_latest_version_cache_is_bounded():
+  """Tests that the least recently used latest versions are evicted."""
+  with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
+    artifact_service = GcsArtifactService(
+        bucket_name="test_bucket", max_cached_latest_versions=2
+    )
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+
+  for filename in ["a", "b", "a", "c"]:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename=filename,
+        artifact=artifact,
+    )
+
+  assert list(artifact_service._latest_versions) == [
+      "app0/user0/123/a/",
+      "app0/user0/123/c/",
+  ]
@@ -0,0 +1,221 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the content-addressed artifact service."""
+
+import hashlib
+from unittest import mock
+
+from google.adk.artifacts import ContentAddressedArtifactService
+from google.adk.artifacts.content_addressed_artifact_service import GcsBlobStore
+from google.adk.artifacts.content_addressed_artifact_service import InMemoryBlobStore
+from google.adk.artifacts.content_addressed_artifact_service import LocalBlobStore
+from google.genai import types
+import pytest
+
+from .test_artifact_service import MockClient
+
+_PDF = types.Part.from_bytes(
+    data=b"%PDF-1.4 content", mime_type="application/pdf"
+)
+_DIGEST = hashlib.sha256(b"%PDF-1.4 content").hexdigest()
+
+
+@pytest.fixture(params=["in_memory", "local", "gcs"])
+def store(request, tmp_path):
+  if request.param == "local":
+    return LocalBlobStore(str(tmp_path))
+  if request.param == "gcs":
+    with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
+      return GcsBlobStore("test_bucket", prefix="artifacts/")
+  return InMemoryBlobStore()
+
+
+async def _blob_names(store):
+  return await store.list_names("blobs/")
+
+
+@pytest.mark.asyncio
+async def test_identical_content_is_stored_once(store):
+  artifact_service = ContentAddressedArtifactService(store)
+
+  for user_id in ["user0", "user1"]:
+    for filename in ["report.pdf", "user:report.pdf"]:
+      version = await artifact_service.save_artifact(
+          app_name="app",
+          user_id=user_id,
+          session_id="session",
+          filename=filename,
+          artifact=_PDF,
+      )
+      assert version == 0
+
+  assert await _blob_names(store) == [f"blobs/{_DIGEST}"]
+  assert await store.read(f"refcounts/{_DIGEST}") == b"4"
+  assert (
+      await artifact_service.load_artifact(
+          app_name="app",
+          user_id="user1",
+          session_id="session",
+          filename="report.pdf",
+      )
+      == _PDF
+  )
+  assert await artifact_service.list_artifact_keys(
+      app_name="app", user_id="user0", session_id="session"
+  ) == ["report.pdf", "user:report.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_blob_is_deleted_with_its_last_reference(store):
+  artifact_service = ContentAddressedArtifactService(store)
+  other = types.Part.from_bytes(data=b"other", mime_type="text/plain")
+  kwargs = dict(app_name="app", user_id="user", filename="file")
+  await artifact_service.save_artifact(**kwargs, session_id="s1", artifact=_PDF)
+  await artifact_service.save_artifact(
+      **kwargs, session_id="s1", artifact=other
+  )
+  await artifact_service.save_artifact(**kwargs, session_id="s2", artifact=_PDF)
+
+  await artifact_service.delete_artifact(**kwargs, session_id="s1")
+
+  assert await _blob_names(store) == [f"blobs/{_DIGEST}"]
+  assert not await artifact_service.list_versions(**kwargs, session_id="s1")
+  assert await artifact_service.load_artifact(**kwargs, session_id="s2") == _PDF
+
+  await artifact_service.delete_artifact(**kwargs, session_id="s2")
+
+  assert not await _blob_names(store)
+  assert not await store.exists(f"refcounts/{_DIGEST}")
+
+
+@pytest.mark.asyncio
+async def test_failed_save_drops_its_reference(store):
+  artifact_service = ContentAddressedArtifactService(store)
+  write = store.write
+
+  async def fail_ref_write(name, data):
+    if name.startswith("refs/"):
+      raise OSError("write failed")
+    await write(name, data)
+
+  with mock.patch.object(store, "write", side_effect=fail_ref_write):
+    with pytest.raises(OSError):
+      await artifact_service.save_artifact(
+          app_name="app",
+          user_id="user",
+          session_id="session",
+          filename="report.pdf",
+          artifact=_PDF,
+      )
+
+  assert not await _blob_names(store)
+  assert not await store.exists(f"refcounts/{_DIGEST}")
+
+
+@pytest.mark.asyncio
+async def test_content_saved_again_while_its_blob_is_deleted(store):
+  # Two services on one store stand in for two processes sharing it.
+  deleting_service = ContentAddressedArtifactService(store)
+  saving_service = ContentAddressedArtifactService(store)
+  kwargs = dict(app_name="app", user_id="user", filename="report.pdf")
+  await deleting_service.save_artifact(**kwargs, session_id="s1", artifact=_PDF)
+  delete = store.delete
+
+  async def save_during_blob_delete(name):
+    await delete(name)
+    if name.startswith("blobs/"):
+      await saving_service.save_artifact(
+          **kwargs, session_id="s2", artifact=_PDF
+      )
+
+  with mock.patch.object(store, "delete", side_effect=save_during_blob_delete):
+    await deleting_service.delete_artifact(**kwargs, session_id="s1")
+
+  assert await _blob_names(store) == [f"blobs/{_DIGEST}"]
+  assert await store.read(f"refcounts/{_DIGEST}") == b"1"
+  assert (
+      await ContentAddressedArtifactService(store).load_artifact(
+          **kwargs, session_id="s2"
+      )
+      == _PDF
+  )
+
+
+@pytest.mark.asyncio
+async def test_gcs_update_retries_on_concurrent_writes():
+  with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
+    store = GcsBlobStore("test_bucket")
+  await store.write("count", b"1")
+  calls = []
+
+  def increment(data):
+    calls.append(data)
+    if len(calls) == 1:
+      # Another process increments the count between the read and the write.
+      store.bucket.blob("count").upload_from_string(b"2")
+    return str(int(data) + 1).encode()
+
+  assert await store.update("count", increment) == b"3"
+  assert calls == [b"1", b"2"]
+  assert await store.read("count") == b"3"
+
+
+@pytest.mark.asyncio
+async def test_versions_and_cached_loads():
+  store = InMemoryBlobStore()
+  artifact_service = ContentAddressedArtifactService(store)
+  kwargs = dict(app_name="app", user_id="user", session_id="s", filename="f")
+  parts = [
+      types.Part.from_bytes(data=bytes([i]), mime_type="text/plain")
+      for i in range(3)
+  ]
+  for part in parts:
+    await artifact_service.save_artifact(**kwargs, artifact=part)
+
+  with mock.patch.object(store, "read", wraps=store.read) as read:
+    loaded = await artifact_service.load_artifact(**kwargs, version=1)
+
+  assert await artifact_service.list_versions(**kwargs) == [0, 1, 2]
+  assert loaded == parts[1]
+  # Only the ref is read; the content comes from the LRU cache.
+  read.assert_called_once_with("refs/app/user/s/f/1")
+  assert await artifact_service.load_artifact(**kwargs) == parts[2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "names",
+    [
+        {"app_name": "..", "user_id": ".."},
+        {"filename": "../../escaped"},
+        {"user_id": ""},
+    ],
+    ids=["app_and_user", "filename", "empty"],
+)
+async def test_local_store_names_cannot_escape_root(tmp_path, names):
+  root_dir = tmp_path / "root"
+  artifact_service = ContentAddressedArtifactService(
+      LocalBlobStore(str(root_dir))
+  )
+  kwargs = dict(
+      app_name="app", user_id="user", session_id="session", filename="a.pdf"
+  )
+
+  with pytest.raises(ValueError):
+    await artifact_service.save_artifact(**{**kwargs, **names}, artifact=_PDF)
+
+  with pytest.raises(ValueError):
+    await artifact_service.delete_artifact(**{**kwargs, **names})
+  assert [p.name for p in tmp_path.iterdir()] == []
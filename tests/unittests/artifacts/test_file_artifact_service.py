@@ -0,0 +1,210 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the local filesystem artifact service."""
+
+import asyncio
+import io
+import json
+import os
+
+from google.adk.artifacts import FileArtifactService
+from google.genai import types
+import pytest
+
+_KWARGS = dict(
+    app_name="app", user_id="user", session_id="session", filename="file.txt"
+)
+
+
+@pytest.mark.asyncio
+async def test_save_load_list_delete(tmp_path):
+  artifact_service = FileArtifactService(str(tmp_path))
+  parts = [
+      types.Part.from_bytes(data=f"v{i}".encode(), mime_type="text/plain")
+      for i in range(3)
+  ]
+
+  versions = [
+      await artifact_service.save_artifact(**_KWARGS, artifact=part)
+      for part in parts
+  ]
+  await artifact_service.save_artifact(
+      **{**_KWARGS, "filename": "user:profile"}, artifact=parts[0]
+  )
+
+  assert versions == [0, 1, 2]
+  assert await artifact_service.list_versions(**_KWARGS) == [0, 1, 2]
+  assert await artifact_service.load_artifact(**_KWARGS) == parts[2]
+  assert await artifact_service.load_artifact(**_KWARGS, version=0) == parts[0]
+  assert await artifact_service.list_artifact_keys(
+      app_name="app", user_id="user", session_id="session"
+  ) == ["file.txt", "user:profile"]
+
+  await artifact_service.delete_artifact(**_KWARGS)
+
+  assert not await artifact_service.load_artifact(**_KWARGS)
+  assert await artifact_service.list_artifact_keys(
+      app_name="app", user_id="user", session_id="session"
+  ) == ["user:profile"]
+
+
+@pytest.mark.asyncio
+async def test_writes_metadata_sidecar_and_no_temp_files(tmp_path):
+  artifact_service = FileArtifactService(str(tmp_path))
+  await artifact_service.save_artifact(
+      **_KWARGS,
+      artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+  )
+
+  artifact_dir = tmp_path / "app" / "user" / "session" / "file.txt"
+  assert sorted(os.listdir(artifact_dir)) == ["0", "0.meta.json"]
+  metadata = json.loads((artifact_dir / "0.meta.json").read_text())
+  assert metadata["mime_type"] == "text/plain"
+  assert metadata["size"] == 4
+
+
+@pytest.mark.asyncio
+async def test_names_cannot_escape_root(tmp_path):
+  root_dir = tmp_path / "root"
+  artifact_service = FileArtifactService(str(root_dir))
+  kwargs = {**_KWARGS, "filename": "../../escaped"}
+
+  await artifact_service.save_artifact(
+      **kwargs,
+      artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+  )
+
+  assert os.listdir(tmp_path) == ["root"]
+  assert await artifact_service.list_artifact_keys(
+      app_name="app", user_id="user", session_id="session"
+  ) == ["../../escaped"]
+
+
+@pytest.mark.asyncio
+async def test_delete_dot_dot_filename_is_rejected(tmp_path):
+  artifact_service = FileArtifactService(str(tmp_path))
+  await artifact_service.save_artifact(
+      **_KWARGS,
+      artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+  )
+
+  for filename in ["..", ".", ""]:
+    with pytest.raises(ValueError):
+      await artifact_service.delete_artifact(
+          app_name="app",
+          user_id="user",
+          session_id="session",
+          filename=filename,
+      )
+
+  assert await artifact_service.list_artifact_keys(
+      app_name="app", user_id="user", session_id="session"
+  ) == ["file.txt"]
+
+
+@pytest.mark.asyncio
+async def test_save_dot_dot_namespace_is_rejected(tmp_path):
+  root_dir = tmp_path / "root"
+  artifact_service = FileArtifactService(str(root_dir))
+
+  with pytest.raises(ValueError):
+    await artifact_service.save_artifact(
+        **{**_KWARGS, "app_name": "..", "user_id": ".."},
+        artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+    )
+
+  assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_symlink_out_of_root_is_rejected(tmp_path):
+  root_dir = tmp_path / "root"
+  (root_dir / "app").mkdir(parents=True)
+  (tmp_path / "outside").mkdir()
+  os.symlink(tmp_path / "outside", root_dir / "app" / "user")
+  artifact_service = FileArtifactService(str(root_dir))
+
+  with pytest.raises(ValueError, match="outside"):
+    await artifact_service.save_artifact(
+        **_KWARGS,
+        artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+    )
+
+  assert os.listdir(tmp_path / "outside") == []
+
+
+@pytest.mark.asyncio
+async def test_save_from_streams(tmp_path):
+  artifact_service = FileArtifactService(str(tmp_path))
+
+  async def chunks():
+    yield b"async "
+    yield b"chunks"
+
+  await artifact_service.save_artifact_from_stream(
+      **_KWARGS, stream=io.BytesIO(b"file object"), mime_type="text/plain"
+  )
+  await artifact_service.save_artifact_from_stream(
+      **_KWARGS, stream=chunks(), mime_type="text/plain"
+  )
+
+  first = await artifact_service.load_artifact(**_KWARGS, version=0)
+  second = await artifact_service.load_artifact(**_KWARGS, version=1)
+  assert first.inline_data.data == b"file object"
+  assert second.inline_data.data == b"async chunks"
+
+
+@pytest.mark.asyncio
+async def test_open_artifact_is_memory_mapped(tmp_path):
+  artifact_service = FileArtifactService(str(tmp_path))
+  data = os.urandom(64 * 1024)
+  await artifact_service.save_artifact(
+      **_KWARGS,
+      artifact=types.Part.from_bytes(data=data, mime_type="image/png"),
+  )
+
+  with await artifact_service.open_artifact(**_KWARGS) as mapped:
+    assert mapped.mime_type == "image/png"
+    assert mapped.data[:16] == data[:16]
+    assert len(mapped.data) == len(data)
+  loaded = await artifact_service.load_artifact(**_KWARGS)
+  assert loaded.inline_data.data == data
+  assert not await artifact_service.open_artifact(
+      **{**_KWARGS, "filename": "missing"}
+  )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_get_distinct_versions(tmp_path):
+  artifact_services = [FileArtifactService(str(tmp_path)) for _ in range(2)]
+
+  versions = await asyncio.gather(*[
+      artifact_services[i % 2].save_artifact(
+          **_KWARGS,
+          artifact=types.Part.from_bytes(
+              data=bytes([i]), mime_type="text/plain"
+          ),
+      )
+      for i in range(6)
+  ])
+
+  assert sorted(versions) == list(range(6))
+  loaded = [
+      (
+          await artifact_services[0].load_artifact(**_KWARGS, version=v)
+      ).inline_data.data
+      for v in versions
+  ]
+  assert loaded == [bytes([i]) for i in range(6)]
@@ -895,6 +895,15 @@ def test_debug_trace(test_app):
   logger.info("Debug trace test completed successfully")
 
 
+def test_debug_metrics(test_app):
+  """Test that the debug metrics endpoint returns the recorded metrics."""
+  response = test_app.get("/debug/metrics")
+
+  assert response.status_code == 200
+  assert isinstance(response.json(), dict)
+  logger.info("Debug metrics test completed successfully")
+
+
 @pytest.mark.skipif(
     sys.version_info < (3, 10), reason="A2A requires Python 3.10+"
 )
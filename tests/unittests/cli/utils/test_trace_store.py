@@ -0,0 +1,90 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bounded trace store of the API server."""
+
+from google.adk.cli.fast_api import ApiServerSpanExporter
+from google.adk.cli.fast_api import InMemoryExporter
+from google.adk.cli.utils.trace_store import TraceStore
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
+
+
+def _span(name: str, trace_id: int, span_id: int, **attributes):
+  return ReadableSpan(
+      name=name,
+      context=SpanContext(trace_id=trace_id, span_id=span_id, is_remote=False),
+      attributes=attributes,
+  )
+
+
+def _span_ids(spans):
+  return [span.context.span_id for span in spans]
+
+
+def test_exporter_indexes_spans_by_session():
+  exporter = InMemoryExporter(TraceStore())
+
+  exporter.export([
+      _span("call_llm", 1, 1, **{"gcp.vertex.agent.session_id": "s1"}),
+      _span("execute_tool", 1, 2),
+      _span("call_llm", 2, 3, **{"gcp.vertex.agent.session_id": "s2"}),
+      _span("invocation", 1, 4),
+  ])
+
+  assert _span_ids(exporter.get_finished_spans("s1")) == [1, 2, 4]
+  assert _span_ids(exporter.get_finished_spans("s2")) == [3]
+  assert exporter.get_finished_spans("unknown") == []
+
+  exporter.clear()
+
+  assert exporter.get_finished_spans("s1") == []
+
+
+def test_oldest_spans_are_dropped_past_max_spans():
+  store = TraceStore(max_spans=3)
+  store.add_session_trace("s1", 1)
+
+  for span_id in range(5):
+    store.add_span(_span("span", 1, span_id))
+
+  assert _span_ids(store.get_session_spans("s1")) == [2, 3, 4]
+
+
+def test_least_recently_used_session_is_evicted():
+  store = TraceStore(max_sessions=2)
+  for trace_id, session_id in enumerate(["s1", "s2"]):
+    store.add_session_trace(session_id, trace_id)
+    store.add_span(_span("span", trace_id, trace_id))
+
+  store.get_session_spans("s1")
+  store.add_session_trace("s3", 2)
+  store.add_span(_span("span", 2, 2))
+
+  assert _span_ids(store.get_session_spans("s1")) == [0]
+  assert store.get_session_spans("s2") == []
+  assert _span_ids(store.get_session_spans("s3")) == [2]
+
+
+def test_event_attributes_are_bounded():
+  store = TraceStore(max_events=2)
+  exporter = ApiServerSpanExporter(store)
+
+  for i in range(3):
+    exporter.export(
+        [_span("call_llm", 1, i, **{"gcp.vertex.agent.event_id": f"e{i}"})]
+    )
+
+  assert store.get_event_attributes("e0") is None
+  assert store.get_event_attributes("e2")["span_id"] == 2
@@ -15,6 +15,7 @@
 from google.adk.agents.llm_agent import Agent
 from google.adk.agents.loop_agent import LoopAgent
 from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.flows.llm_flows.agent_transfer import _get_transfer_instructions
 from google.adk.tools import exit_loop
 from google.genai.types import Part
 
@@ -311,3 +312,37 @@ def test_auto_to_loop():
   assert testing_utils.simplify_events(runner.run('test2')) == [
       ('root_agent', 'response5'),
   ]
+
+
+def test_transfer_instructions_follow_tree_changes():
+  sub_agent_1 = Agent(name='sub_agent_1', description='First sub-agent.')
+  sub_agent_2 = Agent(name='sub_agent_2', description='Second sub-agent.')
+  root_agent = Agent(name='root_agent', sub_agents=[sub_agent_1])
+
+  instructions = _get_transfer_instructions(root_agent)
+  assert 'First sub-agent.' in instructions
+  assert _get_transfer_instructions(root_agent) is instructions
+
+  sub_agent_1.description = 'Updated sub-agent.'
+  sub_agent_2.parent_agent = root_agent
+  root_agent.sub_agents = [sub_agent_1, sub_agent_2]
+  instructions = _get_transfer_instructions(root_agent)
+  assert 'Updated sub-agent.' in instructions
+  assert 'Second sub-agent.' in instructions
+
+  sub_agent_1.disallow_transfer_to_parent = True
+  sub_agent_1.disallow_transfer_to_peers = True
+  assert _get_transfer_instructions(sub_agent_1) is None
+
+
+def test_transfer_instructions_follow_in_place_changes():
+  sub_agent_1 = Agent(name='sub_agent_1', description='First sub-agent.')
+  sub_agent_2 = Agent(name='sub_agent_2', description='Second sub-agent.')
+  root_agent = Agent(name='root_agent', sub_agents=[sub_agent_1])
+  assert 'Second sub-agent.' not in _get_transfer_instructions(root_agent)
+
+  root_agent.sub_agents.append(sub_agent_2)
+  assert 'Second sub-agent.' in _get_transfer_instructions(root_agent)
+
+  root_agent.sub_agents.clear()
+  assert _get_transfer_instructions(root_agent) is None
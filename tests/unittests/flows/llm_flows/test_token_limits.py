@@ -0,0 +1,224 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.agents import Agent
+from google.adk.agents import LoopAgent
+from google.adk.agents import SequentialAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.run_config import RunConfig
+from google.adk.events import Event
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from typing_extensions import override
+
+from ... import testing_utils
+
+
+def _mock_model(num_responses: int) -> testing_utils.MockModel:
+  """Creates a model whose every response uses 15 tokens."""
+  return testing_utils.MockModel.create(
+      responses=[
+          LlmResponse(
+              content=testing_utils.ModelContent(
+                  [types.Part(text=f'response{i}')]
+              ),
+              usage_metadata=types.GenerateContentResponseUsageMetadata(
+                  prompt_token_count=10, candidates_token_count=5
+              ),
+          )
+          for i in range(1, num_responses + 1)
+      ]
+  )
+
+
+def _run(
+    runner: testing_utils.InMemoryRunner, run_config: RunConfig
+) -> list[Event]:
+  return list(
+      runner.runner.run(
+          user_id=runner.session.user_id,
+          session_id=runner.session.id,
+          new_message=testing_utils.get_user_content('test'),
+          run_config=run_config,
+      )
+  )
+
+
+def _simplify(events: list[Event]) -> list[tuple[str, str]]:
+  return [
+      (e.author, e.error_code or testing_utils.simplify_content(e.content))
+      for e in events
+  ]
+
+
+def test_max_tokens_ends_invocation():
+  root_agent = SequentialAgent(
+      name='root_agent',
+      sub_agents=[
+          Agent(name=f'agent_{i}', model=_mock_model(1)) for i in range(3)
+      ],
+  )
+  runner = testing_utils.InMemoryRunner(root_agent)
+
+  events = _run(runner, RunConfig(max_tokens=15))
+
+  # The third agent doesn't run once the second one hit the limit.
+  assert _simplify(events) == [
+      ('agent_0', 'response1'),
+      ('agent_1', 'TOKEN_LIMIT_EXCEEDED'),
+  ]
+  assert events[-1].error_message == (
+      'Max number of tokens limit of `15` reached'
+  )
+
+
+def test_max_tokens_stops_loop():
+  root_agent = LoopAgent(
+      name='root_agent',
+      sub_agents=[Agent(name='agent', model=_mock_model(3))],
+  )
+  runner = testing_utils.InMemoryRunner(root_agent)
+
+  events = _run(runner, RunConfig(max_tokens=30))
+
+  assert _simplify(events) == [
+      ('agent', 'response1'),
+      ('agent', 'response2'),
+      ('agent', 'TOKEN_LIMIT_EXCEEDED'),
+  ]
+
+
+def test_max_session_tokens():
+  runner = testing_utils.InMemoryRunner(
+      Agent(name='root_agent', model=_mock_model(2))
+  )
+  run_config = RunConfig(max_session_tokens=20)
+
+  assert _simplify(_run(runner, run_config)) == [
+      ('root_agent', 'response1'),
+  ]
+  assert _simplify(_run(runner, run_config)) == [
+      ('root_agent', 'response2'),
+  ]
+  assert _simplify(_run(runner, run_config)) == [
+      ('root_agent', 'TOKEN_LIMIT_EXCEEDED'),
+  ]
+
+
+def test_callback_context_token_counts():
+  seen = []
+
+  def before_model_callback(
+      callback_context: CallbackContext, llm_request: LlmRequest
+  ):
+    seen.append((
+        callback_context.llm_call_count,
+        callback_context.token_count,
+        callback_context.session_token_count,
+        callback_context.remaining_tokens,
+    ))
+
+  runner = testing_utils.InMemoryRunner(
+      SequentialAgent(
+          name='root_agent',
+          sub_agents=[
+              Agent(
+                  name=f'agent_{i}',
+                  model=_mock_model(2),
+                  before_model_callback=before_model_callback,
+              )
+              for i in range(2)
+          ],
+      )
+  )
+
+  _run(runner, RunConfig(max_tokens=100))
+  _run(runner, RunConfig())
+
+  assert seen == [
+      (0, 0, 0, 100),
+      (1, 15, 15, 85),
+      (0, 0, 30, None),
+      (1, 15, 45, None),
+  ]
+
+
+class _StreamingModel(testing_utils.MockModel):
+  """Streams two final responses per call, both with the usage so far."""
+
+  @override
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    self.response_index += 1
+    for text, candidates_token_count in (('thinking', 2), ('done', 5)):
+      yield LlmResponse(
+          content=testing_utils.ModelContent([types.Part(text=text)]),
+          usage_metadata=types.GenerateContentResponseUsageMetadata(
+              prompt_token_count=10,
+              candidates_token_count=candidates_token_count,
+          ),
+      )
+
+
+def test_session_tokens_count_each_streamed_llm_call_once():
+  seen = []
+
+  def before_model_callback(
+      callback_context: CallbackContext, llm_request: LlmRequest
+  ):
+    seen.append(callback_context.session_token_count)
+
+  runner = testing_utils.InMemoryRunner(
+      Agent(
+          name='root_agent',
+          model=_StreamingModel(responses=[]),
+          before_model_callback=before_model_callback,
+      )
+  )
+
+  _run(runner, RunConfig())
+  _run(runner, RunConfig())
+
+  assert seen == [0, 15]
+
+
+def test_max_tokens_ends_live_session():
+  runner = testing_utils.InMemoryRunner(
+      Agent(name='root_agent', model=_mock_model(3))
+  )
+
+  async def run_live() -> list[Event]:
+    return [
+        event
+        async for event in runner.runner.run_live(
+            user_id=runner.session.user_id,
+            session_id=runner.session.id,
+            live_request_queue=LiveRequestQueue(),
+            run_config=RunConfig(max_tokens=30),
+        )
+    ]
+
+  events = asyncio.run(asyncio.wait_for(run_live(), timeout=10))
+
+  assert _simplify(events) == [
+      ('root_agent', 'response1'),
+      ('root_agent', 'response2'),
+      ('root_agent', 'TOKEN_LIMIT_EXCEEDED'),
+  ]
@@ -0,0 +1,199 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.agents import Agent
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.run_config import StreamingMode
+from google.adk.events import Event
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from typing_extensions import override
+
+from ... import testing_utils
+
+
+class _Log:
+  """Records what the model and the tool did, in order."""
+
+  def __init__(self):
+    self.entries = []
+    self.spans = []
+
+
+class _StreamingModel(BaseLlm):
+  """Announces a function call in a partial response before confirming it."""
+
+  model: str = 'streaming'
+  log: _Log
+  announced_args: dict
+  confirmed_args: dict
+  step: int = 0
+
+  @override
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    self.step += 1
+    if self.step > 1:
+      yield LlmResponse(
+          content=testing_utils.ModelContent(
+              [types.Part.from_text(text='done')]
+          )
+      )
+      return
+    yield LlmResponse(
+        content=testing_utils.ModelContent([
+            types.Part.from_function_call(
+                name='lookup', args=self.announced_args
+            )
+        ]),
+        partial=True,
+    )
+    # The rest of the stream takes a while.
+    await asyncio.sleep(0.05)
+    self.log.entries.append('model_done')
+    yield LlmResponse(
+        content=testing_utils.ModelContent([
+            types.Part.from_function_call(
+                name='lookup', args=self.confirmed_args
+            )
+        ])
+    )
+
+
+def _run(
+    log: _Log,
+    announced_args: dict,
+    confirmed_args: dict,
+    is_read_only: bool = True,
+    before_tool_callback=None,
+) -> list[Event]:
+  async def lookup(key: str) -> str:
+    log.entries.append(f'started {key}')
+    log.spans.append(trace.get_current_span())
+    await asyncio.sleep(0.02)
+    log.entries.append(f'finished {key}')
+    return f'value of {key}'
+
+  agent = Agent(
+      name='root_agent',
+      model=_StreamingModel(
+          log=log, announced_args=announced_args, confirmed_args=confirmed_args
+      ),
+      tools=[FunctionTool(lookup, is_read_only=is_read_only)],
+      before_tool_callback=before_tool_callback,
+  )
+  runner = testing_utils.InMemoryRunner(agent)
+  return list(
+      runner.runner.run(
+          user_id=runner.session.user_id,
+          session_id=runner.session.id,
+          new_message=testing_utils.get_user_content('test'),
+          run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+      )
+  )
+
+
+def _get_function_responses(events: list[Event]) -> list[dict]:
+  assert events[-1].content.parts[0].text == 'done'
+  return [
+      response.response
+      for event in events
+      for response in event.get_function_responses()
+  ]
+
+
+def test_read_only_tool_starts_before_stream_ends():
+  log = _Log()
+
+  events = _run(log, {'key': 'a'}, {'key': 'a'})
+
+  assert log.entries == ['started a', 'finished a', 'model_done']
+  assert _get_function_responses(events) == [{'result': 'value of a'}]
+
+
+def test_unconfirmed_call_is_discarded():
+  log = _Log()
+
+  events = _run(log, {'key': 'a'}, {'key': 'b'})
+
+  assert log.entries == [
+      'started a',
+      'finished a',
+      'model_done',
+      'started b',
+      'finished b',
+  ]
+  assert _get_function_responses(events) == [{'result': 'value of b'}]
+
+
+def test_tool_not_read_only_waits_for_stream():
+  log = _Log()
+
+  events = _run(log, {'key': 'a'}, {'key': 'a'}, is_read_only=False)
+
+  assert log.entries == ['model_done', 'started a', 'finished a']
+  assert _get_function_responses(events) == [{'result': 'value of a'}]
+
+
+def test_before_tool_callback_disables_prefetch():
+  log = _Log()
+
+  def before_tool_callback(tool, args, tool_context):
+    log.entries.append(f'blocked {args["key"]}')
+    return {'result': 'blocked'}
+
+  events = _run(
+      log,
+      {'key': 'a'},
+      {'key': 'a'},
+      before_tool_callback=before_tool_callback,
+  )
+
+  # The guardrail answers the call, so the tool never runs.
+  assert log.entries == ['model_done', 'blocked a']
+  assert _get_function_responses(events) == [{'result': 'blocked'}]
+
+
+def test_prefetched_call_runs_in_execute_tool_span(monkeypatch):
+  exporter = InMemorySpanExporter()
+  provider = TracerProvider()
+  provider.add_span_processor(SimpleSpanProcessor(exporter))
+  tracer = provider.get_tracer(__name__)
+  monkeypatch.setattr('google.adk.flows.llm_flows.functions.tracer', tracer)
+  monkeypatch.setattr(
+      'google.adk.flows.llm_flows._tool_prefetcher.tracer', tracer
+  )
+  log = _Log()
+
+  _run(log, {'key': 'a'}, {'key': 'a'})
+
+  assert log.entries == ['started a', 'finished a', 'model_done']
+  (span,) = [
+      span
+      for span in exporter.get_finished_spans()
+      if span.name == 'execute_tool lookup'
+  ]
+  assert [s.get_span_context() for s in log.spans] == [span.context]
+  assert span.attributes['gen_ai.tool.name'] == 'lookup'
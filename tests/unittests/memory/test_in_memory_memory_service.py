@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.events import Event
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+
+def _event(event_id: str, text: str) -> Event:
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author='user',
+      timestamp=12345,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(session_id: str, events: list[Event]) -> Session:
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id=session_id,
+      last_update_time=22333,
+      events=events,
+  )
+
+
+def _texts(response) -> list[str]:
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+async def _search(memory_service, query: str):
+  return await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=query
+  )
+
+
+@pytest.mark.asyncio
+async def test_search_memory_ranks_by_bm25():
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(
+      _session(
+          '1',
+          [
+              _event('a', 'I had pasta for lunch today'),
+              _event('b', 'My favorite pasta is pasta carbonara'),
+              _event('c', 'The weather is nice'),
+              Event(id='d', invocation_id='inv', author='user'),
+          ],
+      )
+  )
+
+  response = await _search(memory_service, 'Pasta?')
+
+  assert _texts(response) == [
+      'My favorite pasta is pasta carbonara',
+      'I had pasta for lunch today',
+  ]
+  assert not (await _search(memory_service, 'snow')).memories
+
+
+@pytest.mark.asyncio
+async def test_search_memory_respects_top_k():
+  memory_service = InMemoryMemoryService(top_k=1)
+  await memory_service.add_session_to_memory(
+      _session(
+          '1',
+          [_event('a', 'red apple'), _event('b', 'red red car')],
+      )
+  )
+
+  response = await _search(memory_service, 'red')
+
+  assert _texts(response) == ['red red car']
+
+
+@pytest.mark.asyncio
+async def test_readding_session_updates_index_incrementally():
+  memory_service = InMemoryMemoryService()
+  events = [_event('a', 'first topic'), _event('b', 'second topic')]
+  await memory_service.add_session_to_memory(_session('1', events))
+  await memory_service.add_session_to_memory(_session('2', [events[0]]))
+
+  # The session is re-added with one event rewritten and one appended.
+  await memory_service.add_session_to_memory(
+      _session(
+          '1',
+          [events[0], _event('c', 'replaced topic'), _event('d', 'third')],
+      )
+  )
+
+  assert _texts(await _search(memory_service, 'topic')) == [
+      'first topic',
+      'first topic',
+      'replaced topic',
+  ]
+  assert _texts(await _search(memory_service, 'third')) == ['third']
+  assert not (await _search(memory_service, 'second')).memories
+
+  await memory_service.add_session_to_memory(_session('1', []))
+
+  assert _texts(await _search(memory_service, 'topic')) == ['first topic']
+
+
+@pytest.mark.asyncio
+async def test_search_memory_is_scoped_to_user():
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(
+      _session('1', [_event('a', 'secret plan')])
+  )
+
+  response = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id='other-user', query='secret'
+  )
+
+  assert not response.memories
@@ -0,0 +1,206 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.events import Event
+from google.adk.memory import local_vector_memory_service
+from google.adk.memory.local_vector_memory_service import HashingEmbedder
+from google.adk.memory.local_vector_memory_service import LocalVectorMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import numpy as np
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+
+def _event(event_id: str, text: str) -> Event:
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author='user',
+      timestamp=12345,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(session_id: str, events: list[Event]) -> Session:
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id=session_id,
+      last_update_time=22333,
+      events=events,
+  )
+
+
+async def _search_texts(memory_service, query: str) -> list[str]:
+  response = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+def test_hashing_embedder_is_deterministic():
+  embedder = HashingEmbedder(dimensions=32)
+
+  first = embedder(['hello world', 'other text'])
+  second = embedder(['hello world', 'other text'])
+
+  assert first.shape == (2, 32)
+  np.testing.assert_array_equal(first, second)
+
+
+@pytest.mark.asyncio
+async def test_search_memory_returns_top_k_by_cosine_similarity():
+  memory_service = LocalVectorMemoryService(top_k=2)
+  await memory_service.add_session_to_memory(
+      _session(
+          '1',
+          [
+              _event('a', 'I like green tea'),
+              _event('b', 'green tea with honey and lemon'),
+              _event('c', 'the car is fast'),
+              Event(id='d', invocation_id='inv', author='user'),
+          ],
+      )
+  )
+
+  assert await _search_texts(memory_service, 'green tea') == [
+      'I like green tea',
+      'green tea with honey and lemon',
+  ]
+  assert await _search_texts(memory_service, 'bicycle') == []
+
+
+@pytest.mark.asyncio
+async def test_readding_session_only_embeds_new_events():
+  embedded_texts = []
+
+  async def embedding_function(texts):
+    embedded_texts.extend(texts)
+    return HashingEmbedder()(texts)
+
+  memory_service = LocalVectorMemoryService(
+      embedding_function=embedding_function
+  )
+  events = [_event('a', 'first')]
+  await memory_service.add_session_to_memory(_session('1', events))
+  await memory_service.add_session_to_memory(
+      _session('1', events + [_event('b', 'second')])
+  )
+
+  assert embedded_texts == ['first', 'second']
+
+
+@pytest.mark.asyncio
+async def test_memories_are_persisted_and_memory_mapped(tmp_path):
+  memory_service = LocalVectorMemoryService(persist_dir=str(tmp_path))
+  await memory_service.add_session_to_memory(
+      _session('1', [_event('a', 'the blue whale is large')])
+  )
+
+  reloaded = LocalVectorMemoryService(persist_dir=str(tmp_path))
+  await reloaded.add_session_to_memory(
+      _session('1', [_event('a', 'the blue whale is large')])
+  )
+  await reloaded.add_session_to_memory(
+      _session('2', [_event('b', 'the red fox is quick')])
+  )
+
+  assert await _search_texts(reloaded, 'whale') == ['the blue whale is large']
+  assert await _search_texts(reloaded, 'fox') == ['the red fox is quick']
+  store = reloaded._stores[(MOCK_APP_NAME, MOCK_USER_ID)]
+  assert isinstance(store.loaded, np.memmap)
+  assert len(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_persisted_user_id_cannot_escape_persist_dir(tmp_path):
+  persist_dir = tmp_path / 'memory'
+  memory_service = LocalVectorMemoryService(persist_dir=str(persist_dir))
+  session = _session('1', [_event('a', 'the blue whale is large')])
+  session.user_id = '..'
+
+  with pytest.raises(ValueError):
+    await memory_service.add_session_to_memory(session)
+
+  assert [p.name for p in tmp_path.iterdir()] == []
+
+
+@pytest.mark.asyncio
+async def test_search_uses_ivf_index_past_threshold():
+  memory_service = LocalVectorMemoryService(ann_threshold=50, nprobe=4)
+  await memory_service.add_session_to_memory(
+      _session(
+          '1',
+          [_event(str(i), f'memory number {i} word{i}') for i in range(200)],
+      )
+  )
+
+  assert await _search_texts(memory_service, 'word123') == [
+      'memory number 123 word123'
+  ]
+  store = memory_service._stores[(MOCK_APP_NAME, MOCK_USER_ID)]
+  assert store.ivf is not None
+
+
+@pytest.mark.asyncio
+async def test_search_with_empty_ivf_candidates_returns_nothing():
+  memory_service = LocalVectorMemoryService(ann_threshold=50, nprobe=4)
+  await memory_service.add_session_to_memory(
+      _session(
+          '1',
+          [_event(str(i), f'memory number {i} word{i}') for i in range(200)],
+      )
+  )
+
+  with mock.patch.object(
+      local_vector_memory_service._IvfIndex,
+      'candidates',
+      return_value=np.zeros(0, dtype=np.int64),
+  ):
+    assert await _search_texts(memory_service, 'word123') == []
+
+
+@pytest.mark.asyncio
+async def test_loading_memories_of_other_dimensions_raises(tmp_path):
+  memory_service = LocalVectorMemoryService(
+      dimensions=32, persist_dir=str(tmp_path)
+  )
+  await memory_service.add_session_to_memory(
+      _session('1', [_event('a', 'the blue whale is large')])
+  )
+
+  reloaded = LocalVectorMemoryService(dimensions=64, persist_dir=str(tmp_path))
+  with pytest.raises(ValueError, match='32 dimensions'):
+    await _search_texts(reloaded, 'whale')
+
+  # The store is left intact for a service with matching dimensions.
+  reloaded = LocalVectorMemoryService(dimensions=32, persist_dir=str(tmp_path))
+  assert await _search_texts(reloaded, 'whale') == ['the blue whale is large']
+
+
+@pytest.mark.asyncio
+async def test_embedding_function_with_wrong_dimensions_raises():
+  memory_service = LocalVectorMemoryService(
+      embedding_function=lambda texts: [[1.0, 0.0]] * len(texts)
+  )
+
+  with pytest.raises(ValueError):
+    await memory_service.add_session_to_memory(
+        _session('1', [_event('a', 'text')])
+    )
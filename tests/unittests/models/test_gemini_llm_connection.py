@@ -109,3 +109,33 @@ async def test_close(gemini_connection, mock_gemini_session):
   await gemini_connection.close()
 
   mock_gemini_session.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_receive_surfaces_usage_metadata(
+    gemini_connection, mock_gemini_session
+):
+  """Test receive yields the token usage reported by the live session."""
+
+  async def receive():
+    yield types.LiveServerMessage(
+        usage_metadata=types.UsageMetadata(
+            prompt_token_count=10,
+            response_token_count=5,
+            total_token_count=15,
+        ),
+        server_content=types.LiveServerContent(turn_complete=True),
+    )
+
+  mock_gemini_session.receive = receive
+
+  responses = [response async for response in gemini_connection.receive()]
+
+  assert responses[0].usage_metadata == (
+      types.GenerateContentResponseUsageMetadata(
+          prompt_token_count=10,
+          candidates_token_count=5,
+          total_token_count=15,
+      )
+  )
+  assert responses[-1].turn_complete
@@ -29,6 +29,7 @@ from google.adk.models.lite_llm import LiteLLMClient
 from google.adk.models.lite_llm import TextChunk
 from google.adk.models.lite_llm import UsageMetadataChunk
 from google.adk.models.llm_request import LlmRequest
+from google.adk.tools.function_tool import FunctionTool
 from google.genai import types
 from litellm import ChatCompletionAssistantMessage
 from litellm import ChatCompletionMessageToolCall
@@ -1235,6 +1236,42 @@ async def test_generate_content_async_stream(
   )
 
 
+@pytest.mark.asyncio
+async def test_generate_content_async_stream_announces_read_only_tool_call(
+    mock_completion, lite_llm_instance
+):
+  def test_function(test_arg: str) -> str:
+    return test_arg
+
+  llm_request = LLM_REQUEST_WITH_FUNCTION_DECLARATION.model_copy(
+      update={
+          "tools_dict": {
+              "test_function": FunctionTool(test_function, is_read_only=True)
+          },
+          "prefetch_read_only_tools": True,
+      }
+  )
+  mock_completion.return_value = iter(STREAMING_MODEL_RESPONSE)
+
+  responses = [
+      response
+      async for response in lite_llm_instance.generate_content_async(
+          llm_request, stream=True
+      )
+  ]
+
+  # The call is announced in a partial response as soon as its args are
+  # complete, and confirmed by the final response.
+  assert len(responses) == 5
+  assert responses[3].partial
+  assert responses[3].content.parts[0].function_call.name == "test_function"
+  assert responses[3].content.parts[0].function_call.args == {
+      "test_arg": "test_value"
+  }
+  assert not responses[4].partial
+  assert responses[4].content.parts[-1].function_call.name == "test_function"
+
+
 @pytest.mark.asyncio
 async def test_generate_content_async_stream_with_usage_metadata(
     mock_completion, lite_llm_instance
@@ -0,0 +1,29 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.sessions.state import State
+
+
+def test_copy_on_write_snapshots_the_state():
+  value = {'a': 1, 'b': 2}
+  delta = {'b': 3}
+  state = State(value=value, delta=delta)
+
+  snapshot = state.copy_on_write()
+  snapshot['c'] = 4
+  state['a'] = 5
+
+  assert dict(snapshot) == {'a': 1, 'b': 3, 'c': 4}
+  assert snapshot.maps[0] == {'c': 4}
+  assert 'c' not in state
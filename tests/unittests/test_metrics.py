@@ -0,0 +1,173 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any
+
+from google.adk import metrics
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+import pytest
+
+from . import testing_utils
+
+
+@pytest.fixture
+def metric_reader():
+  reader = InMemoryMetricReader()
+  metrics.set_meter_provider(MeterProvider(metric_readers=[reader]))
+  yield reader
+  metrics.set_meter_provider(None)
+
+
+def _data_points(
+    reader: InMemoryMetricReader, metric_name: str
+) -> dict[tuple[tuple[str, Any], ...], Any]:
+  """Returns the data points of a metric, keyed by their sorted attributes."""
+  data_points = {}
+  metrics_data = reader.get_metrics_data()
+  if metrics_data is None:
+    return data_points
+  for resource_metrics in metrics_data.resource_metrics:
+    for scope_metrics in resource_metrics.scope_metrics:
+      for metric in scope_metrics.metrics:
+        if metric.name != metric_name:
+          continue
+        for data_point in metric.data.data_points:
+          data_points[tuple(sorted(data_point.attributes.items()))] = data_point
+  return data_points
+
+
+def _phase_key(phase: str, name: str = None):
+  attributes = {'adk.phase': phase}
+  if name is not None:
+    attributes['adk.phase.name'] = name
+  return tuple(sorted(attributes.items()))
+
+
+def test_record_phase(metric_reader):
+  with metrics.record_phase(metrics.PHASE_TOOL, 'my_tool'):
+    pass
+  with pytest.raises(ValueError):
+    with metrics.record_phase(metrics.PHASE_TOOL, 'my_tool'):
+      raise ValueError('boom')
+
+  durations = _data_points(metric_reader, 'adk.phase.duration')
+  errors = _data_points(metric_reader, 'adk.phase.errors')
+  key = _phase_key(metrics.PHASE_TOOL, 'my_tool')
+  assert durations[key].count == 2
+  assert errors[key].value == 1
+
+
+@pytest.mark.asyncio
+async def test_record_phase_async_gen_excludes_consumer_time(metric_reader):
+  async def produce():
+    for i in range(2):
+      yield i
+
+  async for _ in metrics.record_phase_async_gen(
+      produce(), metrics.PHASE_REQUEST_PROCESSOR, 'processor'
+  ):
+    await asyncio.sleep(0.05)
+
+  durations = _data_points(metric_reader, 'adk.phase.duration')
+  data_point = durations[
+      _phase_key(metrics.PHASE_REQUEST_PROCESSOR, 'processor')
+  ]
+  assert data_point.count == 1
+  assert data_point.sum < 0.05
+
+
+@pytest.mark.asyncio
+async def test_record_llm_call(metric_reader):
+  async def generate():
+    yield LlmResponse(partial=True)
+    yield LlmResponse(
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=10,
+            candidates_token_count=3,
+            total_token_count=13,
+        )
+    )
+
+  responses = [
+      response
+      async for response in metrics.record_llm_call(generate(), 'model-a')
+  ]
+
+  assert len(responses) == 2
+  time_to_first_token = _data_points(
+      metric_reader, 'adk.llm.time_to_first_token'
+  )
+  assert time_to_first_token[(('gen_ai.request.model', 'model-a'),)].count == 1
+  tokens = _data_points(metric_reader, 'adk.llm.tokens')
+  assert {key: data_point.value for key, data_point in tokens.items()} == {
+      (('gen_ai.request.model', 'model-a'), ('gen_ai.token.type', 'input')): 10,
+      (
+          ('gen_ai.request.model', 'model-a'),
+          ('gen_ai.token.type', 'output'),
+      ): 3,
+  }
+
+
+@pytest.mark.asyncio
+async def test_runner_records_phases(metric_reader):
+  def increase_by_one(x: int) -> int:
+    return x + 1
+
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          types.Part.from_function_call(name='increase_by_one', args={'x': 1}),
+          'response',
+      ]
+  )
+  agent = LlmAgent(
+      name='root_agent',
+      model=mock_model,
+      instruction='Be helpful.',
+      tools=[increase_by_one],
+      before_model_callback=lambda callback_context, llm_request: None,
+  )
+  runner = testing_utils.InMemoryRunner(agent)
+
+  await runner.run_async('test')
+
+  durations = _data_points(metric_reader, 'adk.phase.duration')
+  assert durations[_phase_key(metrics.PHASE_SESSION_FETCH)].count == 1
+  # The user message, the function call, the function response and the final
+  # response.
+  assert durations[_phase_key(metrics.PHASE_APPEND_EVENT)].count == 4
+  assert durations[_phase_key(metrics.PHASE_TOOL_RESOLUTION)].count == 2
+  assert durations[_phase_key(metrics.PHASE_MODEL, 'mock')].count == 2
+  assert durations[_phase_key(metrics.PHASE_TOOL, 'increase_by_one')].count == 1
+  assert (
+      durations[_phase_key(metrics.PHASE_CALLBACK, 'before_model')].count == 2
+  )
+  assert (
+      durations[
+          _phase_key(metrics.PHASE_INSTRUCTION_INJECTION, 'instruction')
+      ].count
+      == 2
+  )
+  assert (
+      durations[
+          _phase_key(
+              metrics.PHASE_REQUEST_PROCESSOR, '_BasicLlmRequestProcessor'
+          )
+      ].count
+      == 2
+  )
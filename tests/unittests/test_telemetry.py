@@ -18,6 +18,7 @@ from typing import Dict
 from typing import Optional
 from unittest import mock
 
+from google.adk import telemetry
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.models.llm_request import LlmRequest
@@ -324,3 +325,192 @@ def test_trace_merged_tool_calls_sets_correct_attributes(
       expected_calls, any_order=True
   )
   mock_event_fixture.model_dumps_json.assert_called_once_with(exclude_none=True)
+
+
+@pytest.fixture
+def telemetry_level():
+  yield telemetry.set_telemetry_level
+  telemetry.set_telemetry_level(
+      telemetry.TelemetryLevel.FULL, max_payload_chars=None
+  )
+
+
+async def _trace_call_llm_with_usage():
+  agent = LlmAgent(name='test_agent')
+  invocation_context = await _create_invocation_context(agent)
+  llm_request = LlmRequest(
+      model='test_model',
+      config=types.GenerateContentConfig(system_instruction=''),
+  )
+  llm_response = LlmResponse(
+      turn_complete=True,
+      usage_metadata=types.GenerateContentResponseUsageMetadata(
+          total_token_count=100, prompt_token_count=50
+      ),
+  )
+  trace_call_llm(invocation_context, 'test_event_id', llm_request, llm_response)
+
+
+def _recorded_attributes(span) -> dict[str, Any]:
+  return {
+      call_obj.args[0]: call_obj.args[1]
+      for call_obj in span.set_attribute.call_args_list
+  }
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_skips_spans_that_are_not_recording(
+    monkeypatch, mock_span_fixture
+):
+  mock_span_fixture.is_recording.return_value = False
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+
+  with mock.patch.object(
+      telemetry, '_build_llm_request_for_trace'
+  ) as mock_build_request:
+    await _trace_call_llm_with_usage()
+
+  mock_span_fixture.set_attribute.assert_not_called()
+  mock_build_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_off_level_records_nothing(
+    monkeypatch, mock_span_fixture, telemetry_level
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry_level('off')
+
+  await _trace_call_llm_with_usage()
+
+  mock_span_fixture.set_attribute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_metadata_level_skips_payloads(
+    monkeypatch, mock_span_fixture, telemetry_level
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry_level(telemetry.TelemetryLevel.METADATA)
+
+  with mock.patch.object(
+      telemetry, '_build_llm_request_for_trace'
+  ) as mock_build_request:
+    await _trace_call_llm_with_usage()
+
+  attributes = _recorded_attributes(mock_span_fixture)
+  assert attributes['gen_ai.request.model'] == 'test_model'
+  assert attributes['gcp.vertex.agent.event_id'] == 'test_event_id'
+  assert attributes['gen_ai.usage.input_tokens'] == 50
+  assert attributes['gcp.vertex.agent.llm_request'] == '{}'
+  assert attributes['gcp.vertex.agent.llm_response'] == '{}'
+  mock_build_request.assert_not_called()
+
+
+def test_trace_tool_call_metadata_level_skips_payloads(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    telemetry_level,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry_level(telemetry.TelemetryLevel.METADATA)
+  mock_event_fixture.id = 'event_id_001'
+  mock_event_fixture.content = types.Content(
+      role='user',
+      parts=[
+          types.Part(
+              function_response=types.FunctionResponse(
+                  id='tool_call_id_001',
+                  name='test_function_1',
+                  response={'result': 'ok'},
+              )
+          ),
+      ],
+  )
+
+  trace_tool_call(
+      tool=mock_tool_fixture,
+      args={'param_a': 'value_a'},
+      function_response_event=mock_event_fixture,
+  )
+
+  attributes = _recorded_attributes(mock_span_fixture)
+  assert attributes['gen_ai.tool.call.id'] == 'tool_call_id_001'
+  assert attributes['gcp.vertex.agent.event_id'] == 'event_id_001'
+  assert 'gcp.vertex.agent.tool_call_args' not in attributes
+  assert 'gcp.vertex.agent.tool_response' not in attributes
+  assert attributes['gcp.vertex.agent.llm_request'] == '{}'
+  assert attributes['gcp.vertex.agent.llm_response'] == '{}'
+
+
+def test_trace_tool_call_caps_payload_size(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    telemetry_level,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry_level(telemetry.TelemetryLevel.FULL, max_payload_chars=10)
+  mock_event_fixture.id = 'event_id_001'
+  mock_event_fixture.content = types.Content(role='user', parts=[])
+
+  trace_tool_call(
+      tool=mock_tool_fixture,
+      args={'param_a': 'x' * 100},
+      function_response_event=mock_event_fixture,
+  )
+
+  attributes = _recorded_attributes(mock_span_fixture)
+  payload = json.dumps({'param_a': 'x' * 100})
+  assert json.loads(attributes['gcp.vertex.agent.tool_call_args']) == {
+      'truncated': True,
+      'length': len(payload),
+      'prefix': payload[:10],
+  }
+
+  # Changing the level keeps the cap.
+  telemetry_level(telemetry.TelemetryLevel.FULL)
+  trace_tool_call(
+      tool=mock_tool_fixture,
+      args={'param_a': 'x' * 100},
+      function_response_event=mock_event_fixture,
+  )
+  attributes = _recorded_attributes(mock_span_fixture)
+  assert json.loads(attributes['gcp.vertex.agent.tool_call_args'])['truncated']
+
+
+@pytest.mark.parametrize(
+    ('level', 'max_payload_chars', 'expected_level', 'expected_chars'),
+    [
+        ('metadata', '100', telemetry.TelemetryLevel.METADATA, 100),
+        ('', '', telemetry.TelemetryLevel.FULL, None),
+        ('verbose', 'lots', telemetry.TelemetryLevel.FULL, None),
+    ],
+)
+def test_telemetry_settings_from_env(
+    monkeypatch,
+    caplog,
+    level,
+    max_payload_chars,
+    expected_level,
+    expected_chars,
+):
+  monkeypatch.setenv('ADK_TELEMETRY_LEVEL', level)
+  monkeypatch.setenv('ADK_TELEMETRY_MAX_PAYLOAD_CHARS', max_payload_chars)
+
+  assert telemetry._level_from_env() is expected_level
+  assert telemetry._max_payload_chars_from_env() == expected_chars
+  assert ('Ignoring invalid' in caplog.text) == (level == 'verbose')
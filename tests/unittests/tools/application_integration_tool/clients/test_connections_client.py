@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import json
+import threading
 from unittest import mock
 
 from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
@@ -646,3 +647,88 @@ class TestConnectionsClient:
         token = client._get_access_token()
         assert token == "new_token"
         mock_refresh.assert_called_once()
+
+  @pytest.mark.asyncio
+  async def test_get_entity_schema_and_operations_async_polls_with_backoff(
+      self, project, location, connection_name
+  ):
+    client = ConnectionsClient(project, location, connection_name, None)
+    mock_execute_response_initial = mock.MagicMock()
+    mock_execute_response_initial.json.return_value = {
+        "name": "operations/test_op"
+    }
+    mock_execute_response_poll_pending = mock.MagicMock()
+    mock_execute_response_poll_pending.json.return_value = {"done": False}
+    mock_execute_response_poll_done = mock.MagicMock()
+    mock_execute_response_poll_done.json.return_value = {
+        "done": True,
+        "response": {
+            "jsonSchema": {"type": "object"},
+            "operations": ["LIST", "GET"],
+        },
+    }
+
+    with (
+        mock.patch.object(
+            client,
+            "_execute_api_call",
+            side_effect=[
+                mock_execute_response_initial,
+                mock_execute_response_poll_pending,
+                mock_execute_response_poll_pending,
+                mock_execute_response_poll_done,
+            ],
+        ) as mock_execute_api_call,
+        mock.patch(
+            "google.adk.tools.application_integration_tool.clients.connections_client.asyncio.sleep",
+            new_callable=mock.AsyncMock,
+        ) as mock_sleep,
+    ):
+      schema, operations = await client.get_entity_schema_and_operations_async(
+          "entity1"
+      )
+
+    assert schema == {"type": "object"}
+    assert operations == ["LIST", "GET"]
+    assert mock_sleep.await_args_list == [mock.call(0.5), mock.call(1.0)]
+    sessions = {id(call.args[1]) for call in mock_execute_api_call.mock_calls}
+    assert sessions <= {id(session) for session in client._sessions}
+    assert client._sessions
+    client.close()
+    assert not client._sessions
+
+  def test_each_thread_gets_its_own_session(
+      self, project, location, connection_name
+  ):
+    client = ConnectionsClient(project, location, connection_name, None)
+    main_session = client._get_session()
+    assert client._get_session() is main_session
+
+    thread_sessions = []
+    thread = threading.Thread(
+        target=lambda: thread_sessions.append(client._get_session())
+    )
+    thread.start()
+    thread.join()
+
+    assert thread_sessions[0] is not main_session
+    with mock.patch.object(requests.Session, "close") as mock_close:
+      client.close()
+    assert mock_close.call_count == 2
+    assert client._get_session() is not main_session
+
+  @pytest.mark.asyncio
+  async def test_get_action_schema_async_no_operation_id(
+      self, project, location, connection_name
+  ):
+    client = ConnectionsClient(project, location, connection_name, None)
+    mock_execute_response = mock.MagicMock()
+    mock_execute_response.json.return_value = {}
+
+    with mock.patch.object(
+        client, "_execute_api_call", return_value=mock_execute_response
+    ):
+      with pytest.raises(
+          ValueError, match="Failed to get action schema for action: action1"
+      ):
+        await client.get_action_schema_async("action1")
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import re
 from unittest import mock
@@ -385,6 +386,52 @@ class TestIntegrationClient:
     mock_connections_client_instance.list_operation.assert_called_once()
     mock_connections_client_instance.get_operation.assert_called_once()
 
+  @pytest.mark.asyncio
+  async def test_get_openapi_spec_for_connection_async_fetches_concurrently(
+      self, project, location, connection_name, mock_connections_client
+  ):
+    entity_operations = {"entity1": ["LIST"], "entity2": ["LIST"]}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch_entity_schema(entity):
+      nonlocal in_flight, max_in_flight
+      in_flight += 1
+      max_in_flight = max(max_in_flight, in_flight)
+      await asyncio.sleep(0)
+      in_flight -= 1
+      return {"type": "object", "title": entity}, ["LIST"]
+
+    mock_connections_client_instance = mock_connections_client.return_value
+    mock_connections_client_instance.get_connector_base_spec.return_value = {
+        "components": {"schemas": {}},
+        "paths": {},
+    }
+    mock_connections_client_instance.get_entity_schema_and_operations_async.side_effect = (
+        fetch_entity_schema
+    )
+    mock_connections_client_instance.list_operation.return_value = {"post": {}}
+
+    client = IntegrationClient(
+        project=project,
+        location=location,
+        integration=None,
+        triggers=None,
+        connection=connection_name,
+        entity_operations=entity_operations,
+        actions=None,
+        service_account_json=None,
+    )
+    spec = await client.get_openapi_spec_for_connection_async()
+
+    assert max_in_flight == 2
+    assert (
+        f"/v2/projects/{project}/locations/{location}/integrations/ExecuteConnection:execute?triggerId=api_trigger/ExecuteConnection#list_entity2"
+        in spec["paths"]
+    )
+    mock_connections_client_instance.get_entity_schema_and_operations.assert_not_called()
+    mock_connections_client_instance.close.assert_called_once()
+
   def test_get_openapi_spec_for_connection_with_actions(
       self, project, location, connection_name, mock_connections_client
   ):
@@ -189,7 +189,11 @@ async def test_initialization_with_integration_and_trigger(
   integration_name = "test-integration"
   triggers = ["test-trigger"]
   toolset = ApplicationIntegrationToolset(
-      project, location, integration=integration_name, triggers=triggers
+      project,
+      location,
+      integration=integration_name,
+      triggers=triggers,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project, location, integration_name, triggers, None, None, None, None
@@ -213,7 +217,11 @@ async def test_initialization_with_integration_and_list_of_triggers(
   integration_name = "test-integration"
   triggers = ["test-trigger1", "test-trigger2"]
   toolset = ApplicationIntegrationToolset(
-      project, location, integration=integration_name, triggers=triggers
+      project,
+      location,
+      integration=integration_name,
+      triggers=triggers,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project,
@@ -244,7 +252,10 @@ async def test_initialization_with_integration_and_empty_trigger_list(
 ):
   integration_name = "test-integration"
   toolset = ApplicationIntegrationToolset(
-      project, location, integration=integration_name
+      project,
+      location,
+      integration=integration_name,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project, location, integration_name, None, None, None, None, None
@@ -281,6 +292,7 @@ async def test_initialization_with_connection_and_entity_operations(
       entity_operations=entity_operations_list,
       tool_name_prefix=tool_name,
       tool_instructions=tool_instructions,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project,
@@ -333,6 +345,7 @@ async def test_initialization_with_connection_and_actions(
       actions=actions_list,
       tool_name_prefix=tool_name,
       tool_instructions=tool_instructions,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project, location, None, None, connection_name, None, actions_list, None
@@ -353,6 +366,43 @@ async def test_initialization_with_connection_and_actions(
   assert tools[0]._operation == "EXECUTE_ACTION"
 
 
+@pytest.mark.asyncio
+async def test_lazy_load_spec_fetches_asynchronously_on_get_tools(
+    project,
+    location,
+    mock_integration_client,
+    mock_connections_client,
+    mock_openapi_entity_spec_parser,
+    connection_details,
+):
+  connection_name = "test-connection"
+  mock_connections_client.return_value.get_connection_details_async = (
+      mock.AsyncMock(return_value=connection_details)
+  )
+  mock_integration_client.return_value.get_openapi_spec_for_connection_async = (
+      mock.AsyncMock(return_value={})
+  )
+  toolset = ApplicationIntegrationToolset(
+      project,
+      location,
+      connection=connection_name,
+      entity_operations=["list"],
+  )
+  mock_connections_client.return_value.get_connection_details.assert_not_called()
+  mock_integration_client.return_value.get_openapi_spec_for_connection.assert_not_called()
+  mock_openapi_entity_spec_parser.return_value.parse.assert_not_called()
+
+  tools = await toolset.get_tools()
+  await toolset.get_tools()
+
+  mock_connections_client.return_value.get_connection_details_async.assert_awaited_once()
+  mock_integration_client.return_value.get_openapi_spec_for_connection_async.assert_awaited_once_with(
+      "", ""
+  )
+  assert len(tools) == 1
+  assert tools[0].name == "list_issues"
+
+
 def test_initialization_without_required_params(project, location):
   with pytest.raises(
       ValueError,
@@ -410,6 +460,7 @@ def test_initialization_with_service_account_credentials(
       integration=integration_name,
       triggers=triggers,
       service_account_json=service_account_json,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project,
@@ -438,7 +489,11 @@ def test_initialization_without_explicit_service_account_credentials(
   integration_name = "test-integration"
   triggers = "test-trigger"
   toolset = ApplicationIntegrationToolset(
-      project, location, integration=integration_name, triggers=triggers
+      project,
+      location,
+      integration=integration_name,
+      triggers=triggers,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project, location, integration_name, triggers, None, None, None, None
@@ -456,7 +511,11 @@ async def test_get_tools(
   integration_name = "test-integration"
   triggers = ["test-trigger"]
   toolset = ApplicationIntegrationToolset(
-      project, location, integration=integration_name, triggers=triggers
+      project,
+      location,
+      integration=integration_name,
+      triggers=triggers,
+      lazy_load_spec=False,
   )
   tools = await toolset.get_tools()
   assert len(tools) == 1
@@ -486,6 +545,7 @@ def test_initialization_with_connection_details(
       entity_operations=entity_operations_list,
       tool_name_prefix=tool_name,
       tool_instructions=tool_instructions,
+      lazy_load_spec=False,
   )
   mock_integration_client.return_value.get_openapi_spec_for_connection.assert_called_once_with(
       tool_name, tool_instructions
@@ -540,6 +600,7 @@ async def test_init_with_connection_and_custom_auth(
       tool_instructions=tool_instructions,
       auth_scheme=oauth2_scheme,
       auth_credential=auth_credential,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project, location, None, None, connection_name, None, actions_list, None
@@ -609,6 +670,7 @@ async def test_init_with_connection_with_auth_override_disabled_and_custom_auth(
       tool_instructions=tool_instructions,
       auth_scheme=oauth2_scheme,
       auth_credential=auth_credential,
+      lazy_load_spec=False,
   )
   mock_integration_client.assert_called_once_with(
       project, location, None, None, connection_name, None, actions_list, None
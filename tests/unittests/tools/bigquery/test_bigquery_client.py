@@ -17,6 +17,7 @@ import os
 import re
 from unittest import mock
 
+from google.adk.tools.bigquery import client as client_lib
 from google.adk.tools.bigquery.client import get_bigquery_client
 from google.auth.exceptions import DefaultCredentialsError
 from google.oauth2.credentials import Credentials
@@ -127,3 +128,86 @@ def test_bigquery_client_user_agent():
         r"adk-bigquery-tool google-adk/([0-9A-Za-z._\-+/]+)",
         client_info_arg.user_agent,
     )
+
+
+def _user_credentials(refresh_token: str) -> Credentials:
+  return Credentials(
+      token="access-token",
+      refresh_token=refresh_token,
+      client_id="client-id",
+      client_secret="client-secret",
+      token_uri="https://oauth2.googleapis.com/token",
+  )
+
+
+def test_bigquery_client_reused_per_principal_and_project():
+  """Test BigQuery clients are pooled per credentials principal and project."""
+  credentials = _user_credentials("refresh-token")
+  other_credentials = _user_credentials("other-refresh-token")
+
+  with mock.patch.dict(client_lib._client_pool, clear=True):
+    client = get_bigquery_client(
+        project="test-gcp-project", credentials=credentials
+    )
+
+    # OAuth credentials are rebuilt for every tool call.
+    assert (
+        get_bigquery_client(
+            project="test-gcp-project",
+            credentials=_user_credentials("refresh-token"),
+        )
+        is client
+    )
+    assert (
+        get_bigquery_client(
+            project="other-gcp-project", credentials=credentials
+        )
+        is not client
+    )
+    assert (
+        get_bigquery_client(
+            project="test-gcp-project", credentials=other_credentials
+        )
+        is not client
+    )
+
+
+def test_bigquery_client_not_pooled_without_principal():
+  """Test credentials without an identifiable principal are not pooled."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  with mock.patch.dict(client_lib._client_pool, clear=True):
+    client = get_bigquery_client(
+        project="test-gcp-project", credentials=credentials
+    )
+
+    assert (
+        get_bigquery_client(project="test-gcp-project", credentials=credentials)
+        is not client
+    )
+    assert not client_lib._client_pool
+
+
+def test_bigquery_client_pool_is_bounded():
+  """Test the least recently used client is evicted when the pool is full."""
+  credentials = _user_credentials("refresh-token")
+
+  with (
+      mock.patch.dict(client_lib._client_pool, clear=True),
+      mock.patch.object(client_lib, "_CLIENT_POOL_MAX_SIZE", 2),
+  ):
+    first = get_bigquery_client(project="project-1", credentials=credentials)
+    second = get_bigquery_client(project="project-2", credentials=credentials)
+    # Using the first client makes the second one the least recently used.
+    get_bigquery_client(project="project-1", credentials=credentials)
+    get_bigquery_client(project="project-3", credentials=credentials)
+
+    assert len(client_lib._client_pool) == 2
+    assert (
+        get_bigquery_client(project="project-1", credentials=credentials)
+        is first
+    )
+    assert (
+        get_bigquery_client(project="project-2", credentials=credentials)
+        is not second
+    )
@@ -0,0 +1,175 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from unittest import mock
+
+from google.adk.tools.bigquery import metadata_cache
+from google.adk.tools.bigquery import metadata_tool
+from google.adk.tools.bigquery import query_tool
+from google.adk.tools.bigquery.config import BigQueryToolConfig
+from google.adk.tools.bigquery.config import WriteMode
+from google.adk.tools.bigquery.metadata_cache import get_credentials_principal
+from google.adk.tools.bigquery.metadata_cache import MetadataCache
+from google.cloud import bigquery
+from google.oauth2.credentials import Credentials
+import pytest
+
+
+@pytest.fixture
+def cache():
+  """Installs a fresh default metadata cache for the test."""
+  original_cache = metadata_cache.get_default_metadata_cache()
+  cache = MetadataCache()
+  metadata_cache.set_default_metadata_cache(cache)
+  yield cache
+  metadata_cache.set_default_metadata_cache(original_cache)
+
+
+def test_principal_of_user_credentials_is_stable_and_opaque():
+  credentials = Credentials(token="t1", refresh_token="secret")
+  same_user = Credentials(token="t2", refresh_token="secret")
+  other_user = Credentials(token="t1", refresh_token="other-secret")
+
+  principal = get_credentials_principal(credentials)
+
+  assert principal == get_credentials_principal(same_user)
+  assert principal != get_credentials_principal(other_user)
+  assert "secret" not in principal
+
+
+def test_unidentifiable_credentials_bypass_cache():
+  cache = MetadataCache()
+  loader = mock.MagicMock(return_value=["dataset1"])
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  cache.get_or_load(credentials, "my_project", ("datasets",), loader)
+  cache.get_or_load(credentials, "my_project", ("datasets",), loader)
+
+  assert loader.call_count == 2
+
+
+def test_entries_are_scoped_by_principal():
+  cache = MetadataCache()
+  user1 = Credentials(token="t", refresh_token="user1")
+  user2 = Credentials(token="t", refresh_token="user2")
+
+  cache.get_or_load(user1, "my_project", ("datasets",), lambda: ["a"])
+
+  assert cache.get_or_load(user1, "my_project", ("datasets",), list) == ["a"]
+  assert cache.get_or_load(user2, "my_project", ("datasets",), list) == []
+
+
+def test_invalidate_entries_of_principal():
+  cache = MetadataCache()
+  user1 = Credentials(token="t", refresh_token="user1")
+  user2 = Credentials(token="t", refresh_token="user2")
+  loader = mock.MagicMock(return_value=["a"])
+
+  cache.get_or_load(user1, "p1", ("datasets",), loader)
+  cache.get_or_load(user1, "p2", ("datasets",), loader)
+  cache.get_or_load(user2, "p1", ("datasets",), loader)
+  cache.invalidate(credentials=user1)
+  assert loader.call_count == 3
+
+  cache.get_or_load(user1, "p1", ("datasets",), loader)
+  cache.get_or_load(user1, "p2", ("datasets",), loader)
+  cache.get_or_load(user2, "p1", ("datasets",), loader)
+  assert loader.call_count == 5
+
+
+def test_ttl_per_project_and_lru_eviction():
+  cache = MetadataCache(
+      ttl_seconds=0, project_ttl_seconds={"public": 60}, max_entries=2
+  )
+  credentials = Credentials(token="t", refresh_token="user")
+  loader = mock.MagicMock(return_value=["a"])
+
+  cache.get_or_load(credentials, "private", ("datasets",), loader)
+  cache.get_or_load(credentials, "private", ("datasets",), loader)
+  assert loader.call_count == 2
+
+  cache.get_or_load(credentials, "public", ("tables", "d1"), loader)
+  cache.get_or_load(credentials, "public", ("tables", "d2"), loader)
+  cache.get_or_load(credentials, "public", ("tables", "d3"), loader)
+  assert loader.call_count == 5
+  cache.get_or_load(credentials, "public", ("tables", "d3"), loader)
+  assert loader.call_count == 5
+  cache.get_or_load(credentials, "public", ("tables", "d1"), loader)
+  assert loader.call_count == 6
+
+
+@mock.patch("google.cloud.bigquery.Client.get_table", autospec=True)
+@mock.patch("google.cloud.bigquery.Client.list_tables", autospec=True)
+def test_metadata_tools_use_cache(mock_list_tables, mock_get_table, cache):
+  project = "my_project_id"
+  dataset = "my_dataset_id"
+  dataset_ref = bigquery.DatasetReference(project, dataset)
+  credentials = Credentials(token="t", refresh_token="user")
+  mock_list_tables.return_value = [
+      bigquery.TableReference(dataset_ref, "table1"),
+  ]
+  mock_get_table.return_value.to_api_repr.return_value = {"id": "table1"}
+
+  for _ in range(3):
+    assert metadata_tool.list_table_ids(project, dataset, credentials) == [
+        "table1"
+    ]
+    assert metadata_tool.get_table_info(
+        project, dataset, "table1", credentials
+    ) == {"id": "table1"}
+
+  assert mock_list_tables.call_count == 1
+  assert mock_get_table.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("statement_type", "is_invalidated"),
+    [
+        pytest.param("SELECT", False, id="select"),
+        pytest.param("CREATE_TABLE", True, id="ddl"),
+        pytest.param("INSERT", True, id="dml"),
+    ],
+)
+@mock.patch("google.cloud.bigquery.Client.query_and_wait", autospec=True)
+@mock.patch("google.cloud.bigquery.Client.query", autospec=True)
+@mock.patch("google.cloud.bigquery.Client.list_tables", autospec=True)
+def test_write_statements_invalidate_cache(
+    mock_list_tables,
+    mock_query,
+    mock_query_and_wait,
+    statement_type,
+    is_invalidated,
+    cache,
+):
+  project = "my_project_id"
+  dataset = "my_dataset_id"
+  credentials = Credentials(token="t", refresh_token="user")
+  mock_list_tables.return_value = []
+  mock_query.return_value.statement_type = statement_type
+  mock_query_and_wait.return_value = []
+
+  assert metadata_tool.list_table_ids(project, dataset, credentials) == []
+  with mock.patch.dict(query_tool._dry_run_cache, clear=True):
+    result = query_tool.execute_sql(
+        project,
+        "SQL statement",
+        credentials,
+        BigQueryToolConfig(write_mode=WriteMode.ALLOWED),
+    )
+  assert result == {"status": "SUCCESS", "rows": []}
+  metadata_tool.list_table_ids(project, dataset, credentials)
+
+  assert mock_list_tables.call_count == (2 if is_invalidated else 1)
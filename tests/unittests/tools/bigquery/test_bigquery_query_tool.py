@@ -22,6 +22,7 @@ from unittest import mock
 from google.adk.tools import BaseTool
 from google.adk.tools.bigquery import BigQueryCredentialsConfig
 from google.adk.tools.bigquery import BigQueryToolset
+from google.adk.tools.bigquery import query_tool
 from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.bigquery.config import WriteMode
 from google.adk.tools.bigquery.query_tool import execute_sql
@@ -380,3 +381,84 @@ def test_execute_sql_no_default_auth(
   result = execute_sql(project, query, credentials, tool_config)
   assert result == {"status": "SUCCESS", "rows": query_result}
   mock_default_auth.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("tool_config", "expected_rows", "is_truncated"),
+    [
+        pytest.param(
+            BigQueryToolConfig(max_query_result_rows=3),
+            [{"num": 0}, {"num": 1}, {"num": 2}],
+            True,
+            id="row-budget",
+        ),
+        pytest.param(
+            BigQueryToolConfig(
+                max_query_result_rows=10, max_query_result_bytes=25
+            ),
+            [{"num": 0}, {"num": 1}],
+            True,
+            id="byte-budget",
+        ),
+        pytest.param(
+            BigQueryToolConfig(max_query_result_rows=10),
+            [{"num": i} for i in range(5)],
+            False,
+            id="within-budget",
+        ),
+    ],
+)
+def test_execute_sql_result_budget(tool_config, expected_rows, is_truncated):
+  """Test execute_sql stops fetching rows once the result budget is hit."""
+  project = "my_project"
+  query = "SELECT num FROM my_dataset.my_table"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  fetched_rows = []
+
+  def row_iterator():
+    for i in range(5):
+      fetched_rows.append(i)
+      yield {"num": i}
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "SELECT"
+    bq_client.query.return_value = query_job
+    bq_client.query_and_wait.return_value = row_iterator()
+
+    result = execute_sql(project, query, credentials, tool_config)
+
+  assert result["rows"] == expected_rows
+  assert result.get("result_is_likely_truncated", False) == is_truncated
+  assert (
+      bq_client.query_and_wait.call_args.kwargs["max_results"]
+      == tool_config.max_query_result_rows
+  )
+  if is_truncated:
+    assert len(fetched_rows) < 5
+
+
+def test_execute_sql_dry_run_is_cached_per_query():
+  """Test the read-only dry run is done once per project and query text."""
+  project = "my_project"
+  query = "SELECT 1 AS num"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_config = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)
+
+  with (
+      mock.patch.dict(query_tool._dry_run_cache, clear=True),
+      mock.patch("google.cloud.bigquery.Client", autospec=False) as Client,
+  ):
+    bq_client = Client.return_value
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "SELECT"
+    bq_client.query.return_value = query_job
+    bq_client.query_and_wait.return_value = [{"num": 1}]
+
+    execute_sql(project, query, credentials, tool_config)
+    execute_sql(project, query, credentials, tool_config)
+    execute_sql(project, query + " LIMIT 1", credentials, tool_config)
+
+  assert bq_client.query.call_count == 2
+  assert bq_client.query_and_wait.call_count == 3
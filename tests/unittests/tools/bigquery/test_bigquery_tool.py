@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import threading
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -113,6 +114,29 @@ class TestBigQueryTool:
     assert tool.func == sample_function
     assert tool._credentials_manager is None
 
+  @pytest.mark.asyncio
+  async def test_run_async_runs_sync_function_in_worker_thread(
+      self, mock_tool_context
+  ):
+    """Test synchronous tool functions do not run on the event loop thread."""
+
+    def sync_func(param1: str) -> dict:
+      """Sample function that records the thread it runs on."""
+      return {"param1": param1, "thread": threading.get_ident()}
+
+    tool = BigQueryTool(func=sync_func, credentials_config=None)
+
+    result = await tool.run_async(
+        args={"param1": "test_value"}, tool_context=mock_tool_context
+    )
+    missing_args_result = await tool.run_async(
+        args={}, tool_context=mock_tool_context
+    )
+
+    assert result["param1"] == "test_value"
+    assert result["thread"] != threading.get_ident()
+    assert "param1" in missing_args_result["error"]
+
   @pytest.mark.asyncio
   async def test_run_async_with_valid_credentials(
       self, sample_function, credentials_config, mock_tool_context
@@ -213,6 +237,25 @@ class TestBigQueryTool:
       assert result["result"] == "Async success with test_value"
       assert result["authenticated"] is True
 
+  @pytest.mark.asyncio
+  async def test_run_async_with_async_callable_object(self, mock_tool_context):
+    """Test callable objects with an async __call__ are awaited directly."""
+
+    class AsyncCallable:
+
+      async def __call__(self, param1: str) -> dict:
+        """Sample callable that records the thread it runs on."""
+        return {"param1": param1, "thread": threading.get_ident()}
+
+    tool = BigQueryTool(func=AsyncCallable(), credentials_config=None)
+
+    result = await tool.run_async(
+        args={"param1": "test_value"}, tool_context=mock_tool_context
+    )
+
+    assert result["param1"] == "test_value"
+    assert result["thread"] == threading.get_ident()
+
   @pytest.mark.asyncio
   async def test_run_async_exception_handling(
       self, credentials_config, mock_tool_context
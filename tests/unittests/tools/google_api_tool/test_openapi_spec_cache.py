@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import os
+import threading
+from unittest.mock import MagicMock
+
+from google.adk.tools.google_api_tool.google_api_toolset import GoogleApiToolset
+from google.adk.tools.google_api_tool.openapi_spec_cache import OpenApiSpecCache
+import pytest
+
+_BUILD_PATH = (
+    "google.adk.tools.google_api_tool.googleapi_to_openapi_converter.build"
+)
+
+
+def _discovery_doc(etag: str):
+  return {
+      "name": "calendar",
+      "version": "v3",
+      "title": "Google Calendar API",
+      "etag": etag,
+      "rootUrl": "https://www.googleapis.com/",
+      "servicePath": "calendar/v3/",
+      "auth": {
+          "oauth2": {
+              "scopes": {
+                  "https://www.googleapis.com/auth/calendar": {
+                      "description": "Full access to Google Calendar"
+                  }
+              }
+          }
+      },
+      "resources": {
+          "calendars": {
+              "methods": {
+                  "get": {
+                      "id": "calendar.calendars.get",
+                      "path": "calendars/{calendarId}",
+                      "httpMethod": "GET",
+                      "parameters": {
+                          "calendarId": {
+                              "type": "string",
+                              "location": "path",
+                              "required": True,
+                          }
+                      },
+                  }
+              }
+          }
+      },
+  }
+
+
+@pytest.fixture
+def mock_build(monkeypatch):
+  resource = MagicMock()
+  resource._rootDesc = _discovery_doc("etag-1")
+  build = MagicMock(return_value=resource)
+  monkeypatch.setattr(_BUILD_PATH, build)
+  return build
+
+
+def test_get_spec_converts_once_and_persists(tmp_path, mock_build):
+  cache = OpenApiSpecCache(cache_dir=str(tmp_path))
+
+  spec = cache.get_spec("calendar", "v3")
+  spec["paths"].clear()
+  spec_again = cache.get_spec("calendar", "v3")
+
+  assert mock_build.call_count == 1
+  assert "/calendars/{calendarId}" in spec_again["paths"]
+  with open(tmp_path / "calendar_v3.json", encoding="utf-8") as f:
+    entry = json.load(f)
+  assert entry["etag"] == "etag-1"
+  assert entry["spec"] == spec_again
+
+
+def test_get_spec_loads_from_disk_in_new_process(tmp_path, mock_build):
+  OpenApiSpecCache(cache_dir=str(tmp_path)).get_spec("calendar", "v3")
+
+  spec = OpenApiSpecCache(cache_dir=str(tmp_path)).get_spec("calendar", "v3")
+
+  assert mock_build.call_count == 1
+  assert spec["info"]["title"] == "Google Calendar API"
+
+
+def test_expired_entry_with_same_etag_skips_conversion(
+    tmp_path, mock_build, monkeypatch
+):
+  OpenApiSpecCache(cache_dir=str(tmp_path)).get_spec("calendar", "v3")
+  convert = MagicMock()
+  monkeypatch.setattr(
+      "google.adk.tools.google_api_tool.googleapi_to_openapi_converter."
+      "GoogleApiToOpenApiConverter.convert",
+      convert,
+  )
+
+  spec = OpenApiSpecCache(cache_dir=str(tmp_path), ttl_seconds=0).get_spec(
+      "calendar", "v3"
+  )
+
+  assert mock_build.call_count == 2
+  convert.assert_not_called()
+  assert spec["info"]["title"] == "Google Calendar API"
+
+
+def test_expired_entry_with_new_etag_is_reconverted(tmp_path, mock_build):
+  OpenApiSpecCache(cache_dir=str(tmp_path)).get_spec("calendar", "v3")
+  new_doc = _discovery_doc("etag-2")
+  new_doc["title"] = "Google Calendar API v2"
+  mock_build.return_value._rootDesc = new_doc
+
+  spec = OpenApiSpecCache(cache_dir=str(tmp_path), ttl_seconds=0).get_spec(
+      "calendar", "v3"
+  )
+
+  assert spec["info"]["title"] == "Google Calendar API v2"
+
+
+def test_fetch_failure_falls_back_to_stale_entry(tmp_path, mock_build):
+  OpenApiSpecCache(cache_dir=str(tmp_path)).get_spec("calendar", "v3")
+  mock_build.side_effect = ConnectionError("offline")
+
+  spec = OpenApiSpecCache(cache_dir=str(tmp_path), ttl_seconds=0).get_spec(
+      "calendar", "v3"
+  )
+
+  assert spec["info"]["title"] == "Google Calendar API"
+
+
+def test_offline_uses_snapshot(tmp_path, mock_build):
+  snapshot_dir = tmp_path / "snapshots"
+  snapshot_dir.mkdir()
+  snapshot = {"openapi": "3.0.0", "info": {"title": "Snapshot"}, "paths": {}}
+  (snapshot_dir / "calendar_v3.json").write_text(json.dumps(snapshot))
+  cache = OpenApiSpecCache(
+      cache_dir="", snapshot_dir=str(snapshot_dir), offline=True
+  )
+
+  assert cache.get_spec("calendar", "v3") == snapshot
+  mock_build.assert_not_called()
+
+
+def test_failed_write_removes_temp_file(tmp_path):
+  cache = OpenApiSpecCache(cache_dir=str(tmp_path))
+
+  cache._write_entry(
+      os.path.join(str(tmp_path), "calendar_v3.json"), {"spec": object()}
+  )
+
+  assert os.listdir(tmp_path) == []
+
+
+def test_offline_without_snapshot_raises(tmp_path, mock_build):
+  cache = OpenApiSpecCache(cache_dir=str(tmp_path), offline=True)
+
+  with pytest.raises(ValueError):
+    cache.get_spec("calendar", "v3")
+
+
+@pytest.mark.asyncio
+async def test_toolset_loads_spec_lazily(tmp_path, mock_build):
+  toolset = GoogleApiToolset(
+      "calendar",
+      "v3",
+      spec_cache=OpenApiSpecCache(cache_dir=str(tmp_path)),
+  )
+  mock_build.assert_not_called()
+
+  tools = await toolset.get_tools()
+  await toolset.get_tools()
+
+  assert mock_build.call_count == 1
+  assert [tool.name for tool in tools] == ["calendar_calendars_get"]
+
+
+@pytest.mark.asyncio
+async def test_toolsets_load_spec_once_off_the_event_loop(tmp_path, mock_build):
+  build_threads = []
+  resource = mock_build.return_value
+
+  def record_thread(*args, **kwargs):
+    build_threads.append(threading.get_ident())
+    return resource
+
+  mock_build.side_effect = record_thread
+  spec_cache = OpenApiSpecCache(cache_dir=str(tmp_path))
+  toolsets = [
+      GoogleApiToolset("calendar", "v3", spec_cache=spec_cache)
+      for _ in range(3)
+  ]
+
+  results = await asyncio.gather(*[toolset.get_tools() for toolset in toolsets])
+
+  assert mock_build.call_count == 1
+  assert build_threads != [threading.get_ident()]
+  assert [[tool.name for tool in tools] for tools in results] == [
+      ["calendar_calendars_get"]
+  ] * 3
@@ -0,0 +1,190 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from pathlib import Path
+from typing import List
+
+from google.adk.tools.retrieval.files_retrieval import FilesRetrieval
+from llama_index.core import Settings
+from llama_index.core import StorageContext
+from llama_index.core.embeddings import MockEmbedding
+import pytest
+
+
+class _CountingEmbedding(MockEmbedding):
+  embedded_texts: List[str] = []
+
+  def _get_text_embedding(self, text: str) -> List[float]:
+    self.embedded_texts.append(text)
+    return super()._get_text_embedding(text)
+
+  def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+    return [self._get_text_embedding(text) for text in texts]
+
+
+@pytest.fixture
+def embed_model(monkeypatch):
+  model = _CountingEmbedding(embed_dim=8, embedded_texts=[])
+  monkeypatch.setattr(Settings, "_embed_model", model)
+  return model
+
+
+@pytest.fixture(autouse=True)
+def index_cache_dir(tmp_path, monkeypatch):
+  cache_dir = tmp_path / "index_cache"
+  monkeypatch.setenv("ADK_FILES_RETRIEVAL_INDEX_DIR", str(cache_dir))
+  return cache_dir
+
+
+@pytest.fixture
+def corpus(tmp_path):
+  corpus_dir = tmp_path / "corpus"
+  corpus_dir.mkdir()
+  (corpus_dir / "a.txt").write_text("apples are red")
+  (corpus_dir / "b.txt").write_text("bananas are yellow")
+  return corpus_dir
+
+
+def _create(corpus, **kwargs) -> FilesRetrieval:
+  return FilesRetrieval(
+      name="files", description="files", input_dir=str(corpus), **kwargs
+  )
+
+
+def _indexed_texts(retrieval: FilesRetrieval) -> List[str]:
+  return sorted(
+      node.get_content() for node in retrieval._index.docstore.docs.values()
+  )
+
+
+def test_index_is_persisted_and_reloaded_without_embedding(
+    corpus, embed_model, index_cache_dir
+):
+  _create(corpus)
+  assert len(embed_model.embedded_texts) == 2
+  # The index is persisted outside of the corpus.
+  assert sorted(os.listdir(corpus)) == ["a.txt", "b.txt"]
+  assert len(os.listdir(index_cache_dir)) == 1
+
+  embed_model.embedded_texts.clear()
+  retrieval = _create(corpus)
+
+  assert embed_model.embedded_texts == []
+  assert _indexed_texts(retrieval) == ["apples are red", "bananas are yellow"]
+
+
+def test_only_changed_files_are_reembedded_on_startup(corpus, embed_model):
+  _create(corpus)
+  embed_model.embedded_texts.clear()
+  (corpus / "a.txt").write_text("apricots are orange")
+  (corpus / "b.txt").unlink()
+  (corpus / "c.txt").write_text("cherries are dark red")
+
+  retrieval = _create(corpus)
+
+  # Embedded texts are prefixed with the node metadata.
+  assert sorted(
+      text.rsplit("\n", 1)[-1] for text in embed_model.embedded_texts
+  ) == ["apricots are orange", "cherries are dark red"]
+  assert _indexed_texts(retrieval) == [
+      "apricots are orange",
+      "cherries are dark red",
+  ]
+
+
+@pytest.mark.parametrize(
+    "other_embed_model_kwargs",
+    [dict(embed_dim=16), dict(model_name="other", embed_dim=8)],
+)
+def test_index_is_rebuilt_for_other_embed_model(
+    corpus, embed_model, other_embed_model_kwargs, monkeypatch
+):
+  _create(corpus)
+  other_embed_model = _CountingEmbedding(
+      **other_embed_model_kwargs, embedded_texts=[]
+  )
+  monkeypatch.setattr(Settings, "_embed_model", other_embed_model)
+
+  retrieval = _create(corpus)
+
+  assert len(other_embed_model.embedded_texts) == 2
+  assert _indexed_texts(retrieval) == ["apples are red", "bananas are yellow"]
+
+  other_embed_model.embedded_texts.clear()
+  _create(corpus)
+
+  assert other_embed_model.embedded_texts == []
+
+
+def test_touched_file_with_same_content_is_not_reembedded(corpus, embed_model):
+  _create(corpus)
+  embed_model.embedded_texts.clear()
+  stat = os.stat(corpus / "a.txt")
+  os.utime(corpus / "a.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+  _create(corpus)
+
+  assert embed_model.embedded_texts == []
+
+
+def test_failed_persist_keeps_the_persisted_index(
+    corpus, embed_model, monkeypatch
+):
+  retrieval = _create(corpus)
+  persist_dir = retrieval.persist_dir
+  persisted = {
+      name: (Path(persist_dir) / name).read_bytes()
+      for name in os.listdir(persist_dir)
+  }
+
+  def fail_persist(self, persist_dir, **kwargs):
+    (Path(persist_dir) / "docstore.json").write_text("partial")
+    raise OSError("disk full")
+
+  monkeypatch.setattr(StorageContext, "persist", fail_persist)
+  (corpus / "c.txt").write_text("cherries are dark red")
+  assert retrieval.refresh()
+
+  assert {
+      name: (Path(persist_dir) / name).read_bytes()
+      for name in os.listdir(persist_dir)
+  } == persisted
+
+
+def test_refresh_swaps_retriever(corpus, embed_model):
+  retrieval = _create(corpus)
+  old_retriever = retrieval.retriever
+
+  assert not retrieval.refresh()
+  assert retrieval.retriever is old_retriever
+
+  (corpus / "c.txt").write_text("cherries are dark red")
+  assert retrieval.refresh()
+
+  assert retrieval.retriever is not old_retriever
+  assert "cherries are dark red" in _indexed_texts(retrieval)
+
+
+@pytest.mark.asyncio
+async def test_refresh_async_in_memory_index(
+    corpus, embed_model, index_cache_dir
+):
+  retrieval = _create(corpus, persist_dir="")
+  (corpus / "b.txt").unlink()
+
+  assert await retrieval.refresh_async()
+
+  assert not os.path.exists(index_cache_dir)
+  assert _indexed_texts(retrieval) == ["apples are red"]
@@ -156,6 +156,42 @@ def test_update_artifacts():
   }
 
 
+def test_runner_reused_across_calls():
+  """Calls share the tool's runner, each in a session of its own."""
+
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          function_call_no_schema,
+          'response1',
+          'response2',
+          function_call_no_schema,
+          'response3',
+          'response4',
+      ]
+  )
+  tool_agent = Agent(
+      name='tool_agent',
+      model=mock_model,
+      before_agent_callback=change_state_callback,
+  )
+  agent_tool = AgentTool(agent=tool_agent)
+  root_agent = Agent(
+      name='root_agent',
+      model=mock_model,
+      tools=[agent_tool],
+  )
+
+  runner = testing_utils.InMemoryRunner(root_agent)
+  runner.run('test1')
+  tool_runner = agent_tool._runner
+  runner.run('test2')
+
+  assert agent_tool._runner is tool_runner
+  # The sessions of the calls are gone once they are done.
+  assert not tool_runner.session_service._sessions
+  assert runner.session.state['state_1'] == 'changed_value'
+
+
 @mark.parametrize(
     'env_variables',
     [
@@ -0,0 +1,135 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.agents import Agent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.models.llm_request import LlmRequest
+from google.adk.tools.load_artifacts_tool import LoadArtifactsTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+async def _create_tool_context() -> ToolContext:
+  agent = Agent(name='agent', model=testing_utils.MockModel.create([]))
+  invocation_context = await testing_utils.create_invocation_context(agent)
+  return ToolContext(invocation_context)
+
+
+def _function_response_request(artifact_names: list[str]) -> LlmRequest:
+  return LlmRequest(
+      contents=[
+          types.Content(
+              role='user',
+              parts=[
+                  types.Part.from_function_response(
+                      name='load_artifacts',
+                      response={'artifact_names': artifact_names},
+                  )
+              ],
+          )
+      ]
+  )
+
+
+@pytest.mark.asyncio
+async def test_artifact_list_is_cached_for_the_invocation():
+  tool_context = await _create_tool_context()
+  await tool_context.save_artifact(
+      'a.txt', types.Part.from_bytes(data=b'a', mime_type='text/plain')
+  )
+  tool = LoadArtifactsTool()
+
+  with mock.patch.object(
+      InMemoryArtifactService,
+      'list_artifact_keys',
+      autospec=True,
+      side_effect=InMemoryArtifactService.list_artifact_keys,
+  ) as list_artifact_keys:
+    for _ in range(3):
+      llm_request = LlmRequest()
+      await tool.process_llm_request(
+          tool_context=tool_context, llm_request=llm_request
+      )
+
+  assert list_artifact_keys.call_count == 1
+  assert '["a.txt"]' in llm_request.config.system_instruction
+
+
+@pytest.mark.asyncio
+async def test_artifact_delta_invalidates_manifest():
+  tool_context = await _create_tool_context()
+  invocation_context = tool_context._invocation_context
+  manifest = invocation_context.artifact_manifest
+  text_v0 = types.Part.from_bytes(data=b'v0', mime_type='text/plain')
+  text_v1 = types.Part.from_bytes(data=b'v1', mime_type='text/plain')
+  await tool_context.save_artifact('a.txt', text_v0)
+
+  assert await manifest.list_artifact_keys(invocation_context) == ['a.txt']
+  assert await manifest.load_artifact(invocation_context, 'a.txt') == text_v0
+
+  # An artifact saved outside the contexts and reported through an event.
+  version = await invocation_context.artifact_service.save_artifact(
+      app_name=invocation_context.app_name,
+      user_id=invocation_context.user_id,
+      session_id=invocation_context.session.id,
+      filename='b.txt',
+      artifact=text_v1,
+  )
+  await invocation_context.artifact_service.save_artifact(
+      app_name=invocation_context.app_name,
+      user_id=invocation_context.user_id,
+      session_id=invocation_context.session.id,
+      filename='a.txt',
+      artifact=text_v1,
+  )
+  invocation_context.session.events.append(
+      Event(
+          author='agent',
+          actions=EventActions(artifact_delta={'a.txt': 1, 'b.txt': version}),
+      )
+  )
+
+  assert await manifest.list_artifact_keys(invocation_context) == [
+      'a.txt',
+      'b.txt',
+  ]
+  assert await manifest.load_artifact(invocation_context, 'a.txt') == text_v1
+
+
+@pytest.mark.asyncio
+async def test_requested_artifacts_are_loaded_and_large_ones_described():
+  tool_context = await _create_tool_context()
+  small = types.Part.from_bytes(data=b'small', mime_type='text/plain')
+  large = types.Part.from_bytes(data=b'x' * 100, mime_type='image/png')
+  await tool_context.save_artifact('small.txt', small)
+  await tool_context.save_artifact('large.png', large)
+  llm_request = _function_response_request(['small.txt', 'large.png'])
+
+  await LoadArtifactsTool(max_inline_bytes=10).process_llm_request(
+      tool_context=tool_context, llm_request=llm_request
+  )
+
+  small_content, large_content = llm_request.contents[1:]
+  assert small_content.parts[1] == small
+  assert large_content.parts[1].text == (
+      '<Artifact large.png of type image/png and size 100 bytes is too large'
+      ' to be included.>'
+  )